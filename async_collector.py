@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Async Category Collector
+========================
+Fetches every skill-category search, and every result page of each, at
+the same time on one asyncio event loop, so a full collection takes
+roughly as long as the slowest page chain instead of the sum of all
+category latencies.
+
+A semaphore caps in-flight requests, a token bucket enforces a
+per-host request rate, and each page is folded straight into a
+``MarketAggregator`` (and optionally a ListingStoreBuilder) as soon as it
+arrives — no page list is kept. Speaks the same protocol as
+``ingestion.HttpJobSearchClient`` / ``fake_dice_server.py`` over plain
+asyncio streams with keep-alive connections.
+
+Usage:
+    python3 async_collector.py [--latency 0.1] [--concurrency 16] [--rate 0]
+        Runs the collector against a local stub server that injects latency
+        and compares it with a serial fetch.
+"""
+
+import asyncio
+import json
+import math
+import random
+import time
+import urllib.parse
+
+from ingestion import IngestionError, ingest_chunk, record_salaries, retry_delay
+from salary_aggregator import DEFAULT_ERROR, MarketAggregator
+
+
+class RateLimiter:
+    """Token bucket: at most ``rate`` acquisitions per second, bursts up to ``burst``."""
+
+    def __init__(self, rate: float, burst: int | None = None):
+        self.rate = rate
+        self.capacity = burst or max(1, math.ceil(rate))
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class AsyncHttpClient:
+    """Minimal HTTP/1.1 JSON GET client with pooled keep-alive connections."""
+
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+    def __init__(self, base_url: str, concurrency: int = 16, rate_limit: float | None = None,
+                 max_retries: int = 4, backoff: float = 0.25, timeout: float = 30.0):
+        parts = urllib.parse.urlsplit(base_url)
+        if parts.scheme != "http":
+            raise IngestionError(f"AsyncHttpClient supports plain http only, got {base_url}")
+        self.host, self.port = parts.hostname, parts.port or 80
+        self.base_path = parts.path.rstrip("/")
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._limiter = RateLimiter(rate_limit) if rate_limit else None
+        self._idle: list[tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self.requests_sent = 0
+
+    async def close(self):
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
+
+    async def _request(self, target: str) -> tuple[int, dict, bytes]:
+        if self._idle:
+            reader, writer = self._idle.pop()
+        else:
+            reader, writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            writer.write(f"GET {target} HTTP/1.1\r\nHost: {self.host}:{self.port}\r\n"
+                         f"Accept: application/json\r\nConnection: keep-alive\r\n\r\n".encode())
+            await writer.drain()
+            status_line = await reader.readline()
+            if not status_line:
+                raise ConnectionError("connection closed by server")
+            status = int(status_line.split()[1])
+            headers = {}
+            while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                key, _, value = line.decode("latin-1").partition(":")
+                headers[key.strip().lower()] = value.strip()
+            if headers.get("transfer-encoding", "").lower() == "chunked":
+                body = b""
+                while size := int((await reader.readline()).strip() or b"0", 16):
+                    body += await reader.readexactly(size)
+                    await reader.readline()
+                await reader.readline()
+            else:
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+        except BaseException:
+            writer.close()
+            raise
+        if headers.get("connection", "").lower() == "close":
+            writer.close()
+        else:
+            self._idle.append((reader, writer))
+        return status, headers, body
+
+    async def get_json(self, path: str, params: dict | None = None):
+        target = f"{self.base_path}{path}"
+        if params:
+            target += "?" + urllib.parse.urlencode(params)
+        for attempt in range(self.max_retries + 1):
+            retry_after = None
+            async with self._semaphore:
+                if self._limiter:
+                    await self._limiter.acquire()
+                try:
+                    status, headers, body = await asyncio.wait_for(self._request(target), self.timeout)
+                    self.requests_sent += 1
+                    if status == 200:
+                        return json.loads(body)
+                    if status not in self.RETRY_STATUSES:
+                        raise IngestionError(f"GET {target} → HTTP {status}")
+                    error = f"HTTP {status}"
+                    retry_after = headers.get("retry-after")
+                except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError) as e:
+                    error = repr(e)
+            if attempt == self.max_retries:
+                raise IngestionError(f"GET {target} failed after {attempt + 1} attempts: {error}")
+            delay = retry_delay(retry_after, self.backoff * 2 ** attempt)
+            await asyncio.sleep(delay * (1 + random.random() * 0.25))
+
+
+class AsyncCategoryCollector:
+    """Collect all categories and pages concurrently, streaming into aggregators."""
+
+    def __init__(self, base_url: str, concurrency: int = 16, rate_limit: float | None = None,
+                 page_size: int = 100, error: float = DEFAULT_ERROR, builder=None, **client_kw):
+        self.base_url = base_url
+        self.concurrency = concurrency
+        self.rate_limit = rate_limit
+        self.page_size = page_size
+        self.client_kw = client_kw
+        self.aggregator = MarketAggregator(error)
+        self.builder = builder  # optional ListingStoreBuilder to also keep the rows
+        self.totals: dict[str, int] = {}
+        self.pages_fetched = 0
+
+    def _fold(self, category: str, records: list[dict]):
+        self.pages_fetched += 1
+        if not records:
+            return
+        lows, highs, local = record_salaries(records)
+        agg = self.aggregator
+        agg.market.add_many(lows, highs)
+        agg.nashville.add_many(lows[local], highs[local])
+        agg.category(category).add_many(lows, highs)
+        if self.builder is not None:
+            ingest_chunk(self.builder, [{**rec, "category": category} for rec in records])
+
+    async def _page(self, client: AsyncHttpClient, category: str, page: int) -> dict:
+        payload = await client.get_json("/v1/jobs/search",
+                                        {"q": category, "page": page, "page_size": self.page_size})
+        self._fold(category, payload["results"])
+        return payload
+
+    async def _category(self, client: AsyncHttpClient, category: str):
+        first = await self._page(client, category, 1)
+        self.totals[category] = first["total"]
+        if self.builder is not None:
+            self.builder.add_category(category, first["total"])
+        pages = math.ceil(first["total"] / self.page_size)
+        await asyncio.gather(*(self._page(client, category, p) for p in range(2, pages + 1)))
+
+    async def collect(self, categories) -> MarketAggregator:
+        client = AsyncHttpClient(self.base_url, self.concurrency, self.rate_limit, **self.client_kw)
+        try:
+            await asyncio.gather(*(self._category(client, name) for name in categories))
+        finally:
+            await client.close()
+        return self.aggregator
+
+
+def collect_market(base_url: str, categories, **kwargs) -> AsyncCategoryCollector:
+    """Blocking wrapper: run the collector to completion and return it."""
+    collector = AsyncCategoryCollector(base_url, **kwargs)
+    asyncio.run(collector.collect(categories))
+    return collector
+
+
+# ── MAIN ──
+
+if __name__ == "__main__":
+    import argparse
+
+    from fake_dice_server import FakeDiceServer
+    from ingestion import HttpJobSearchClient, JobSearchSource, records_from_market_searches
+    from nashville_market_analysis import market_searches
+
+    parser = argparse.ArgumentParser(description="Concurrent category fetch against a latency-injecting stub.")
+    parser.add_argument("--latency", type=float, default=0.1, help="seconds added per response")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--rate", type=float, default=0.0, help="per-host requests/second (0 = unlimited)")
+    parser.add_argument("--page-size", type=int, default=5)
+    args = parser.parse_args()
+
+    records = list(records_from_market_searches(market_searches))
+    with FakeDiceServer(records, latency=args.latency) as server:
+        start = time.perf_counter()
+        serial = HttpJobSearchClient(server.url, pool_size=1)
+        for name in market_searches:
+            JobSearchSource.search_all(serial, name, args.page_size)
+        serial.close()
+        serial_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        collector = collect_market(server.url, market_searches, concurrency=args.concurrency,
+                                   rate_limit=args.rate or None, page_size=args.page_size)
+        async_s = time.perf_counter() - start
+
+    stats = collector.aggregator.summary()["market_stats"]
+    print(f"  serial: {serial_s:6.2f}s   async: {async_s:6.2f}s   "
+          f"({collector.pages_fetched} pages, {len(market_searches)} categories)")
+    print(f"  median range: ${stats['median_low']:,} – ${stats['median_high']:,}  "
+          f"from {stats['sample_count']} salaries")
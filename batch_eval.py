@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Batch Candidate Evaluation
+==========================
+Scores many candidate profiles against one shared market model instead of
+running the single-``candidate`` analysis once per person.
+
+``MarketModel`` is built once from an ``AnalysisContext``. It holds the
+sorted salary midpoints per market, the reference midpoints used by
+``value_proposition`` and the title term index. Candidates are evaluated a
+chunk at a time:
+
+* discounts against both references, as one array expression;
+* percentile of each ask within its target market, via ``searchsorted``;
+* matching openings: the union of the term-index posting lists of the
+  candidate's skills, intersected with the target market's rows. Each
+  distinct skill string is looked up once per model. Candidates sharing a
+  skill set and market share one sorted array of posted highs, and the
+  openings paying at least each ask are counted with ``searchsorted``.
+  Work is proportional to the matching postings; no candidate × posting
+  matrix is ever built.
+
+Chunks fan out over a process pool. Each worker receives the model once
+through the pool initializer, not with every chunk. Duplicate postings
+(see ``dedup``) are not counted.
+
+A candidate is a dict with ``name``, ``asking_salary``, ``skills`` (a list,
+or one ``;``-separated string as in CSV; ``core_skills`` as in the
+``candidate`` dict also works) and ``target_market``. A target
+market naming Nashville selects the Nashville-local openings; any other
+value selects all of them.
+
+Usage:
+    python3 batch_eval.py candidates.jsonl [-o results.jsonl] [-j 4]
+"""
+
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from term_index import TermIndex
+
+MARKETS = ("national", "nashville")
+DEFAULT_CHUNK = 512
+
+_SKILL_PARTS = re.compile(r"[/,&()]")
+
+
+def market_of(target: str) -> str:
+    return "nashville" if "nashville" in (target or "").lower() else "national"
+
+
+def skill_phrases(skill: str, aliases: dict | None = None) -> tuple[str, ...]:
+    """Title phrases for a free-text skill: its alias entry, else its ``/``-, ``,``-, ``&``-separated parts."""
+    for name, phrases in (aliases or {}).items():
+        if name.lower() == skill.strip().lower():
+            return tuple(phrases)
+    return tuple(p.strip() for p in _SKILL_PARTS.split(skill) if p.strip())
+
+
+def _skills_list(skills) -> list[str]:
+    if isinstance(skills, str):
+        return [s.strip() for s in skills.split(";") if s.strip()]
+    return list(skills or [])
+
+
+class MarketModel:
+    """The precomputed market every candidate is compared with."""
+
+    def __init__(self, index: TermIndex, salary_low: np.ndarray, salary_high: np.ndarray,
+                 is_local: np.ndarray, counted: np.ndarray, market_median_mid: float,
+                 nashville_avg_mid: float, aliases: dict | None = None):
+        self.index = index
+        self.salary_high = salary_high
+        self.market_median_mid = market_median_mid
+        self.nashville_avg_mid = nashville_avg_mid
+        self.aliases = aliases or {}
+        mid = (salary_low + salary_high) / 2
+        self.rows = {"national": counted, "nashville": counted & is_local}
+        self._skill_rows: dict[str, np.ndarray] = {}
+        self.sorted_mid = {m: np.sort(mid[rows & ~np.isnan(mid)]) for m, rows in self.rows.items()}
+
+    @classmethod
+    def from_context(cls, ctx) -> "MarketModel":
+        from nashville_market_analysis import SKILL_TERMS
+
+        store, value = ctx.store, ctx.value_proposition
+        return cls(ctx.term_index, store.salary_low, store.salary_high, store.is_local,
+                   ctx.duplicates.keep, value["market_median_midpoint"],
+                   value["nashville_avg_midpoint"], SKILL_TERMS)
+
+    def skill_rows(self, skill: str) -> np.ndarray:
+        """Sorted rows whose indexed text mentions ``skill`` (memoized per skill string)."""
+        rows = self._skill_rows.get(skill)
+        if rows is None:
+            rows = self._skill_rows[skill] = self.index.any_of(*skill_phrases(skill, self.aliases))
+        return rows
+
+    def matching_highs(self, skills: tuple[str, ...], market: str) -> tuple[int, np.ndarray]:
+        """(matching openings, their sorted posted highs without DOE) for one skill set."""
+        lists = [self.skill_rows(s) for s in skills]
+        rows = np.unique(np.concatenate(lists)) if lists else np.zeros(0, dtype=np.uint32)
+        rows = rows[self.rows[market][rows]]
+        highs = self.salary_high[rows]
+        return len(rows), np.sort(highs[~np.isnan(highs)])
+
+    def evaluate(self, candidates: list[dict]) -> list[dict]:
+        """One result record per candidate, in input order."""
+        n = len(candidates)
+        asking = np.array([float(c["asking_salary"]) for c in candidates])
+        markets = np.array([market_of(c.get("target_market", "")) for c in candidates])
+        skill_lists = [_skills_list(c.get("skills", c.get("core_skills"))) for c in candidates]
+
+        discount_national = np.round((self.market_median_mid - asking) / self.market_median_mid * 100, 1)
+        discount_nashville = np.round((self.nashville_avg_mid - asking) / self.nashville_avg_mid * 100, 1)
+
+        percentile = np.zeros(n)
+        for m in MARKETS:
+            sel = markets == m
+            mids = self.sorted_mid[m]
+            if sel.any() and mids.size:
+                percentile[sel] = np.searchsorted(mids, asking[sel], side="right") / mids.size * 100
+
+        # Candidates with the same skill set and market share one lookup and one sorted array.
+        groups: dict[tuple, list[int]] = {}
+        for i, skills in enumerate(skill_lists):
+            groups.setdefault((tuple(sorted(set(skills))), str(markets[i])), []).append(i)
+        n_matching = np.zeros(n, dtype=np.int64)
+        n_above = np.zeros(n, dtype=np.int64)
+        for (skills, market), members in groups.items():
+            count, highs = self.matching_highs(skills, market)
+            n_matching[members] = count
+            # Highs at or above the ask; DOE (NaN) postings were dropped.
+            n_above[members] = highs.size - np.searchsorted(highs, asking[members], side="left")
+
+        return [{
+            "name": c.get("name", ""),
+            "asking_salary": int(asking[i]),
+            "target_market": c.get("target_market", ""),
+            "market": str(markets[i]),
+            "discount_pct_vs_national": float(discount_national[i]),
+            "discount_pct_vs_nashville": float(discount_nashville[i]),
+            "market_percentile": round(float(percentile[i]), 1),
+            "matching_openings": int(n_matching[i]),
+            "matching_openings_above_ask": int(n_above[i]),
+        } for i, c in enumerate(candidates)]
+
+
+_worker_model: MarketModel | None = None
+
+
+def _init_worker(model: MarketModel):
+    global _worker_model
+    _worker_model = model
+
+
+def _evaluate_chunk(chunk: list[dict]) -> list[dict]:
+    return _worker_model.evaluate(chunk)
+
+
+def evaluate_candidates(model: MarketModel, candidates, jobs: int = 1,
+                        chunk_size: int = DEFAULT_CHUNK):
+    """Yield result records for ``candidates`` (any iterable), in input order.
+
+    With ``jobs`` > 1 chunks are evaluated in a process pool; at most
+    ``2 * jobs`` chunks are in flight, so the input can be streamed.
+    """
+    def chunks():
+        chunk = []
+        for cand in candidates:
+            chunk.append(cand)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    if jobs <= 1:
+        for chunk in chunks():
+            yield from model.evaluate(chunk)
+        return
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(model,)) as pool:
+        pending = []
+        for chunk in chunks():
+            pending.append(pool.submit(_evaluate_chunk, chunk))
+            if len(pending) >= 2 * jobs:
+                yield from pending.pop(0).result()
+        for future in pending:
+            yield from future.result()
+
+
+# ── MAIN ──
+
+if __name__ == "__main__":
+    import argparse
+    import os
+    import sys
+    import time
+
+    from ingestion import read_records, write_jsonl
+    from nashville_market_analysis import CACHE_DIR, AnalysisContext
+
+    parser = argparse.ArgumentParser(description="Score candidate profiles against the market.")
+    parser.add_argument("candidates", help="JSONL or CSV file of candidates (optionally .gz)")
+    parser.add_argument("-o", "--output", help="JSONL output path (default: stdout)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK)
+    args = parser.parse_args()
+
+    model = MarketModel.from_context(AnalysisContext(cache_dir=CACHE_DIR))
+    start = time.perf_counter()
+    results = evaluate_candidates(model, read_records(args.candidates), args.jobs, args.chunk_size)
+    n = write_jsonl(results, args.output or sys.stdout)
+    print(f"✅ Evaluated {n:,} candidates in {time.perf_counter() - start:.2f}s", file=sys.stderr)
@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+Benchmark Suite
+===============
+Times the analysis, report and chart hot paths on synthetic markets of
+several sizes. It records wall time, peak RSS and peak traced allocations,
+and compares them with a stored baseline, so optimizations can be
+measured and regressions caught.
+
+Benchmarks (``BENCHMARKS``):
+
+* ``analysis`` — a cold ``AnalysisContext`` up to ``json_data()``:
+  store, dedup, term index, skill matrix and every derived result;
+* ``compute_salary_stats``, ``compute_nashville_salary_stats`` and
+  ``value_proposition`` over the deduplicated store;
+* ``generate_report`` and ``json_dump`` (the JSON export, serialized)
+  from a warm context;
+* one per chart drawing function (``create_salary_gap_chart``, …),
+  from its prepared inputs.
+
+Each scale's market comes from ``synthetic_market`` (seeded) and is kept
+as a binary snapshot in ``.bench_cache/``, so it is generated once and
+memory-mapped by every run. Every benchmark runs in a fresh interpreter
+so peak memory and caches are its own. There, as with asv, ``setup``
+runs untimed before every call, one warm-up call is discarded, and then:
+
+* ``time_s`` — median wall time of ``--repeat`` calls (fewer if they
+  exceed ``MAX_SECONDS``), and ``time_min_s`` alongside;
+* ``peak_rss_mb`` — the process's resident-set peak over those calls
+  (the kernel counter is reset after setup when Linux allows it);
+* ``alloc_peak_mb`` — the ``tracemalloc`` peak of one more call,
+  NumPy buffers included.
+
+Results are compared with ``benchmark_baseline.json``. The baseline is
+machine-specific, so it is not committed: record one with ``--save`` on
+the machine that runs the comparison. Without one, nothing is compared
+and a warning says so; ``--require-baseline`` turns that into exit
+status 2. A metric regresses when it grows by more than ``--threshold``
+(25% by default) and by more than its noise floor; any regression makes
+the exit status 1. ``cli.py bench`` runs this suite after its import-time
+check.
+
+Usage:
+    python3 benchmarks.py --save                       # record the baseline
+    python3 benchmarks.py                              # compare against it
+    python3 benchmarks.py --scales 1e3,1e6 -b report -b chart
+    python3 cli.py bench --scales 1e3 -b analysis   # import budgets, then the suite
+"""
+
+import gc
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BENCH_CACHE = os.path.join(HERE, ".bench_cache")
+BASELINE_PATH = os.path.join(HERE, "benchmark_baseline.json")
+
+SCALES = (1_000, 10_000, 100_000)
+SEED = 2026
+REPEAT = 5
+MAX_SECONDS = 10.0     # stop repeating once this much time was spent on one benchmark
+THRESHOLD = 0.25
+
+RESULTS_VERSION = 1
+# metric → absolute growth below which a change is noise, not a regression
+NOISE_FLOORS = {"time_s": 0.002, "peak_rss_mb": 2.0, "alloc_peak_mb": 1.0}
+
+
+# ── BENCHMARKS ──
+
+@dataclass(frozen=True)
+class Benchmark:
+    """``run(setup(store))`` is timed; ``setup`` is called, untimed, before every run."""
+    name: str
+    setup: Callable
+    run: Callable
+
+
+def _context(store, cold: bool = False):
+    from market_data import candidate
+    from nashville_market_analysis import AnalysisContext
+
+    ctx = AnalysisContext(store, candidate)
+    if cold:
+        ctx._results.clear()
+    else:
+        ctx.json_data()  # every derived result, computed once per process
+    return ctx
+
+
+def _salary_stats(name: str) -> Benchmark:
+    def run(store):
+        import nashville_market_analysis
+        return getattr(nashville_market_analysis, name)(store)
+    return Benchmark(name, lambda store: _context(store).unique_store, run)
+
+
+def _value_proposition(ctx):
+    from nashville_market_analysis import value_proposition
+    return value_proposition(ctx.candidate["asking_salary"], ctx.market_stats, ctx.nashville_stats)
+
+
+def _generate_report(ctx):
+    from nashville_market_analysis import generate_report
+    return generate_report(ctx)
+
+
+def _chart_benchmarks() -> list[Benchmark]:
+    from generate_visualizations import CHARTS
+
+    def setup_for(filename, inputs_fn):
+        def setup(store):
+            return os.path.join(BENCH_CACHE, filename), inputs_fn(_context(store))
+        return setup
+
+    return [Benchmark(draw_fn.__name__, setup_for(filename, inputs_fn),
+                      lambda state, draw_fn=draw_fn: draw_fn(state[0], **state[1]))
+            for filename, inputs_fn, draw_fn in CHARTS.values()]
+
+
+def benchmarks() -> list[Benchmark]:
+    return [
+        Benchmark("analysis", lambda store: _context(store, cold=True), lambda ctx: ctx.json_data()),
+        _salary_stats("compute_salary_stats"),
+        _salary_stats("compute_nashville_salary_stats"),
+        Benchmark("value_proposition", _context, _value_proposition),
+        Benchmark("generate_report", _context, _generate_report),
+        Benchmark("json_dump", _context,
+                  lambda ctx: json.dumps(ctx.json_data(), indent=2, default=str)),
+        *_chart_benchmarks(),
+    ]
+
+
+# ── MEASUREMENT ──
+
+def _status_kb(field: str) -> int | None:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def _reset_peak_rss() -> bool:
+    """Restart the kernel's peak-RSS counter at the current RSS (Linux ≥ 4.0)."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _peak_rss_mb() -> float:
+    peak = _status_kb("VmHWM")
+    if peak is None:  # no /proc: peak since process start
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == "darwin":
+            peak //= 1024
+    return peak / 1024
+
+
+def measure(bench: Benchmark, store, repeat: int = REPEAT, max_seconds: float = MAX_SECONDS) -> dict:
+    """Wall time, peak RSS and peak allocations of ``bench`` in this process."""
+    import tracemalloc
+
+    bench.run(bench.setup(store))  # warm-up: imports, caches, first touch of mapped pages
+    times = []
+    reset = False
+    for _ in range(repeat):
+        state = bench.setup(store)
+        gc.collect()
+        reset = _reset_peak_rss() or reset
+        start = time.perf_counter()
+        bench.run(state)
+        times.append(time.perf_counter() - start)
+        del state
+        if sum(times) > max_seconds:
+            break
+    peak_rss = _peak_rss_mb()
+
+    state = bench.setup(store)
+    gc.collect()
+    tracemalloc.start()
+    bench.run(state)
+    alloc_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    times.sort()
+    return {
+        "time_s": times[len(times) // 2],
+        "time_min_s": times[0],
+        "runs": len(times),
+        "peak_rss_mb": round(peak_rss, 1),
+        "peak_rss_reset": reset,
+        "alloc_peak_mb": round(alloc_peak / 2**20, 2),
+    }
+
+
+def market_snapshot(n_rows: int, seed: int = SEED) -> str:
+    """Path of the snapshot holding the ``n_rows``-posting synthetic market (built if missing)."""
+    path = os.path.join(BENCH_CACHE, f"synthetic-{seed}-{n_rows}.snapshot")
+    if not os.path.exists(os.path.join(path, "manifest.json")):
+        from snapshot import write_snapshot
+        from synthetic_market import SyntheticMarket
+
+        os.makedirs(BENCH_CACHE, exist_ok=True)
+        write_snapshot(path, SyntheticMarket(seed).store(n_rows))
+    return path
+
+
+def run_worker(name: str, n_rows: int, repeat: int, seed: int = SEED) -> dict:
+    from snapshot import load_snapshot
+
+    bench = next((b for b in benchmarks() if b.name == name), None)
+    if bench is None:
+        raise SystemExit(f"unknown benchmark {name!r}")
+    return measure(bench, load_snapshot(market_snapshot(n_rows, seed)), repeat)
+
+
+def run_isolated(name: str, n_rows: int, repeat: int, seed: int = SEED) -> dict:
+    """``run_worker`` in a fresh interpreter; its result."""
+    import subprocess
+
+    proc = subprocess.run([sys.executable, os.path.abspath(__file__), "--worker", name,
+                           str(n_rows), "--repeat", str(repeat), "--seed", str(seed)],
+                          cwd=HERE, capture_output=True, text=True)
+    if proc.returncode:
+        raise RuntimeError(f"benchmark {name} at {n_rows:,} rows failed:\n{proc.stderr}")
+    return json.loads(proc.stdout.splitlines()[-1])
+
+
+# ── BASELINE ──
+
+def machine_info() -> dict:
+    import platform
+
+    import numpy as np
+    return {"python": platform.python_version(), "numpy": np.__version__,
+            "platform": platform.platform(), "cpus": os.cpu_count()}
+
+
+def compare(results: dict, baseline: dict, threshold: float = THRESHOLD) -> list[tuple]:
+    """(key, metric, baseline, current, ratio) for each metric that regressed past ``threshold``."""
+    regressions = []
+    for key, current in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        for metric, floor in NOISE_FLOORS.items():
+            old, new = base.get(metric), current.get(metric)
+            if not old or new is None:
+                continue
+            if new > old * (1 + threshold) and new - old > floor:
+                regressions.append((key, metric, old, new, new / old))
+    return regressions
+
+
+def load_baseline(path: str = BASELINE_PATH) -> dict:
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}
+    if data.get("version") != RESULTS_VERSION:
+        raise SystemExit(f"{path}: results version {data.get('version')}, expected {RESULTS_VERSION}")
+    return data.get("results", {})
+
+
+def run_suite(scales=SCALES, patterns=None, repeat: int = REPEAT, seed: int = SEED,
+              baseline_path: str = BASELINE_PATH, threshold: float = THRESHOLD,
+              save: bool = False, output: str | None = None,
+              require_baseline: bool = False) -> int:
+    """Run the benchmarks whose names contain any of ``patterns`` at each scale; exit status.
+
+    Prints one line per benchmark, saves the results (to ``output``, and
+    as the baseline with ``save``) and compares them with the baseline.
+    Returns 1 on a regression, 2 when ``require_baseline`` is set and
+    there is no baseline to compare with, else 0.
+    """
+    names = [b.name for b in benchmarks()
+             if not patterns or any(pattern in b.name for pattern in patterns)]
+    baseline = {} if save else load_baseline(baseline_path)
+    if not save and not baseline:
+        print(f"⚠️  No baseline at {baseline_path}; nothing to compare against "
+              f"(record one with --save)")
+
+    results = {}
+    for n_rows in scales:
+        start = time.perf_counter()
+        market_snapshot(n_rows, seed)
+        print(f"── {n_rows:,} postings (market ready in {time.perf_counter() - start:.1f}s)")
+        for name in names:
+            key = f"{name}@{n_rows}"
+            r = results[key] = run_isolated(name, n_rows, repeat, seed)
+            base = baseline.get(key, {}).get("time_s")
+            vs = f"  ×{r['time_s'] / base:.2f} vs baseline" if base else ""
+            print(f"  {name:32} {r['time_s'] * 1000:10.1f} ms  {r['peak_rss_mb']:8.1f} MB RSS "
+                  f"{r['alloc_peak_mb']:9.2f} MB alloc{vs}")
+
+    record = {"version": RESULTS_VERSION, "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+              "seed": seed, "machine": machine_info(), "results": results}
+    for path in filter(None, [output, baseline_path if save else None]):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(record, f, indent=2)
+        print(f"✅ Results saved to: {path}")
+
+    regressions = compare(results, baseline, threshold)
+    for key, metric, old, new, ratio in regressions:
+        print(f"❌ {key}: {metric} {old:g} → {new:g} (×{ratio:.2f})")
+    if regressions:
+        return 1
+    if baseline:
+        print(f"✅ No regressions past {threshold:.0%} against {baseline_path}")
+    elif require_baseline and not save:
+        return 2
+    return 0
+
+
+def parse_scales(text: str) -> list[int]:
+    """``"1e3,1e5"`` → ``[1000, 100000]``."""
+    return [int(float(s)) for s in text.split(",")]
+
+
+# ── MAIN ──
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark the analysis, report and chart hot paths.")
+    parser.add_argument("--scales", type=parse_scales, default=SCALES,
+                        help="comma-separated posting counts (e.g. 1e3,1e5,1e6)")
+    parser.add_argument("-b", "--bench", action="append",
+                        help="only benchmarks whose name contains this (repeatable)")
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help="relative growth counted as a regression (default 0.25)")
+    parser.add_argument("--save", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--require-baseline", action="store_true",
+                        help="exit 2 when there is no baseline to compare with")
+    parser.add_argument("-o", "--output", help="also write the results to this JSON file")
+    parser.add_argument("--worker", nargs=2, metavar=("NAME", "ROWS"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        name, rows = args.worker
+        print(json.dumps(run_worker(name, int(rows), args.repeat, args.seed)))
+        sys.exit(0)
+
+    sys.exit(run_suite(args.scales, args.bench, args.repeat, args.seed, args.baseline,
+                       args.threshold, args.save, args.output, args.require_baseline))
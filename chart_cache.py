@@ -0,0 +1,98 @@
+"""
+Content-Addressed Chart Cache
+=============================
+Decides which charts actually need re-rendering.
+
+Each chart's cache key is a SHA-256 over its input data, the shared
+styling (rcParams theme and palette), the source of its drawing
+function and the matplotlib version. Keys are recorded per chart in
+``visuals/manifest.json``; a chart whose key and output file are both
+unchanged is skipped. The manifest also records a SHA-256 of each output
+PNG, so a chart whose file was modified or truncated since it was
+rendered is drawn again. Entries for charts that no longer exist — or that
+now write to a different file — are evicted along with their stale PNGs.
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import os
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 2
+
+
+@functools.cache
+def _matplotlib_version() -> str:
+    # Read from package metadata, so unchanged charts never import matplotlib itself.
+    from importlib.metadata import version
+    return version("matplotlib")
+
+
+def chart_key(name: str, inputs: dict, style: dict, draw_fn) -> str:
+    payload = {
+        "chart": name,
+        "inputs": inputs,
+        "style": style,
+        "code": inspect.getsource(draw_fn),
+        "matplotlib": _matplotlib_version(),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class ChartCache:
+    """Manifest of rendered charts (name → output file and cache key)."""
+
+    def __init__(self, output_dir: str):
+        self.output_dir = output_dir
+        self.path = os.path.join(output_dir, MANIFEST_NAME)
+        self.entries: dict[str, dict] = {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                manifest = json.load(f)
+            if manifest.get("version") == MANIFEST_VERSION:
+                self.entries = manifest.get("charts", {})
+        except (OSError, json.JSONDecodeError):
+            pass
+
+    def _digest(self, filename: str) -> str | None:
+        try:
+            with open(os.path.join(self.output_dir, filename), "rb") as f:
+                return hashlib.file_digest(f, "sha256").hexdigest()
+        except OSError:
+            return None
+
+    def is_fresh(self, name: str, filename: str, key: str) -> bool:
+        """Whether the chart's key matches and its file is still exactly what was rendered."""
+        entry = self.entries.get(name)
+        return (entry is not None and entry["file"] == filename and entry["key"] == key
+                and entry.get("digest") is not None and self._digest(filename) == entry["digest"])
+
+    def record(self, name: str, filename: str, key: str):
+        self.entries[name] = {"file": filename, "key": key, "digest": self._digest(filename)}
+
+    def evict(self, active: dict[str, str]) -> list[str]:
+        """Drop entries not in ``active`` (chart name → file); delete their orphaned PNGs."""
+        in_use = set(active.values())
+        removed = []
+        for name, entry in list(self.entries.items()):
+            if active.get(name) == entry["file"]:
+                continue
+            del self.entries[name]
+            if entry["file"] not in in_use:
+                try:
+                    os.remove(os.path.join(self.output_dir, entry["file"]))
+                    removed.append(entry["file"])
+                except FileNotFoundError:
+                    pass
+        return removed
+
+    def save(self):
+        manifest = {"version": MANIFEST_VERSION,
+                    "charts": dict(sorted(self.entries.items()))}
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+            f.write("\n")
+        os.replace(tmp, self.path)
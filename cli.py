@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Market Analysis CLI
+===================
+One entry point for the analysis scripts:
+
+    python3 cli.py report   [SOURCE] [-o FILE] [-q]
+    python3 cli.py json     [SOURCE] [-o FILE | -o -]
+    python3 cli.py charts   [SOURCE] [-j N] [--force]
+    python3 cli.py bench    [--repeat N] [--imports-only] [--scales 1e3,1e4] [-b NAME] [--save]
+
+SOURCE is one of ``--snapshot PATH``, ``--input FILE...`` or ``--api URL``
+(the built-in market data by default), optionally with ``--total-jobs N``
+to override the board-wide job total the source reports.
+
+Startup stays cheap: this module imports only the standard library, and
+each subcommand imports what it needs once it runs. numpy and the
+analysis modules load only for ``report``/``json``/``charts``,
+matplotlib only when a chart is actually redrawn, and the listing store
+is built from the market data only when the analysis cache cannot
+answer.
+
+``bench`` first checks import times. It runs
+``python -X importtime -c "import <module>"`` for every module in
+``IMPORT_BUDGETS`` and fails (exit status 1) when a module's cumulative
+import time exceeds its budget. The best of ``--repeat`` runs is taken,
+so a busy machine does not fail the check by itself. It then runs the
+``benchmarks.py`` suite (``--scales``, ``-b``, ``--save`` and
+``--require-baseline`` as there) unless ``--imports-only`` is given.
+"""
+
+import argparse
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+REPORT_PATH = "Nashville_Market_Analysis_Executive_Summary.txt"
+JSON_PATH = "nashville_analysis_data.json"
+
+# module → cold import budget in milliseconds (cumulative, as reported by -X importtime).
+# Roughly twice the measured time, so only a new eager import trips it.
+IMPORT_BUDGETS = {
+    "cli": 40,
+    "market_data": 15,
+    "nashville_market_analysis": 50,  # no numpy or analysis modules at import
+    "generate_visualizations": 300,
+}
+
+
+def import_time_ms(module: str, repeat: int = 3) -> float:
+    """Best-of-``repeat`` cumulative import time of ``module`` in a fresh interpreter."""
+    import subprocess
+
+    best = float("inf")
+    for _ in range(repeat):
+        proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                              cwd=HERE, capture_output=True, text=True)
+        if proc.returncode:
+            raise RuntimeError(f"import {module} failed:\n{proc.stderr}")
+        for line in proc.stderr.splitlines():
+            # "import time: <self us> | <cumulative us> | <indented module name>"
+            fields = line.split("|")
+            if len(fields) == 3 and fields[2].strip() == module:
+                best = min(best, int(fields[1]) / 1000)
+    return best
+
+
+def check_import_budgets(budgets: dict | None = None, repeat: int = 3) -> list[tuple]:
+    """(module, milliseconds, budget) per module; over budget where milliseconds > budget."""
+    budgets = IMPORT_BUDGETS if budgets is None else budgets
+    return [(module, import_time_ms(module, repeat), budget) for module, budget in budgets.items()]
+
+
+def _context(args):
+    from nashville_market_analysis import CACHE_DIR, AnalysisContext, load_source
+
+    store, total_jobs = load_source(args.snapshot, args.input or (), args.api)
+    return AnalysisContext(store, cache_dir=CACHE_DIR, total_jobs=args.total_jobs or total_jobs)
+
+
+# ── SUBCOMMANDS ──
+
+def cmd_report(args) -> int:
+    from nashville_market_analysis import write_report
+
+    ctx = _context(args)
+    with open(args.output, "w") as f:
+        write_report(ctx, *([] if args.quiet else [sys.stdout]), f)
+    if not args.quiet:
+        print("\n")
+    print(f"✅ Report saved to: {args.output}")
+    ctx.save()
+    return 0
+
+
+def cmd_json(args) -> int:
+    import json
+
+    ctx = _context(args)
+    if args.output == "-":
+        json.dump(ctx.json_data(), sys.stdout, indent=2, default=str)
+        sys.stdout.write("\n")
+    else:
+        with open(args.output, "w") as f:
+            json.dump(ctx.json_data(), f, indent=2, default=str)
+        print(f"✅ Structured data saved to: {args.output}")
+    ctx.save()
+    return 0
+
+
+def cmd_charts(args) -> int:
+    import time
+
+    from generate_visualizations import render_charts
+
+    ctx = _context(args)
+    start = time.perf_counter()
+    for name, path, seconds in render_charts(ctx, args.jobs, args.force):
+        if seconds is None:
+            print(f"⏭️  Unchanged: {path}")
+        else:
+            print(f"✅ Saved: {path}  ({seconds:.2f}s)")
+    print(f"\n🎨 All visualizations generated in {time.perf_counter() - start:.2f}s.")
+    ctx.save()
+    return 0
+
+
+def cmd_bench(args) -> int:
+    failed = 0
+    for module, ms, budget in check_import_budgets(repeat=args.repeat):
+        ok = ms <= budget
+        failed += not ok
+        print(f"{'✅' if ok else '❌'} import {module:28} {ms:7.1f} ms  (budget {budget} ms)")
+    if args.imports_only:
+        return 1 if failed else 0
+
+    import benchmarks
+
+    print()
+    status = benchmarks.run_suite(benchmarks.parse_scales(args.scales), args.bench,
+                                  repeat=args.repeat, save=args.save,
+                                  require_baseline=args.require_baseline)
+    return 1 if failed else status
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Nashville tech market analysis.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def add(name, func, help):
+        p = sub.add_parser(name, help=help)
+        p.set_defaults(func=func)
+        if name != "bench":
+            source = p.add_mutually_exclusive_group()
+            source.add_argument("--snapshot", help="analyze a binary market snapshot (see snapshot.py) "
+                                                   "instead of the built-in market data")
+            source.add_argument("--input", nargs="+", metavar="FILE",
+                                help="analyze JSONL/CSV posting files (see ingestion.py)")
+            source.add_argument("--api", metavar="URL",
+                                help="fetch the market from a Dice-style job-search API")
+            p.add_argument("--total-jobs", type=int,
+                           help="board-wide tech job total (default: from the source)")
+        return p
+
+    report = add("report", cmd_report, "write the executive summary")
+    report.add_argument("-o", "--output", default=REPORT_PATH)
+    report.add_argument("-q", "--quiet", action="store_true", help="do not echo the report")
+    json_ = add("json", cmd_json, "write the structured JSON export")
+    json_.add_argument("-o", "--output", default=JSON_PATH, help="output path, or - for stdout")
+    charts = add("charts", cmd_charts, "render the PNG charts into visuals/")
+    charts.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="charts rendered in parallel (default: CPU count)")
+    charts.add_argument("--force", action="store_true", help="re-render even unchanged charts")
+    bench = add("bench", cmd_bench, "check import budgets, then run the benchmark suite")
+    bench.add_argument("--repeat", type=int, default=3,
+                       help="runs per module and per benchmark (imports: the best counts)")
+    bench.add_argument("--imports-only", action="store_true",
+                       help="only check cold import times against IMPORT_BUDGETS")
+    bench.add_argument("--scales", default="1e3,1e4,1e5",
+                       help="comma-separated posting counts for the suite")
+    bench.add_argument("-b", "--bench", action="append",
+                       help="only benchmarks whose name contains this (repeatable)")
+    bench.add_argument("--save", action="store_true", help="record the suite results as the baseline")
+    bench.add_argument("--require-baseline", action="store_true",
+                       help="exit 2 when there is no benchmark baseline to compare with")
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,216 @@
+"""
+Duplicate Posting Detection
+===========================
+Finds postings that appear more than once in a ListingStore — typically
+the same job returned by several category searches — so market-wide
+statistics count each posting once.
+
+Two passes, both linear in the number of rows:
+
+* Exact: each row's canonical key (title, company and salary,
+  case- and punctuation-folded) is hashed to 64 bits and rows sharing a
+  hash collapse with ``np.unique``.
+* Near: MinHash signatures over title/company character shingles plus
+  salary tokens, banded for LSH. Rows landing in the same bucket of any
+  band are compared with the bucket's first row. They are merged when
+  their estimated Jaccard similarity and salary midpoints are both close
+  enough.
+
+Text is processed once per interned string, not per row: a row's
+signature is the element-wise minimum of its title's, its company's and
+its salary tokens' signatures (MinHash of a union). The first row of
+each duplicate cluster is kept.
+"""
+
+import hashlib
+import re
+import zlib
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from listing_store import ListingStore
+
+NUM_PERM = 64
+BANDS = 16
+SHINGLE = 4
+THRESHOLD = 0.8
+SALARY_TOLERANCE = 0.05
+SALARY_ROUNDING = 1000
+VERIFY_CHUNK = 1 << 18  # candidate pairs compared per step (bounds memory)
+
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def canonical(text: str) -> str:
+    """Lower-cased, punctuation-free, single-spaced form used for matching."""
+    return _NON_WORD.sub(" ", text.lower()).strip()
+
+
+def _mix(x: np.ndarray) -> np.ndarray:
+    """splitmix64 finalizer over a uint64 array (wraps on overflow by design)."""
+    with np.errstate(over="ignore"):
+        x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return x ^ (x >> np.uint64(31))
+
+
+def _combine(*columns: np.ndarray) -> np.ndarray:
+    h = np.zeros(len(columns[0]), dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        for col in columns:
+            h = _mix(h ^ col.astype(np.uint64))
+    return h
+
+
+def _salary_tokens(values: np.ndarray) -> np.ndarray:
+    """Rounded salary as a uint64 token; missing salaries share one token."""
+    rounded = np.where(np.isnan(values), -1, np.round(values / SALARY_ROUNDING))
+    return rounded.astype(np.int64).view(np.uint64)
+
+
+def string_keys(store: ListingStore) -> np.ndarray:
+    """64-bit hash of each interned string's canonical form, indexed by code."""
+    return np.fromiter(
+        (int.from_bytes(hashlib.blake2b(canonical(v).encode(), digest_size=8).digest(), "little")
+         for v in store.strings.values),
+        dtype=np.uint64, count=len(store.strings))
+
+
+def exact_keys(store: ListingStore, keys: np.ndarray | None = None) -> np.ndarray:
+    """Per-row hash of (canonical title, canonical company, low, high)."""
+    keys = string_keys(store) if keys is None else keys
+    return _combine(keys[store.title], keys[store.company],
+                    _salary_tokens(store.salary_low), _salary_tokens(store.salary_high))
+
+
+class MinHasher:
+    """Multiply-shift MinHash with ``num_perm`` 32-bit hash functions."""
+
+    def __init__(self, num_perm: int = NUM_PERM, seed: int = 0):
+        rng = np.random.default_rng(seed)
+        self.a = rng.integers(1, 2**63, num_perm, dtype=np.uint64) | np.uint64(1)
+        self.b = rng.integers(0, 2**63, num_perm, dtype=np.uint64)
+        self.num_perm = num_perm
+
+    def _permute(self, h: np.ndarray, i: int) -> np.ndarray:
+        with np.errstate(over="ignore"):
+            return ((self.a[i] * h + self.b[i]) >> np.uint64(32)).astype(np.uint32)
+
+    def strings(self, values, shingle: int = SHINGLE) -> np.ndarray:
+        """(num_perm, len(values)) signatures over character shingles of each canonical string.
+
+        Empty strings get the all-max signature, so they never affect a union.
+        """
+        hashes, counts = [], []
+        for v in values:
+            text = canonical(v).encode()
+            grams = {text[i:i + shingle] for i in range(max(len(text) - shingle + 1, 1))} if text else ()
+            hashes.extend(map(zlib.crc32, grams))
+            counts.append(len(grams))
+        counts = np.asarray(counts, dtype=np.int64)
+        sig = np.full((self.num_perm, len(counts)), np.iinfo(np.uint32).max, dtype=np.uint32)
+        nonempty = counts > 0
+        if not nonempty.any():
+            return sig
+        h = _mix(np.asarray(hashes, dtype=np.uint64))
+        offsets = np.concatenate(([0], np.cumsum(counts[nonempty])[:-1]))
+        for i in range(self.num_perm):
+            sig[i, nonempty] = np.minimum.reduceat(self._permute(h, i), offsets)
+        return sig
+
+    def tokens(self, tokens: np.ndarray) -> np.ndarray:
+        """(num_perm, len(tokens)) signatures of one-element sets, one per uint64 token."""
+        uniq, inverse = np.unique(tokens, return_inverse=True)
+        h = _mix(uniq.astype(np.uint64))
+        return np.stack([self._permute(h, i) for i in range(self.num_perm)])[:, inverse.reshape(-1)]
+
+
+def _components(n: int, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Smallest row index in each row's connected component over edges (a, b)."""
+    labels = np.arange(n)
+    while True:
+        low = np.minimum(labels[a], labels[b])
+        before = labels.copy()
+        np.minimum.at(labels, a, low)
+        np.minimum.at(labels, b, low)
+        labels = labels[labels]  # pointer jumping
+        if np.array_equal(labels, before):
+            return labels
+
+
+@dataclass
+class DuplicateReport:
+    """Outcome of ``find_duplicates``; ``cluster`` is the kept row each row collapses into."""
+
+    keep: np.ndarray
+    cluster: np.ndarray
+    exact: int
+    near: int
+    by_category: dict = field(default_factory=dict)
+
+    @property
+    def removed(self) -> int:
+        return self.exact + self.near
+
+    def summary(self) -> dict:
+        return {"exact": self.exact, "near": self.near, "removed": self.removed,
+                "kept": int(self.keep.sum()), "by_category": self.by_category}
+
+
+def find_duplicates(store: ListingStore, threshold: float = THRESHOLD, num_perm: int = NUM_PERM,
+                    bands: int = BANDS, salary_tolerance: float = SALARY_TOLERANCE,
+                    seed: int = 0) -> DuplicateReport:
+    """Exact and near-duplicate clusters over ``store``; removal counts are per category."""
+    n = len(store)
+    rows_per_band = num_perm // bands
+    # Exact pass: first row per canonical key.
+    _, first, inverse = np.unique(exact_keys(store), return_index=True, return_inverse=True)
+    cluster = first[inverse.reshape(-1)]
+    exact = int(n - len(first))
+
+    # Near pass over the exact-pass survivors only.
+    rows = np.sort(first)
+    hasher = MinHasher(num_perm, seed)
+    text_sig = hasher.strings(store.strings.values)
+    sig = np.minimum(text_sig[:, store.title[rows]], text_sig[:, store.company[rows]])
+    for column in (store.salary_low, store.salary_high):
+        np.minimum(sig, hasher.tokens(_salary_tokens(column[rows])), out=sig)
+    low, high = store.salary_low[rows], store.salary_high[rows]
+    mid = (low + high) / 2
+    edges_a, edges_b = [], []
+    for band in range(bands):
+        # Each row is compared with the first row of its bucket in this band.
+        block = sig[band * rows_per_band:(band + 1) * rows_per_band]
+        _, head_pos, inv = np.unique(_combine(*block, np.full(len(rows), band)),
+                                     return_index=True, return_inverse=True)
+        head = head_pos[inv.reshape(-1)]
+        cand = np.flatnonzero(head != np.arange(len(rows)))
+        for start in range(0, len(cand), VERIFY_CHUNK):
+            c = cand[start:start + VERIFY_CHUNK]
+            h = head[c]
+            similar = (sig[:, c] == sig[:, h]).sum(axis=0) >= threshold * num_perm
+            both_missing = np.isnan(mid[c]) & np.isnan(mid[h])
+            close = np.abs(mid[c] - mid[h]) <= salary_tolerance * np.maximum(mid[c], mid[h])
+            ok = similar & (both_missing | close)
+            edges_a.append(c[ok])
+            edges_b.append(h[ok])
+    near = 0
+    if edges_a and sum(map(len, edges_a)):
+        labels = _components(len(rows), np.concatenate(edges_a), np.concatenate(edges_b))
+        near = int((labels != np.arange(len(rows))).sum())
+        survivor = rows[labels]  # rows is sorted, so the smallest label is the first row
+        remap = np.arange(n)
+        remap[rows] = survivor
+        cluster = remap[cluster]
+
+    keep = cluster == np.arange(n)
+    removed = np.bincount(store.category[~keep], minlength=len(store.categories))
+    by_category = {name: int(removed[code]) for code, name in enumerate(store.categories.values)}
+    return DuplicateReport(keep, cluster, exact, near, by_category)
+
+
+def dedupe(store: ListingStore, **kwargs) -> tuple[ListingStore, DuplicateReport]:
+    """The store with duplicate rows dropped, plus the report of what was dropped."""
+    report = find_duplicates(store, **kwargs)
+    return store.select(report.keep), report
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Local Dice-API Stand-In
+=======================
+A small threaded HTTP server that speaks the job-search protocol used by
+``ingestion.HttpJobSearchClient``, for exercising ingestion without the
+network. It can inject latency and transient failures (HTTP 503 with a
+Retry-After header) to exercise retries and concurrency.
+
+    GET /v1/jobs/search?q=<category>&page=<n>&page_size=<m>
+        → {"total": int, "page": int, "page_size": int, "results": [record, ...]}
+    GET /v1/jobs/count
+        → {"total": int}
+
+Usage:
+    python3 fake_dice_server.py [--port 8765] [--latency 0.05] [--fail-every 0]
+"""
+
+import argparse
+import json
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so client connection pooling is exercised
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def _send(self, status: int, payload: dict, headers: dict | None = None):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        srv: FakeDiceServer = self.server.fake
+        n = srv._begin_request()
+        try:
+            self._respond(srv, n)
+        finally:
+            srv._end_request()
+
+    def _respond(self, srv: "FakeDiceServer", n: int):
+        if srv.latency:
+            time.sleep(srv.latency)
+        if srv.fail_every and n % srv.fail_every == 0:
+            self._send(503, {"error": "injected failure"}, {"Retry-After": srv.retry_after})
+            return
+        url = urllib.parse.urlsplit(self.path)
+        params = dict(urllib.parse.parse_qsl(url.query))
+        if url.path == "/v1/jobs/count":
+            self._send(200, {"total": srv.total_jobs})
+        elif url.path == "/v1/jobs/search":
+            results = srv.by_category.get(params.get("q", ""), [])
+            page = max(1, int(params.get("page", 1)))
+            size = max(1, int(params.get("page_size", 100)))
+            start = (page - 1) * size
+            self._send(200, {"total": len(results), "page": page, "page_size": size,
+                             "results": results[start:start + size]})
+        else:
+            self._send(404, {"error": f"unknown endpoint {url.path}"})
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # Concurrent clients open many connections at once; the default backlog of 5
+    # drops SYNs, which costs a one-second retransmit each.
+    request_queue_size = 128
+
+
+class FakeDiceServer:
+    """Serve ``records`` (ingestion-format dicts with a ``category``) on localhost."""
+
+    def __init__(self, records, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0,
+                 fail_every: int = 0, total_jobs: int | None = None, retry_after: str = "0"):
+        self.by_category: dict[str, list[dict]] = {}
+        for rec in records:
+            self.by_category.setdefault(rec["category"], []).append(rec)
+        self.total_jobs = total_jobs if total_jobs is not None else sum(map(len, self.by_category.values()))
+        self.latency = latency
+        self.fail_every = fail_every
+        self.retry_after = retry_after  # Retry-After of injected failures (seconds or HTTP-date)
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0  # most requests being answered at once
+        self._lock = threading.Lock()
+        self._httpd = _Server((host, port), _Handler)
+        self._httpd.fake = self
+        self._thread = None
+
+    def _begin_request(self) -> int:
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            return self.requests
+
+    def _end_request(self):
+        with self._lock:
+            self.in_flight -= 1
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeDiceServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+# ── MAIN ──
+
+if __name__ == "__main__":
+    from ingestion import records_from_market_searches
+    from nashville_market_analysis import TOTAL_DICE_TECH_JOBS, market_searches
+
+    parser = argparse.ArgumentParser(description="Serve market_searches over a local Dice-style API.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--fail-every", type=int, default=0, help="answer every Nth request with 503")
+    args = parser.parse_args()
+
+    server = FakeDiceServer(records_from_market_searches(market_searches), port=args.port,
+                            latency=args.latency, fail_every=args.fail_every,
+                            total_jobs=TOTAL_DICE_TECH_JOBS)
+    print(f"Serving fake Dice API on {server.url} (Ctrl-C to stop)")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
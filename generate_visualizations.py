@@ -1,14 +1,20 @@
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-import numpy as np
-from math import pi
+import argparse
+import functools
 import os
+import textwrap
+import time
+from concurrent.futures import ProcessPoolExecutor
+from math import log10, pi
+
+import numpy as np
+
+from chart_cache import ChartCache, chart_key
+from nashville_market_analysis import CACHE_DIR, AnalysisContext, load_source
 
 OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "visuals")
-os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 # ── Shared styling ──
-plt.rcParams.update({
+THEME = {
     "figure.facecolor": "#0d1117",
     "axes.facecolor": "#0d1117",
     "axes.edgecolor": "#30363d",
@@ -19,7 +25,21 @@ plt.rcParams.update({
     "grid.color": "#21262d",
     "font.family": "sans-serif",
     "font.size": 11,
-})
+}
+
+
+@functools.cache
+def _pyplot():
+    """matplotlib.pyplot, imported and themed on first use (once per worker process).
+
+    Importing this module stays cheap: matplotlib is only loaded when a
+    chart is actually drawn, never for charts the cache shows unchanged.
+    """
+    import matplotlib
+    matplotlib.use("Agg")  # non-interactive: charts are only ever written to PNG
+    import matplotlib.pyplot as plt
+    plt.rcParams.update(THEME)
+    return plt
 
 ACCENT = "#58a6ff"
 GOLD = "#f0c040"
@@ -31,21 +51,18 @@ RED = "#f85149"
 #  1. SALARY GAP CHART
 # ═══════════════════════════════════════════════════════════════════════
 
-def create_salary_gap_chart():
-    categories = [
-        "Data Analyst",
-        "Python Developer",
-        "AI / ML Engineer",
-        "BI Analyst / Power BI",
-        "MCP / AI Automation",
-        "Node.js / JavaScript",
-        "Data Scientist",
-        "Data Engineer",
-    ]
-    lows =  [56, 83, 80, 62, 80, 101, 97, 48]
-    highs = [213, 286, 257, 184, 237, 380, 237, 223]
-    asking = 60
+def salary_gap_inputs(ctx: AnalysisContext) -> dict:
+    cats = {name: c for name, c in ctx.category_stats.items() if c["sample_count"]}
+    return {
+        "categories": list(cats),
+        "lows": [c["min_low"] // 1000 for c in cats.values()],
+        "highs": [c["max_high"] // 1000 for c in cats.values()],
+        "asking": ctx.candidate["asking_salary"] // 1000,
+    }
 
+
+def create_salary_gap_chart(path, categories, lows, highs, asking):
+    plt = _pyplot()
     fig, ax = plt.subplots(figsize=(12, 6))
 
     y_pos = np.arange(len(categories))
@@ -65,8 +82,8 @@ def create_salary_gap_chart():
     ax.set_yticks(y_pos)
     ax.set_yticklabels(categories, fontsize=11)
     ax.set_xlabel("Annual Salary (thousands)", fontsize=12)
-    ax.set_title("Market Salary Ranges vs. Joshua's $60K Ask", fontsize=15, fontweight="bold", pad=15)
-    ax.set_xlim(0, 410)
+    ax.set_title(f"Market Salary Ranges vs. Joshua's ${asking}K Ask", fontsize=15, fontweight="bold", pad=15)
+    ax.set_xlim(0, max(highs) * 1.08)
     ax.invert_yaxis()
     ax.grid(axis="x", alpha=0.3)
     ax.tick_params(left=False)
@@ -75,28 +92,26 @@ def create_salary_gap_chart():
         spine.set_visible(False)
 
     fig.tight_layout()
-    path = os.path.join(OUTPUT_DIR, "salary_gap_chart.png")
     fig.savefig(path, dpi=200, bbox_inches="tight")
     plt.close(fig)
-    print(f"✅ Saved: {path}")
+    return path
 
 
 # ═══════════════════════════════════════════════════════════════════════
 #  2. SKILL RARITY BAR CHART
 # ═══════════════════════════════════════════════════════════════════════
 
-def create_rarity_chart():
-    skills = [
-        "JavaScript / Node.js",
-        "API Integration",
-        "Python (Data/Analytics)",
-        "Power BI / Visualization",
-        "Revenue Forecasting",
-        "CompTIA Quad-Stack",
-        "AI/ML + Data Analytics",
-        "Model Context Protocol",
-    ]
-    scores = [5, 6, 6, 7, 7, 8, 8, 10]
+def rarity_inputs(ctx: AnalysisContext) -> dict:
+    ranked = ctx.skill_demand[::-1]  # least rare first; the axis is inverted
+    return {
+        "skills": [s["label"] for s in ranked],
+        "scores": [s["rarity_score"] for s in ranked],
+    }
+
+
+def create_rarity_chart(path, skills, scores):
+    plt = _pyplot()
+    from matplotlib import patches as mpatches
 
     # Color gradient: green (common) → gold (moderate) → red (rare)
     def rarity_color(score):
@@ -140,30 +155,35 @@ def create_rarity_chart():
         spine.set_visible(False)
 
     fig.tight_layout()
-    path = os.path.join(OUTPUT_DIR, "skill_rarity_chart.png")
     fig.savefig(path, dpi=200, bbox_inches="tight")
     plt.close(fig)
-    print(f"✅ Saved: {path}")
+    return path
 
 
 # ═══════════════════════════════════════════════════════════════════════
 #  3. MULTI-DISCIPLINE RADAR CHART
 # ═══════════════════════════════════════════════════════════════════════
 
-def create_radar_chart():
-    dimensions = [
-        "Data Analytics\n& Visualization",
-        "AI / ML",
-        "Software\nDevelopment",
-        "Business\nIntelligence",
-        "Cloud &\nInfrastructure",
-        "MCP / Agentic\nAI",
-    ]
-
-    # Scores out of 10
-    joshua =          [9, 8, 7, 8, 8, 10]
-    typical_analyst = [7, 2, 3, 5, 2, 0]
-
+def radar_inputs(ctx: AnalysisContext) -> dict:
+    return {
+        "dimensions": [
+            "Data Analytics\n& Visualization",
+            "AI / ML",
+            "Software\nDevelopment",
+            "Business\nIntelligence",
+            "Cloud &\nInfrastructure",
+            "MCP / Agentic\nAI",
+        ],
+        # Scores out of 10
+        "joshua":          [9, 8, 7, 8, 8, 10],
+        "typical_analyst": [7, 2, 3, 5, 2, 0],
+    }
+
+
+def create_radar_chart(path, dimensions, joshua, typical_analyst):
+    plt = _pyplot()
+    joshua = list(joshua)
+    typical_analyst = list(typical_analyst)
     N = len(dimensions)
     angles = [n / float(N) * 2 * pi for n in range(N)]
     angles += angles[:1]
@@ -207,33 +227,33 @@ def create_radar_chart():
                  fontsize=14, fontweight="bold", pad=25, color="#c9d1d9")
 
     fig.tight_layout()
-    path = os.path.join(OUTPUT_DIR, "radar_chart.png")
     fig.savefig(path, dpi=200, bbox_inches="tight")
     plt.close(fig)
-    print(f"✅ Saved: {path}")
+    return path
 
 
 # ═══════════════════════════════════════════════════════════════════════
 #  4. SKILL RARITY BUBBLE CHART  (rarity × demand × salary)
 # ═══════════════════════════════════════════════════════════════════════
 
-def create_rarity_bubble_chart():
-    skills = [
-        "MCP",
-        "AI/ML +\nData Analytics",
-        "CompTIA\nQuad-Stack",
-        "Power BI /\nVisualization",
-        "Revenue\nForecasting",
-        "Python\n(Analytics)",
-        "API\nIntegration",
-        "JavaScript /\nNode.js",
-    ]
-    rarity_scores =   [10,   8,    8,    7,    7,    6,    6,    5]
-    dice_listings =   [10,  1062,  50,   29,    5,   83,  200,  105]  # approximate Dice presence
-    salary_ceiling_k = [237, 257,  135,  166,  120,  286,  184,  380]  # high end of range (K)
+def rarity_bubble_inputs(ctx: AnalysisContext) -> dict:
+    demand = ctx.skill_demand
+    return {
+        "skills": [textwrap.fill(s["label"], 14, break_long_words=False, break_on_hyphens=False) for s in demand],
+        "rarity_scores": [s["rarity_score"] for s in demand],
+        "dice_listings": [s["listings"] for s in demand],
+        "salary_ceiling_k": [s["salary_ceiling"] // 1000 for s in demand],  # high end of range (K)
+    }
 
-    # Bubble size proportional to salary ceiling
-    sizes = [s * 2.2 for s in salary_ceiling_k]
+
+def create_rarity_bubble_chart(path, skills, rarity_scores, dice_listings, salary_ceiling_k):
+    plt = _pyplot()
+    from matplotlib import patches as mpatches
+
+    # Bubble size proportional to salary ceiling; skills no sampled posting
+    # mentions (no listings, no ceiling) sit at the left edge as small bubbles.
+    sizes = [s * 2.2 if s else 80 for s in salary_ceiling_k]
+    xs = [max(n, 4) for n in dice_listings]
 
     # Color by rarity tier
     def rarity_color(score):
@@ -248,16 +268,28 @@ def create_rarity_bubble_chart():
 
     fig, ax = plt.subplots(figsize=(13, 8))
 
-    # Use log scale for x-axis (demand) since values span 5 → 1,062
+    # Labels of bubbles within ~0.3 decades of each other on the same row are
+    # stacked, so derived values that land close together stay readable.
+    y_offs = [18] * len(skills)
+    placed = []
+    for i in sorted(range(len(skills)), key=lambda i: (rarity_scores[i], dice_listings[i])):
+        near = [j for j in placed if rarity_scores[j] == rarity_scores[i]
+                and abs(log10(max(dice_listings[i], 1)) - log10(max(dice_listings[j], 1))) < 0.3]
+        # near the top of the axis the stack grows downward instead
+        y_offs[i] = 18 + 42 * len(near) if rarity_scores[i] < 9 else -42 * (len(near) + 1)
+        placed.append(i)
+
+    # Use log scale for x-axis (demand) since values span a few → thousands
     for i in range(len(skills)):
-        ax.scatter(dice_listings[i], rarity_scores[i], s=sizes[i],
+        ax.scatter(xs[i], rarity_scores[i], s=sizes[i],
                    color=colors[i], alpha=0.7, edgecolors="white", linewidths=0.8, zorder=5)
         # Label each bubble
         x_off = 8 if dice_listings[i] < 500 else -15
         ha = "left" if dice_listings[i] < 500 else "right"
-        ax.annotate(f"{skills[i]}\n${salary_ceiling_k[i]}K+",
-                    (dice_listings[i], rarity_scores[i]),
-                    textcoords="offset points", xytext=(x_off, 18), ha=ha,
+        ceiling = f"${salary_ceiling_k[i]}K+" if salary_ceiling_k[i] else "none sampled"
+        ax.annotate(f"{skills[i]}\n{ceiling}",
+                    (xs[i], rarity_scores[i]),
+                    textcoords="offset points", xytext=(x_off, y_offs[i]), ha=ha,
                     fontsize=9, color="#c9d1d9", fontweight="bold",
                     arrowprops=dict(arrowstyle="-", color="#30363d", lw=0.5))
 
@@ -267,7 +299,7 @@ def create_rarity_bubble_chart():
     ax.set_title("Skill Rarity vs. Market Demand\nBubble size = salary ceiling",
                  fontsize=15, fontweight="bold", pad=15)
     ax.set_ylim(3.5, 11.5)
-    ax.set_xlim(3, 2000)
+    ax.set_xlim(3, max(2000, max(xs) * 1.5))
     ax.set_yticks(range(4, 11))
 
     # Quadrant annotations
@@ -301,18 +333,139 @@ def create_rarity_bubble_chart():
         spine.set_visible(False)
 
     fig.tight_layout()
-    path = os.path.join(OUTPUT_DIR, "skill_rarity_bubble.png")
     fig.savefig(path, dpi=200, bbox_inches="tight")
     plt.close(fig)
-    print(f"✅ Saved: {path}")
+    return path
 
 
+# ═══════════════════════════════════════════════════════════════════════
+#  5. ASKING-SALARY SWEEP
 # ═══════════════════════════════════════════════════════════════════════
 
-if __name__ == "__main__":
-    create_salary_gap_chart()
-    create_rarity_chart()
-    create_radar_chart()
-    create_rarity_bubble_chart()
-    print("\n🎨 All visualizations generated.")
+def salary_sweep_inputs(ctx: AnalysisContext) -> dict:
+    sweep = ctx.salary_sweep
+    segments = sweep["segments"]
+    return {
+        "asking_k": [a / 1000 for a in sweep["asking"]],
+        "percentile": {name: s["percentile"] for name, s in segments.items()},
+        "share_above": {name: s["share_above"] for name, s in segments.items()},
+        "asking": ctx.candidate["asking_salary"] // 1000,
+    }
+
+
+def create_salary_sweep_chart(path, asking_k, percentile, share_above, asking):
+    plt = _pyplot()
+    fig, (ax_pct, ax_above) = plt.subplots(1, 2, figsize=(15, 6), sharex=True)
+    highlight = {"overall": (ACCENT, "All openings"), "nashville": (GREEN, "Nashville-local")}
+
+    for ax, curves, title, ylabel in (
+            (ax_pct, percentile, "Market Percentile of the Ask", "Openings with midpoint ≤ ask (%)"),
+            (ax_above, share_above, "Openings Paying Above the Ask", "Openings with top of range > ask (%)")):
+        # Categories as faint context lines, the two headline segments on top.
+        for name, values in curves.items():
+            if name not in highlight:
+                ax.plot(asking_k, values, color="#8b949e", linewidth=1, alpha=0.35)
+        for name, (color, label) in highlight.items():
+            if name in curves:
+                ax.plot(asking_k, curves[name], color=color, linewidth=2.5, label=label)
+        ax.plot([], [], color="#8b949e", linewidth=1, alpha=0.6, label="Each search category")
+
+        ax.axvline(x=asking, color=GOLD, linewidth=2, linestyle="--", zorder=5)
+        ax.text(asking + 2, 3, f"Joshua's ask: ${asking}K", color=GOLD, fontsize=10,
+                fontweight="bold", va="bottom")
+        ax.set_title(title, fontsize=14, fontweight="bold", pad=12)
+        ax.set_xlabel("Asking Salary (thousands)", fontsize=12)
+        ax.set_ylabel(ylabel, fontsize=11)
+        ax.set_xlim(asking_k[0], asking_k[-1])
+        ax.set_ylim(0, 100)
+        ax.grid(alpha=0.2)
+        ax.tick_params(left=False, bottom=False)
+        for spine in ax.spines.values():
+            spine.set_visible(False)
+
+    ax_above.legend(loc="upper right", fontsize=9, facecolor="#161b22", edgecolor="#30363d",
+                    labelcolor="#c9d1d9")
+
+    fig.tight_layout()
+    fig.savefig(path, dpi=200, bbox_inches="tight")
+    plt.close(fig)
+    return path
 
+
+# ═══════════════════════════════════════════════════════════════════════
+
+def _render(name: str, path: str, inputs: dict) -> tuple[str, str, float]:
+    """Worker entry point: draw one chart, return (name, path, seconds)."""
+    start = time.perf_counter()
+    CHARTS[name][2](path, **inputs)
+    return name, path, time.perf_counter() - start
+
+
+def render_charts(ctx: AnalysisContext, jobs: int = 1, force: bool = False) -> list[tuple]:
+    """Render every chart whose inputs changed, in a process pool when ``jobs`` > 1.
+
+    Returns (name, path, seconds) in CHARTS order; ``seconds`` is None for
+    charts skipped because the manifest shows them up to date. Each chart
+    is drawn in isolation from the same inputs and rcParams, so the PNGs
+    do not depend on ``jobs``.
+    """
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    cache = ChartCache(OUTPUT_DIR)
+    cache.evict({name: filename for name, (filename, _, _) in CHARTS.items()})
+    results, tasks, keys = {}, [], {}
+    for name, (filename, inputs_fn, draw_fn) in CHARTS.items():
+        path = os.path.join(OUTPUT_DIR, filename)
+        inputs = inputs_fn(ctx)
+        keys[name] = chart_key(name, inputs, STYLE, draw_fn)
+        if not force and cache.is_fresh(name, filename, keys[name]):
+            results[name] = (name, path, None)
+        else:
+            tasks.append((name, path, inputs))
+    if jobs <= 1 or len(tasks) <= 1:
+        rendered = [_render(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+            rendered = [f.result() for f in [pool.submit(_render, *task) for task in tasks]]
+    for name, path, seconds in rendered:
+        results[name] = (name, path, seconds)
+        cache.record(name, CHARTS[name][0], keys[name])
+    cache.save()
+    return [results[name] for name in CHARTS]
+
+
+# name → (output file, inputs provider, drawing function)
+CHARTS = {
+    "salary_gap": ("salary_gap_chart.png", salary_gap_inputs, create_salary_gap_chart),
+    "skill_rarity": ("skill_rarity_chart.png", rarity_inputs, create_rarity_chart),
+    "radar": ("radar_chart.png", radar_inputs, create_radar_chart),
+    "rarity_bubble": ("skill_rarity_bubble.png", rarity_bubble_inputs, create_rarity_bubble_chart),
+    "salary_sweep": ("salary_sweep_chart.png", salary_sweep_inputs, create_salary_sweep_chart),
+}
+
+# Everything outside the inputs that changes how a chart looks.
+STYLE = {"theme": THEME, "palette": [ACCENT, GOLD, GREEN, RED]}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render the PNG charts into visuals/.")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="charts rendered in parallel (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="re-render even unchanged charts")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--snapshot", help="chart a binary market snapshot (see snapshot.py)")
+    source.add_argument("--input", nargs="+", metavar="FILE",
+                        help="chart JSONL/CSV posting files (see ingestion.py)")
+    source.add_argument("--api", metavar="URL", help="fetch the market from a Dice-style job-search API")
+    parser.add_argument("--total-jobs", type=int,
+                        help="board-wide tech job total (default: from the source)")
+    args = parser.parse_args()
+
+    store, total_jobs = load_source(args.snapshot, args.input or (), args.api)
+    ctx = AnalysisContext(store, cache_dir=CACHE_DIR, total_jobs=args.total_jobs or total_jobs)
+    start = time.perf_counter()
+    for name, path, seconds in render_charts(ctx, args.jobs, args.force):
+        if seconds is None:
+            print(f"⏭️  Unchanged: {path}")
+        else:
+            print(f"✅ Saved: {path}  ({seconds:.2f}s)")
+    print(f"\n🎨 All visualizations generated in {time.perf_counter() - start:.2f}s.")
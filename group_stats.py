@@ -0,0 +1,162 @@
+"""
+Vectorized Group-By Salary Statistics
+=====================================
+Per-group count, min, max, mean, median and percentiles over a
+ListingStore, for any combination of the coded columns (category,
+workplace, type, company, …).
+
+Each salary column is sorted once by (group, value) with ``np.lexsort``;
+after that every statistic is array arithmetic on the group offsets —
+counts and sums via ``np.bincount``, min/max/percentiles by indexing into
+each group's sorted run. Nothing loops over rows in Python; only the final
+per-group result dicts are assembled there.
+Percentile ranks follow ``order_stats`` (element at floor(q · n)).
+"""
+
+import math
+
+import numpy as np
+
+from listing_store import ListingStore
+from order_stats import REPORT_PERCENTILES, percentile_fields, summary_quantiles
+
+# Group-by key → (store column, lookup table attribute). "type" is the export name
+# of the job_type column, matching the posting dicts.
+KEYS = {
+    "category": ("category", "categories"),
+    "workplace": ("workplace", "workplaces"),
+    "type": ("job_type", "job_types"),
+    "job_type": ("job_type", "job_types"),
+    "company": ("company", "strings"),
+    "title": ("title", "strings"),
+    "location": ("location", "strings"),
+    "is_local": ("is_local", None),
+}
+
+_MAX_COMBINED_KEY = np.iinfo(np.int64).max
+
+
+def group_ids(store: ListingStore, by) -> tuple[np.ndarray, list]:
+    """Dense group id per row plus the label of each group (str, or tuple for several keys)."""
+    keys = [by] if isinstance(by, str) else list(by)
+    columns = [getattr(store, KEYS[key][0]).astype(np.int64) for key in keys]
+    radices = [int(codes.max()) + 1 if codes.size else 1 for codes in columns]
+    if math.prod(radices) <= _MAX_COMBINED_KEY:
+        # One mixed-radix int64 per row, unpacked again for the labels.
+        combined = np.zeros(len(store), dtype=np.int64)
+        for codes, radix in zip(columns, radices):
+            combined = combined * radix + codes
+        uniq, inverse = np.unique(combined, return_inverse=True)
+        key_codes = []
+        for radix in reversed(radices):
+            key_codes.append(uniq % radix)
+            uniq = uniq // radix
+        key_codes.reverse()
+    else:
+        # The combined key would overflow int64: group the code tuples directly (slower).
+        uniq, inverse = np.unique(np.column_stack(columns), axis=0, return_inverse=True)
+        key_codes = list(uniq.T)
+    parts = []
+    for key, codes in zip(keys, key_codes):
+        _, table = KEYS[key]
+        parts.append([bool(c) for c in codes] if table is None
+                     else getattr(store, table).decode(codes))
+    labels = parts[0] if len(keys) == 1 else list(zip(*parts))
+    return inverse.reshape(-1), labels
+
+
+def _column_stats(ids: np.ndarray, values: np.ndarray, n_groups: int, qs) -> dict:
+    valid = ~np.isnan(values)
+    g, v = ids[valid], values[valid]
+    order = np.lexsort((v, g))
+    v = v[order]
+    counts = np.bincount(g, minlength=n_groups)
+    sums = np.bincount(g, weights=values[valid], minlength=n_groups)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    has = counts > 0
+    last = np.where(has, starts + counts - 1, 0)
+    first = np.where(has, starts, 0)
+    pick = (lambda idx: np.where(has, v[idx], 0)) if v.size else (lambda idx: np.zeros(n_groups))
+    quantiles = {}
+    for q in qs:
+        idx = starts + np.minimum(np.floor(q * counts).astype(np.int64), np.maximum(counts - 1, 0))
+        quantiles[q] = pick(np.where(has, idx, 0))
+    return {
+        "count": counts,
+        "sum": sums,
+        "min": pick(first),
+        "max": pick(last),
+        "quantiles": quantiles,
+    }
+
+
+def _summaries(lo: dict, hi: dict, percentiles) -> list[dict]:
+    """Per-group dicts with the same keys as ``compute_salary_stats``."""
+    n = len(lo["count"])
+    avg_lo = np.divide(lo["sum"], lo["count"], out=np.zeros(n), where=lo["count"] > 0)
+    avg_hi = np.divide(hi["sum"], hi["count"], out=np.zeros(n), where=hi["count"] > 0)
+    out = []
+    for i in range(n):
+        summary = {
+            "min_low": int(lo["min"][i]),
+            "max_high": int(hi["max"][i]),
+            "avg_low": round(float(avg_lo[i])),
+            "avg_high": round(float(avg_hi[i])),
+            "median_low": int(lo["quantiles"][0.5][i]),
+            "median_high": int(hi["quantiles"][0.5][i]),
+            "sample_count": int(lo["count"][i]),
+        }
+        for side, stats in (("low", lo), ("high", hi)):
+            by_quantile = {q: values[i] for q, values in stats["quantiles"].items()}
+            summary.update(percentile_fields(by_quantile, side, percentiles))
+        out.append(summary)
+    return out
+
+
+def group_salary_stats(store: ListingStore, by="category", mask=None,
+                       percentiles=REPORT_PERCENTILES) -> dict:
+    """Salary summary per group: ``{label: {min_low, …, p90_high, iqr_high}}``.
+
+    ``by`` is one key from ``KEYS`` or a sequence of them; ``mask``
+    restricts the rows first.
+    """
+    if mask is not None:
+        store = store.select(mask)
+    ids, labels = group_ids(store, by)
+    qs = summary_quantiles(percentiles)
+    lo = _column_stats(ids, store.salary_low, len(labels), qs)
+    hi = _column_stats(ids, store.salary_high, len(labels), qs)
+    return dict(zip(labels, _summaries(lo, hi, percentiles)))
+
+
+def salary_summary(store: ListingStore, mask=None, percentiles=REPORT_PERCENTILES) -> dict:
+    """One salary summary over all rows (of ``mask``), keyed like ``group_salary_stats``."""
+    if mask is not None:
+        store = store.select(mask)
+    ids = np.zeros(len(store), dtype=np.int64)
+    qs = summary_quantiles(percentiles)
+    lo = _column_stats(ids, store.salary_low, 1, qs)
+    hi = _column_stats(ids, store.salary_high, 1, qs)
+    return _summaries(lo, hi, percentiles)[0]
+
+
+def empty_summary(percentiles=REPORT_PERCENTILES) -> dict:
+    zeros = {"count": np.zeros(1, dtype=np.int64), "sum": np.zeros(1), "min": np.zeros(1),
+             "max": np.zeros(1), "quantiles": {q: np.zeros(1) for q in summary_quantiles(percentiles)}}
+    return _summaries(zeros, zeros, percentiles)[0]
+
+
+def category_breakdown(store: ListingStore) -> dict:
+    """Every category's Dice total, overall salary summary and Nashville/national split."""
+    overall = group_salary_stats(store, "category")
+    split = group_salary_stats(store, ("category", "is_local"))
+    empty = empty_summary()
+    out = {}
+    for code, name in enumerate(store.categories.values):
+        out[name] = {
+            "total_results": int(store.total_results[code]),
+            **overall.get(name, empty),
+            "nashville": split.get((name, True), empty),
+            "national": split.get((name, False), empty),
+        }
+    return out
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Incremental Re-Analysis
+=======================
+Keeps per-category partial aggregates (counts, sums, min/max and quantile
+sketches) on disk next to ``nashville_analysis_data.json`` so that a new
+Dice pull only costs as much as the postings it adds.
+
+Each category keeps one cursor per source list (``nashville_local`` and
+``national_salary_samples_annual``): how many entries it has absorbed
+and a hash chain over them, including the digest before the last link.
+On ``sync`` only the tail past each cursor is flattened, hashed and
+folded in, so an append to either list stays incremental. The last
+absorbed entry is re-hashed against the chain as a check. A list that
+shrank or whose last absorbed entry changed gets its category rebuilt on
+its own. Earlier edits are not detected, because the sources are
+append-only; delete the aggregates file to force a full rebuild.
+National and Nashville figures are then re-derived by merging the
+per-category sketches, which costs O(categories), not O(postings).
+
+The refreshed figures go under ``incremental_stats`` in the JSON
+summary. They count every posting, so they are not deduplicated; the
+deduplicated ``market_stats``/``nashville_stats`` written by
+``nashville_market_analysis.py`` are left alone.
+
+Usage:
+    python3 incremental.py          # sync with market_searches, refresh incremental_stats
+"""
+
+import hashlib
+import json
+import os
+
+from salary_aggregator import DEFAULT_ERROR, SalaryAggregator, iter_postings
+
+AGGREGATES_PATH = "nashville_analysis_aggregates.json"
+STATE_VERSION = 2
+
+# The source lists of a ``market_searches`` category; each is its own append-only chain.
+SOURCES = ("nashville_local", "national_salary_samples_annual")
+
+_EMPTY_DIGEST = hashlib.sha256(b"").hexdigest()
+
+
+def _chain(digest: str, posting: dict) -> str:
+    payload = json.dumps(posting, sort_keys=True, default=str).encode()
+    return hashlib.sha256(digest.encode() + payload).hexdigest()
+
+
+def _source(posting: dict) -> str:
+    return SOURCES[0] if posting.get("nashville_local") else SOURCES[1]
+
+
+class CategoryState:
+    """Partial aggregates for one search category, with a cursor per source list."""
+
+    def __init__(self, error: float = DEFAULT_ERROR):
+        self.all = SalaryAggregator(error)
+        self.local = SalaryAggregator(error)
+        self.counts = dict.fromkeys(SOURCES, 0)
+        self.digests = dict.fromkeys(SOURCES, _EMPTY_DIGEST)
+        self.prev_digests = dict.fromkeys(SOURCES, _EMPTY_DIGEST)  # chain before the last entry
+        self.total_results = 0
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts.values())
+
+    def fold(self, posting: dict):
+        lo, hi = posting["salary_annual_low"], posting["salary_annual_high"]
+        self.all.add(lo, hi)
+        if posting.get("nashville_local"):
+            self.local.add(lo, hi)
+        source = _source(posting)
+        self.counts[source] += 1
+        self.prev_digests[source] = self.digests[source]
+        self.digests[source] = _chain(self.digests[source], posting)
+
+    def extends(self, name: str, data: dict, source: str) -> bool:
+        """Whether ``data[source]`` still starts with the entries absorbed so far.
+
+        O(1): the list must not have shrunk and its last absorbed entry must re-hash to
+        the stored chain digest.
+        """
+        entries, n = data.get(source, []), self.counts[source]
+        if len(entries) < n:
+            return False
+        if n == 0:
+            return True
+        last = next(iter_postings({name: {source: entries[n - 1:n]}}))
+        return _chain(self.prev_digests[source], last) == self.digests[source]
+
+    def to_dict(self) -> dict:
+        return {"all": self.all.to_dict(), "local": self.local.to_dict(), "counts": self.counts,
+                "digests": self.digests, "prev_digests": self.prev_digests,
+                "total_results": self.total_results}
+
+    @classmethod
+    def from_dict(cls, state: dict) -> "CategoryState":
+        cat = cls.__new__(cls)
+        cat.all = SalaryAggregator.from_dict(state["all"])
+        cat.local = SalaryAggregator.from_dict(state["local"])
+        cat.counts = state["counts"]
+        cat.digests = state["digests"]
+        cat.prev_digests = state["prev_digests"]
+        cat.total_results = state["total_results"]
+        return cat
+
+
+class IncrementalAnalysis:
+    """Persisted per-category aggregates that absorb only new postings."""
+
+    def __init__(self, path: str = AGGREGATES_PATH, error: float = DEFAULT_ERROR):
+        self.path = path
+        self.error = error
+        self.categories: dict[str, CategoryState] = {}
+        self.folded = 0  # postings folded since load — the cost of the last update
+
+    @classmethod
+    def load(cls, path: str = AGGREGATES_PATH, error: float = DEFAULT_ERROR) -> "IncrementalAnalysis":
+        inc = cls(path, error)
+        try:
+            with open(path) as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return inc
+        if state.get("version") != STATE_VERSION or state.get("error") != error:
+            return inc  # incompatible state: start over rather than mix sketches
+        inc.categories = {name: CategoryState.from_dict(c) for name, c in state["categories"].items()}
+        return inc
+
+    def save(self):
+        state = {
+            "version": STATE_VERSION,
+            "error": self.error,
+            "categories": {name: c.to_dict() for name, c in self.categories.items()},
+        }
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp, self.path)
+
+    def _category(self, name: str) -> CategoryState:
+        cat = self.categories.get(name)
+        if cat is None:
+            cat = self.categories[name] = CategoryState(self.error)
+        return cat
+
+    def fold(self, postings):
+        """Fold an append-only batch of new postings (flat dicts with a ``category``)."""
+        for posting in postings:
+            self._category(posting["category"]).fold(posting)
+            self.folded += 1
+
+    def sync(self, search_data: dict) -> dict:
+        """Bring the aggregates in line with ``search_data``; returns what changed per category.
+
+        Costs O(new postings) plus O(1) per source list, not O(corpus).
+        """
+        changes = {}
+        for name, data in search_data.items():
+            cat = self._category(name)
+            cat.total_results = data.get("total_results", 0)
+            if all(cat.extends(name, data, source) for source in SOURCES):
+                tail = {source: data.get(source, [])[cat.counts[source]:] for source in SOURCES}
+                added = sum(map(len, tail.values()))
+                if added:
+                    self.fold(iter_postings({name: tail}))
+                    changes[name] = f"+{added}"
+            else:
+                self.categories[name] = CategoryState(self.error)
+                self.categories[name].total_results = cat.total_results
+                self.fold(iter_postings({name: data}))
+                changes[name] = "rebuilt"
+        for name in set(self.categories) - set(search_data):
+            del self.categories[name]
+            changes[name] = "removed"
+        return changes
+
+    def summary(self) -> dict:
+        """Market, Nashville and per-category stats merged from the partial aggregates."""
+        market = SalaryAggregator(self.error)
+        nashville = SalaryAggregator(self.error)
+        for cat in self.categories.values():
+            market.merge(cat.all)
+            nashville.merge(cat.local)
+        return {
+            "market_stats": market.summary(),
+            "nashville_stats": nashville.summary(),
+            "category_stats": {name: c.all.summary() for name, c in self.categories.items()},
+            "total_listings_analyzed": sum(c.total_results for c in self.categories.values()),
+        }
+
+
+# ── MAIN ──
+
+if __name__ == "__main__":
+    from datetime import datetime
+
+    from nashville_market_analysis import candidate, market_searches, value_proposition
+
+    json_path = "nashville_analysis_data.json"
+    inc = IncrementalAnalysis.load(os.path.join(os.path.dirname(os.path.abspath(json_path)), AGGREGATES_PATH))
+    changes = inc.sync(market_searches)
+    inc.save()
+    summary = inc.summary()
+
+    try:
+        with open(json_path) as f:
+            json_data = json.load(f)
+    except FileNotFoundError:
+        json_data = {"candidate": candidate}
+    # Streamed over every posting, not deduplicated: kept apart from the deduplicated
+    # market_stats/nashville_stats that nashville_market_analysis.py writes.
+    json_data["incremental_stats"] = {
+        "deduplicated": False,
+        "market_stats": summary["market_stats"],
+        "nashville_stats": summary["nashville_stats"],
+        "value_proposition": value_proposition(
+            candidate["asking_salary"], summary["market_stats"], summary["nashville_stats"]),
+        "total_listings_analyzed": summary["total_listings_analyzed"],
+        "generated_at": datetime.now().isoformat(),
+    }
+    with open(json_path, "w") as f:
+        json.dump(json_data, f, indent=2, default=str)
+
+    for name, change in changes.items():
+        print(f"  {name:<32} {change}")
+    print(f"✅ Folded {inc.folded} posting(s) into {inc.path}")
+    print(f"✅ Structured data refreshed: {json_path}")
@@ -0,0 +1,408 @@
+"""
+Bulk Posting Ingestion
+======================
+Loads job postings into a ListingStore from files (JSONL, CSV) or from an
+HTTP job-search API, in chunks, with salary annualization done on whole
+columns at once.
+
+Every source yields flat *records* with the fields in ``RECORD_FIELDS``.
+Salaries arrive in the unit the posting used (``salary_unit`` = "year" or
+"hour"); hourly rates are annualized at 2,080 hours/year in
+``annualize``, never by hand.
+
+The API side is behind the ``JobSearchSource`` interface. The bundled
+``HttpJobSearchClient`` keeps a pool of keep-alive connections, fetches
+result pages concurrently, retries transient failures with exponential
+backoff and caches responses on disk. ``fake_dice_server.py`` serves the
+same protocol locally.
+"""
+
+import csv
+import email.utils
+import hashlib
+import http.client
+import json
+import math
+import os
+import queue
+import random
+import time
+import urllib.parse
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import numpy as np
+
+from label_parser import parse_label
+from listing_store import ListingStore, ListingStoreBuilder
+
+HOURS_PER_YEAR = 2080
+
+RECORD_FIELDS = ("category", "title", "company", "location", "type", "workplace",
+                 "salary_min", "salary_max", "salary_unit", "nashville_local")
+
+DEFAULT_CHUNK_SIZE = 50_000
+DEFAULT_CACHE_TTL = 3600.0  # seconds an API response stays fresh on disk
+MAX_RETRY_DELAY = 60.0      # cap on a server-requested Retry-After wait
+
+
+class IngestionError(RuntimeError):
+    """A source could not be read (after retries, for remote sources)."""
+
+
+# ── SALARY NORMALIZATION ──
+
+def _to_float(values) -> np.ndarray:
+    """Column of raw salary values (numbers, numeric strings, None/"") → float64 with NaN."""
+    return np.array([np.nan if v is None or v == "" else v for v in values], dtype=np.float64)
+
+
+def annualize(lows: np.ndarray, highs: np.ndarray, units) -> tuple[np.ndarray, np.ndarray]:
+    """Convert hourly rates to annual salaries (× 2,080) for a whole chunk at once."""
+    hourly = np.char.lower(np.asarray(units, dtype=str)) == "hour"
+    factor = np.where(hourly, HOURS_PER_YEAR, 1.0)
+    return lows * factor, highs * factor
+
+
+def _truthy(values) -> np.ndarray:
+    return np.fromiter((v in (True, 1, "1", "true", "True", "yes") for v in values),
+                       dtype=bool, count=len(values))
+
+
+# ── FILE SOURCES ──
+
+def read_jsonl(path: str):
+    """Yield records from a JSON-lines file (``.gz`` is decompressed transparently)."""
+    opener = _open_text(path)
+    with opener as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                raise IngestionError(f"{path}:{line_no}: {e}") from e
+
+
+def read_csv(path: str):
+    """Yield records from a CSV file with a ``RECORD_FIELDS`` header."""
+    with _open_text(path) as f:
+        yield from csv.DictReader(f)
+
+
+def _open_text(path: str):
+    if path.endswith(".gz"):
+        import gzip
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+    return open(path, encoding="utf-8", newline="")
+
+
+def read_records(path: str):
+    """Pick the reader from the file extension."""
+    base = path[:-3] if path.endswith(".gz") else path
+    if base.endswith(".csv"):
+        return read_csv(path)
+    if base.endswith((".jsonl", ".ndjson")):
+        return read_jsonl(path)
+    raise IngestionError(f"unsupported input format: {path}")
+
+
+def write_jsonl(records, path) -> int:
+    """Write one JSON object per line to ``path`` (a file name or an open text stream)."""
+    if not isinstance(path, str):
+        return _dump_jsonl(records, path)
+    with open(path, "w", encoding="utf-8") as f:
+        return _dump_jsonl(records, f)
+
+
+def _dump_jsonl(records, f) -> int:
+    n = 0
+    for rec in records:
+        f.write(json.dumps(rec, separators=(",", ":")))
+        f.write("\n")
+        n += 1
+    return n
+
+
+def write_csv(records, path: str) -> int:
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=RECORD_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        n = 0
+        for rec in records:
+            writer.writerow(rec)
+            n += 1
+    return n
+
+
+# ── STORE LOADING ──
+
+def _chunks(records, size: int):
+    chunk = []
+    for rec in records:
+        chunk.append(rec)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def record_salaries(chunk: list[dict]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Annualized lows, highs and the Nashville-local flag for a chunk of records."""
+    lows, highs = annualize(_to_float([rec.get("salary_min") for rec in chunk]),
+                            _to_float([rec.get("salary_max") for rec in chunk]),
+                            [rec.get("salary_unit") or "year" for rec in chunk])
+    return lows, highs, _truthy([rec.get("nashville_local") for rec in chunk])
+
+
+def ingest_chunk(builder: ListingStoreBuilder, chunk: list[dict], default_category: str = ""):
+    """Normalize one chunk of records column-wise and append it to ``builder``."""
+    def col(name, default=""):
+        return [rec.get(name) or default for rec in chunk]
+
+    lows, highs, local = record_salaries(chunk)
+    cats = [builder.categories.code(c) if c in builder.categories else builder.add_category(c)
+            for c in col("category", default_category)]
+    builder.extend(cats, col("title"), col("company"), col("location"), col("workplace"),
+                   col("type"), lows, highs, local)
+
+
+def load_records(records, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 category_totals: dict | None = None) -> ListingStore:
+    """Build a ListingStore from any record iterable, ``chunk_size`` records at a time."""
+    builder = ListingStoreBuilder()
+    for name, total in (category_totals or {}).items():
+        builder.add_category(name, total)
+    for chunk in _chunks(records, chunk_size):
+        ingest_chunk(builder, chunk)
+    return builder.build()
+
+
+def load_files(paths, chunk_size: int = DEFAULT_CHUNK_SIZE) -> ListingStore:
+    """Bulk-load JSONL/CSV files (optionally gzipped) into one ListingStore."""
+    def records():
+        for path in paths:
+            yield from read_records(path)
+    store = load_records(records(), chunk_size)
+    # Without an API total, a category's result count is what was loaded.
+    counts = np.bincount(store.category, minlength=len(store.categories))
+    store.total_results = np.maximum(store.total_results, counts)
+    return store
+
+
+def records_from_market_searches(search_data: dict):
+    """Flatten ``market_searches`` into ingestion records (already annual)."""
+    for name, data in search_data.items():
+        for job in data.get("nashville_local", []):
+            yield {"category": name, "title": job["title"], "company": job["company"],
+                   "location": job.get("location", ""), "type": job.get("type", ""),
+                   "workplace": job.get("workplace", ""), "salary_min": job["salary_annual_low"],
+                   "salary_max": job["salary_annual_high"], "salary_unit": "year",
+                   "nashville_local": True}
+        for label, lo, hi in data.get("national_salary_samples_annual", []):
+            fields = parse_label(label)
+            yield {"category": name, "title": fields.title, "company": fields.company,
+                   "location": fields.location, "type": fields.type,
+                   "workplace": fields.workplace, "salary_min": lo, "salary_max": hi,
+                   "salary_unit": "year", "nashville_local": False}
+
+
+# ── API SOURCES ──
+
+def retry_delay(retry_after: str | None, fallback: float) -> float:
+    """Seconds to wait before retrying, from a ``Retry-After`` header value.
+
+    Accepts both forms the header allows, delta-seconds (``"120"``) and an
+    HTTP-date. Uses ``fallback`` (the backoff) when the header is absent or
+    unparseable, and caps the wait at ``MAX_RETRY_DELAY``.
+    """
+    if not retry_after:
+        return fallback
+    try:
+        delay = float(retry_after)
+    except ValueError:
+        try:
+            when = email.utils.parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return fallback
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        delay = (when - datetime.now(timezone.utc)).total_seconds()
+    return min(max(delay, 0.0), MAX_RETRY_DELAY)
+
+
+class JobSearchSource(ABC):
+    """Interface for a paginated job-search API."""
+
+    @abstractmethod
+    def search_page(self, query: str, page: int, page_size: int) -> dict:
+        """Return ``{"total": int, "page": int, "results": [record, ...]}``."""
+
+    @abstractmethod
+    def total_jobs(self) -> int:
+        """Total tech postings on the board, the denominator of the report's market share."""
+
+    def search_all(self, query: str, page_size: int = 100) -> tuple[int, list[dict]]:
+        """Every result for ``query``: (reported total, records)."""
+        first = self.search_page(query, 1, page_size)
+        records = list(first["results"])
+        pages = math.ceil(first["total"] / page_size)
+        for page in range(2, pages + 1):
+            records.extend(self.search_page(query, page, page_size)["results"])
+        return first["total"], records
+
+
+class ResponseCache:
+    """On-disk JSON cache for API responses, keyed by request URL.
+
+    Entries older than ``ttl`` seconds are misses; ``ttl=None`` keeps them forever.
+    """
+
+    def __init__(self, cache_dir: str, ttl: float | None = DEFAULT_CACHE_TTL):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, hashlib.sha256(key.encode()).hexdigest() + ".json")
+
+    def get(self, key: str):
+        path = self._path(key)
+        try:
+            if self.ttl is not None and time.time() - os.path.getmtime(path) > self.ttl:
+                return None
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def put(self, key: str, payload):
+        path = self._path(key)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        os.replace(tmp, path)
+
+
+class HttpJobSearchClient(JobSearchSource):
+    """Job-search API client with a keep-alive connection pool, retries and caching.
+
+    Endpoints (see ``fake_dice_server.py``):
+        GET /v1/jobs/search?q=<query>&page=<n>&page_size=<m>
+        GET /v1/jobs/count
+    """
+
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+    def __init__(self, base_url: str, pool_size: int = 8, max_retries: int = 4,
+                 backoff: float = 0.25, timeout: float = 30.0, cache_dir: str | None = None,
+                 cache_ttl: float | None = DEFAULT_CACHE_TTL):
+        parts = urllib.parse.urlsplit(base_url)
+        self.scheme, self.host, self.port = parts.scheme, parts.hostname, parts.port
+        self.base_path = parts.path.rstrip("/")
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.cache = ResponseCache(cache_dir, cache_ttl) if cache_dir else None
+        self._pool: queue.LifoQueue = queue.LifoQueue(maxsize=pool_size)
+        self.requests_sent = 0
+
+    def _connect(self) -> http.client.HTTPConnection:
+        cls = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+        return cls(self.host, self.port, timeout=self.timeout)
+
+    def _acquire(self) -> http.client.HTTPConnection:
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            return self._connect()
+
+    def _release(self, conn: http.client.HTTPConnection):
+        try:
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def close(self):
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def get_json(self, path: str, params: dict | None = None):
+        url = f"{self.base_path}{path}"
+        if params:
+            url += "?" + urllib.parse.urlencode(params)
+        if self.cache:
+            cached = self.cache.get(url)
+            if cached is not None:
+                return cached
+        payload = self._get_with_retry(url)
+        if self.cache:
+            self.cache.put(url, payload)
+        return payload
+
+    def _get_with_retry(self, url: str):
+        for attempt in range(self.max_retries + 1):
+            conn = self._acquire()
+            retry_after = None
+            try:
+                conn.request("GET", url, headers={"Accept": "application/json"})
+                resp = conn.getresponse()
+                body = resp.read()
+                self.requests_sent += 1
+                if resp.status == 200:
+                    self._release(conn)
+                    return json.loads(body)
+                self._release(conn)
+                if resp.status not in self.RETRY_STATUSES:
+                    raise IngestionError(f"GET {url} → HTTP {resp.status}")
+                error = f"HTTP {resp.status}"
+                retry_after = resp.getheader("Retry-After")
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()  # broken connection: never return it to the pool
+                error = repr(e)
+            if attempt == self.max_retries:
+                raise IngestionError(f"GET {url} failed after {attempt + 1} attempts: {error}")
+            delay = retry_delay(retry_after, self.backoff * 2 ** attempt)
+            time.sleep(delay * (1 + random.random() * 0.25))
+
+    def search_page(self, query: str, page: int, page_size: int) -> dict:
+        return self.get_json("/v1/jobs/search", {"q": query, "page": page, "page_size": page_size})
+
+    def total_jobs(self) -> int:
+        return int(self.get_json("/v1/jobs/count")["total"])
+
+    def search_all(self, query: str, page_size: int = 100) -> tuple[int, list[dict]]:
+        """First page serially (to learn the page count), the rest concurrently."""
+        first = self.search_page(query, 1, page_size)
+        pages = math.ceil(first["total"] / page_size)
+        records = list(first["results"])
+        if pages > 1:
+            with ThreadPoolExecutor(max_workers=self.pool_size) as pool:
+                rest = pool.map(lambda p: self.search_page(query, p, page_size)["results"],
+                                range(2, pages + 1))
+                for results in rest:  # map() preserves page order
+                    records.extend(results)
+        return first["total"], records
+
+
+def fetch_market(source: JobSearchSource, categories, page_size: int = 100,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE) -> ListingStore:
+    """Run every category search against ``source`` and load the results."""
+    totals, records = {}, []
+    for name in categories:
+        totals[name], results = source.search_all(name, page_size)
+        records.extend({**rec, "category": name} for rec in results)
+    return load_records(records, chunk_size, totals)
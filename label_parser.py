@@ -0,0 +1,122 @@
+"""
+Posting Label Parser
+====================
+Splits the packed labels of ``national_salary_samples_annual`` —
+``"Senior Data Analyst – UnitedHealth (Remote)"`` — into the fields that
+``nashville_local`` postings carry (title, company, workplace, type,
+location), so both kinds of posting share one schema.
+
+A label is ``<title>[ – <company>][ (<qualifier>)]``:
+
+* the company is whatever follows the last spaced dash (en, em or ASCII
+  hyphen), so ``Data Analyst - Senior - Acme`` names Acme and
+  ``Analyst – Coca-Cola`` keeps its hyphen. Some labels put a
+  specialization there instead: a tech stack (``Data Analyst –
+  SQL/Python``) or a domain from ``SPECIALIZATIONS`` (``Data Analyst –
+  Healthcare``). That text stays in the title and the company is left
+  empty;
+* a trailing qualifier naming an arrangement sets ``workplace``
+  (Remote, Telework, Hybrid, On-Site) or ``type`` (Full-time, Contract,
+  …); words after an arrangement become the location (``On-Site CA``);
+  any other trailing parenthetical is the location when it follows a
+  company (``Citi (NYC)``) and stays in the title otherwise
+  (``Lead ML Engineer (Python)``).
+
+Parsing is batched and memoized: each distinct label is matched once
+with precompiled patterns and its fields are interned, so repeated
+labels cost a dictionary lookup.
+"""
+
+import re
+import sys
+from typing import NamedTuple
+
+_LABEL = re.compile(r"^\s*(?P<title>.*?)(?:\s+[–—-]\s+(?P<company>(?:(?!\s[–—-]\s).)*?))?"
+                    r"(?:\s*\((?P<qualifier>[^()]*)\))?\s*$", re.S)
+
+# Domains that labels name where the company goes; compared case-insensitively.
+SPECIALIZATIONS = frozenset({"governance", "healthcare", "security", "signal processing"})
+
+# Leading qualifier word(s) → (field, canonical value). Canonical values match
+# the seeded tables in ``listing_store``.
+_ARRANGEMENTS = [
+    (re.compile(r"^(?:100%\s+)?(?:remote|telework|telecommute)\b", re.I), "workplace", "Remote"),
+    (re.compile(r"^hybrid\b", re.I), "workplace", "Hybrid"),
+    (re.compile(r"^(?:on-?site|in-office)\b", re.I), "workplace", "On-Site"),
+    (re.compile(r"^(?:contract[- ]to[- ]hire|c2h)\b", re.I), "type", "Contract-to-Hire"),
+    (re.compile(r"^contract\b", re.I), "type", "Contract"),
+    (re.compile(r"^full[- ]?time\b", re.I), "type", "Full-time"),
+    (re.compile(r"^part[- ]?time\b", re.I), "type", "Part-time"),
+]
+
+FIELDS = ("title", "company", "workplace", "type", "location")
+
+
+class ParsedLabel(NamedTuple):
+    title: str
+    company: str
+    workplace: str
+    type: str
+    location: str
+
+
+def _is_specialization(text: str) -> bool:
+    return "/" in text or text.strip().lower() in SPECIALIZATIONS
+
+
+def _parse(label: str) -> ParsedLabel:
+    m = _LABEL.match(label)
+    title, company, qualifier = m["title"], m["company"] or "", (m["qualifier"] or "").strip()
+    if company and _is_specialization(company):
+        title, company = label[m.start("title"):m.end("company")], ""
+    fields = {"workplace": "", "type": "", "location": ""}
+    for pattern, field, value in _ARRANGEMENTS if qualifier else ():
+        hit = pattern.match(qualifier)
+        if hit:
+            fields[field] = value
+            fields["location"] = qualifier[hit.end():].strip(" ,/–-")
+            break
+    else:
+        if company:
+            fields["location"] = qualifier
+        elif qualifier:
+            title = f"{title} ({qualifier})"
+    intern = sys.intern
+    return ParsedLabel(intern(title.strip()), intern(company.strip()), fields["workplace"],
+                       fields["type"], intern(fields["location"]))
+
+
+class LabelParser:
+    """Memoizing parser; one instance can be shared across every batch of a load."""
+
+    def __init__(self):
+        self._cache: dict[str, ParsedLabel] = {}
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def parse(self, label: str) -> ParsedLabel:
+        parsed = self._cache.get(label)
+        if parsed is None:
+            parsed = self._cache[label] = _parse(label)
+        return parsed
+
+    def parse_many(self, labels) -> dict[str, list[str]]:
+        """Column-wise fields (``FIELDS`` → list) for a batch of labels."""
+        parsed = list(map(self._cache.get, labels))
+        if None in parsed:  # first sighting of some labels
+            parsed = [p or self.parse(label) for p, label in zip(parsed, labels)]
+        if not parsed:
+            return {f: [] for f in FIELDS}
+        return dict(zip(FIELDS, map(list, zip(*parsed))))
+
+
+_default = LabelParser()
+
+
+def parse_label(label: str) -> ParsedLabel:
+    return _default.parse(label)
+
+
+def parse_labels(labels) -> dict[str, list[str]]:
+    return _default.parse_many(labels)
@@ -0,0 +1,268 @@
+"""
+Columnar Listing Store
+======================
+Holds job postings as parallel NumPy arrays instead of nested dicts so
+salary statistics can be computed with vectorized reductions.
+
+Each posting is one row. Free-text fields (title, company, location) are
+stored as integer codes into a shared, interned string table; workplace
+and employment type are small enum codes; salaries are float64 with NaN
+marking "not posted" (the DOE rows).
+"""
+
+import hashlib
+from array import array
+
+import numpy as np
+
+from label_parser import parse_labels
+
+# Seed values for the enum tables. Unseen values are appended on demand,
+# so these only fix the codes of the common cases.
+WORKPLACES = ("", "On-Site", "Hybrid", "Remote")
+JOB_TYPES = ("", "Full-time", "Contract", "Contract-to-Hire")
+
+
+class StringTable:
+    """Interned strings: each distinct value is stored once and referenced by code."""
+
+    def __init__(self, values=()):
+        self.values: list[str] = []
+        self._codes: dict[str, int] = {}
+        self._lengths = np.zeros(0, dtype=np.int32)
+        for value in values:
+            self.intern(value)
+
+    def intern(self, value: str) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self._codes[value] = code
+            self.values.append(value)
+        return code
+
+    def code(self, value: str) -> int:
+        """Code of an existing value, or -1 if it was never interned."""
+        return self._codes.get(value, -1)
+
+    def decode(self, codes) -> list[str]:
+        values = self.values
+        return [values[c] for c in codes]
+
+    def lengths(self) -> np.ndarray:
+        """Character length of every interned value, indexed by code.
+
+        Computed incrementally: only values interned since the last call are measured.
+        """
+        known = len(self._lengths)
+        if known < len(self.values):
+            new = np.fromiter(map(len, self.values[known:]), dtype=np.int32,
+                              count=len(self.values) - known)
+            self._lengths = np.concatenate((self._lengths, new))
+        return self._lengths
+
+    def __getitem__(self, code: int) -> str:
+        return self.values[code]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __contains__(self, value: str) -> bool:
+        return value in self._codes
+
+
+class ListingStore:
+    """Parallel column arrays for a set of postings plus their lookup tables."""
+
+    COLUMNS = ("category", "is_local", "salary_low", "salary_high",
+               "workplace", "job_type", "title", "company", "location")
+
+    def __init__(self, columns: dict, categories: StringTable, strings: StringTable,
+                 workplaces: StringTable, job_types: StringTable,
+                 total_results: np.ndarray, notes: dict | None = None,
+                 content_hash: str | None = None):
+        self.category = columns["category"]        # uint16 → categories
+        self.is_local = columns["is_local"]        # bool, True for Nashville-local rows
+        self.salary_low = columns["salary_low"]    # float64, NaN = not posted
+        self.salary_high = columns["salary_high"]  # float64, NaN = not posted
+        self.workplace = columns["workplace"]      # uint8 → workplaces
+        self.job_type = columns["job_type"]        # uint8 → job_types
+        self.title = columns["title"]              # int32 → strings
+        self.company = columns["company"]          # int32 → strings
+        self.location = columns["location"]        # int32 → strings
+        self.categories = categories
+        self.strings = strings
+        self.workplaces = workplaces
+        self.job_types = job_types
+        self.total_results = total_results         # int64, one per category
+        self.notes = notes or {}
+        self._content_hash = content_hash          # known up front for snapshots
+
+    def __len__(self) -> int:
+        return len(self.category)
+
+    def columns(self) -> dict:
+        return {name: getattr(self, name) for name in self.COLUMNS}
+
+    def select(self, mask) -> "ListingStore":
+        """Row subset (boolean mask or index array) sharing this store's tables."""
+        return ListingStore({name: col[mask] for name, col in self.columns().items()},
+                            self.categories, self.strings, self.workplaces, self.job_types,
+                            self.total_results, self.notes)
+
+    def local(self) -> "ListingStore":
+        return self.select(self.is_local)
+
+    def salaries(self) -> tuple[np.ndarray, np.ndarray]:
+        """Posted lows and highs, each with its missing values dropped."""
+        lows, highs = self.salary_low, self.salary_high
+        return lows[~np.isnan(lows)], highs[~np.isnan(highs)]
+
+    def content_hash(self) -> str:
+        """SHA-256 over every column buffer and lookup table (computed once; columns are never mutated)."""
+        if self._content_hash is not None:
+            return self._content_hash
+        h = hashlib.sha256()
+        for name, col in self.columns().items():
+            h.update(name.encode())
+            h.update(np.ascontiguousarray(col).tobytes())
+        for table in (self.categories, self.strings, self.workplaces, self.job_types):
+            h.update("\x1f".join(table.values).encode())
+            h.update(b"\x1e")
+        h.update(self.total_results.tobytes())
+        self._content_hash = h.hexdigest()
+        return self._content_hash
+
+    def category_mask(self, name: str) -> np.ndarray:
+        return self.category == self.categories.code(name)
+
+    def rows(self, mask=None):
+        """Yield postings as dicts — for display code, not for statistics.
+
+        ``mask`` is a boolean mask or an array of row indices (yielded in that order).
+        """
+        if mask is None:
+            idx = np.arange(len(self))
+        else:
+            mask = np.asarray(mask)
+            idx = np.flatnonzero(mask) if mask.dtype == bool else mask
+        s, cats, wps, types = self.strings, self.categories, self.workplaces, self.job_types
+        for i in idx:
+            lo, hi = self.salary_low[i], self.salary_high[i]
+            yield {
+                "category": cats[self.category[i]],
+                "title": s[self.title[i]],
+                "company": s[self.company[i]],
+                "location": s[self.location[i]],
+                "type": types[self.job_type[i]],
+                "workplace": wps[self.workplace[i]],
+                "salary_annual_low": None if np.isnan(lo) else float(lo),
+                "salary_annual_high": None if np.isnan(hi) else float(hi),
+                "nashville_local": bool(self.is_local[i]),
+            }
+
+
+class ListingStoreBuilder:
+    """Accumulates postings row by row into compact typed buffers."""
+
+    def __init__(self):
+        self.categories = StringTable()
+        self.strings = StringTable([""])
+        self.workplaces = StringTable(WORKPLACES)
+        self.job_types = StringTable(JOB_TYPES)
+        self.total_results: list[int] = []
+        self.notes: dict[str, str] = {}
+        self._category = array("H")
+        self._is_local = array("B")
+        self._low = array("d")
+        self._high = array("d")
+        self._workplace = array("B")
+        self._job_type = array("B")
+        self._title = array("i")
+        self._company = array("i")
+        self._location = array("i")
+
+    def add_category(self, name: str, total_results: int = 0, notes: str | None = None) -> int:
+        code = self.categories.intern(name)
+        if code == len(self.total_results):
+            self.total_results.append(total_results)
+        else:
+            self.total_results[code] = total_results
+        if notes:
+            self.notes[name] = notes
+        return code
+
+    def add(self, category: int, title: str, company: str = "", location: str = "",
+            workplace: str = "", job_type: str = "", salary_low=None, salary_high=None,
+            is_local: bool = False):
+        intern = self.strings.intern
+        self._category.append(category)
+        self._is_local.append(is_local)
+        self._low.append(np.nan if salary_low is None else salary_low)
+        self._high.append(np.nan if salary_high is None else salary_high)
+        self._workplace.append(self.workplaces.intern(workplace or ""))
+        self._job_type.append(self.job_types.intern(job_type or ""))
+        self._title.append(intern(title))
+        self._company.append(intern(company or ""))
+        self._location.append(intern(location or ""))
+
+    def extend(self, categories, titles, companies, locations, workplaces, job_types,
+               salary_low: np.ndarray, salary_high: np.ndarray, is_local: np.ndarray):
+        """Append a chunk of rows given column-wise; salaries are NaN where not posted."""
+        self._category.extend(np.asarray(categories, dtype=np.uint16).tolist())
+        self._is_local.extend(np.asarray(is_local, dtype=np.uint8).tolist())
+        self._low.frombytes(np.ascontiguousarray(salary_low, dtype=np.float64).tobytes())
+        self._high.frombytes(np.ascontiguousarray(salary_high, dtype=np.float64).tobytes())
+        self._workplace.extend(map(self.workplaces.intern, workplaces))
+        self._job_type.extend(map(self.job_types.intern, job_types))
+        intern = self.strings.intern
+        self._title.extend(map(intern, titles))
+        self._company.extend(map(intern, companies))
+        self._location.extend(map(intern, locations))
+
+    def build(self) -> ListingStore:
+        columns = {
+            "category": np.frombuffer(self._category, dtype=np.uint16).copy(),
+            "is_local": np.frombuffer(self._is_local, dtype=np.uint8).astype(bool),
+            "salary_low": np.frombuffer(self._low, dtype=np.float64).copy(),
+            "salary_high": np.frombuffer(self._high, dtype=np.float64).copy(),
+            "workplace": np.frombuffer(self._workplace, dtype=np.uint8).copy(),
+            "job_type": np.frombuffer(self._job_type, dtype=np.uint8).copy(),
+            "title": np.frombuffer(self._title, dtype=np.int32).copy(),
+            "company": np.frombuffer(self._company, dtype=np.int32).copy(),
+            "location": np.frombuffer(self._location, dtype=np.int32).copy(),
+        }
+        return ListingStore(columns, self.categories, self.strings, self.workplaces,
+                            self.job_types, np.array(self.total_results, dtype=np.int64),
+                            dict(self.notes))
+
+
+def build_listing_store(search_data: dict) -> ListingStore:
+    """Convert the nested ``market_searches`` layout into a ListingStore.
+
+    National sample labels are split into title/company/workplace/type by
+    ``label_parser``, so national rows share the local rows' columns.
+    """
+    builder = ListingStoreBuilder()
+    for name, data in search_data.items():
+        cat = builder.add_category(name, data.get("total_results", 0), data.get("notes"))
+        for job in data.get("nashville_local", []):
+            builder.add(cat, job["title"], job["company"], job.get("location", ""),
+                        job.get("workplace", ""), job.get("type", ""),
+                        job["salary_annual_low"], job["salary_annual_high"], is_local=True)
+        samples = data.get("national_salary_samples_annual", [])
+        if samples:
+            labels, lows, highs = zip(*samples)
+            f = parse_labels(labels)
+            builder.extend([cat] * len(labels), f["title"], f["company"], f["location"],
+                           f["workplace"], f["type"],
+                           np.array(lows, dtype=np.float64), np.array(highs, dtype=np.float64),
+                           np.zeros(len(labels), dtype=bool))
+    return builder.build()
+
+
+def as_listing_store(data) -> ListingStore:
+    """Accept either a ListingStore or a ``market_searches``-style dict."""
+    if isinstance(data, ListingStore):
+        return data
+    return build_listing_store(data)
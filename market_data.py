@@ -0,0 +1,254 @@
+"""
+Market Data
+===========
+The candidate profile and the Dice.com search results (Nashville, TN
+25-mi radius + remote, scraped 2026-02-14) that the analysis runs on.
+
+Kept apart from the analysis code so that importing the analysis does not
+build these literals; ``nashville_market_analysis`` loads this module on
+first use.
+"""
+
+candidate = {
+    "name": "Joshua Jones",
+    "location": "Indianapolis, IN",
+    "target_market": "Nashville, TN",
+    "asking_salary": 60_000,
+    "asking_hourly": round(60_000 / 2080, 2),
+    "education": "BS Data Analytics – Western Governors University (expected Dec 2026)",
+    "certifications": [
+        "CompTIA A+",
+        "CompTIA Data+",
+        "CompTIA Cloud+",
+        "CompTIA Network+",
+        "Anthropic Advanced MCP",
+    ],
+    "core_skills": [
+        "Python",
+        "JavaScript / Node.js",
+        "AI / ML",
+        "Model Context Protocol (MCP)",
+        "Power BI",
+        "Excel",
+        "Data Visualization & Dashboarding",
+        "Revenue Forecasting & Profitability Modeling",
+        "Customer Behavior Analytics",
+        "APIs & Webhooks (Square, proprietary)",
+        "Cursor AI Tooling",
+    ],
+    "experience_highlights": [
+        "Engineered predictive revenue models for 12 storefronts using AI (Cursor)",
+        "Automated Node.js dashboards for Marketing team",
+        "Extracted/analyzed high-volume customer & sales data via Square APIs",
+        "4 CompTIA certs + Anthropic Advanced MCP certification",
+        "Multi-discipline background: data, development, creative, e-commerce",
+    ],
+}
+
+# ── DICE JOB MARKET DATA (Nashville, TN 25-mi radius + remote — Feb 14, 2026) ──
+# Salaries annualized where needed; hourly rates × 2,080 hrs/yr.
+
+market_searches = {
+    "Data Analyst": {
+        "total_results": 144,
+        "nashville_local": [
+            {"title": "Senior Data Analyst", "company": "Ascension Health", "location": "Nashville, TN",
+             "type": "Full-time", "workplace": "Hybrid", "salary_annual_low": 70_000, "salary_annual_high": 100_000},
+            {"title": "SAP Data Analyst", "company": "Judge Group", "location": "Brentwood, TN",
+             "type": "Contract", "workplace": "On-Site", "salary_annual_low": 104_000, "salary_annual_high": 124_800},
+        ],
+        "national_salary_samples_annual": [
+            ("Data Analyst – Healthcare (Remote)", 52_000, 72_800),
+            ("Data Analyst 5 – Healthcare (Remote)", 122_013, 142_813),
+            ("SAP Data Analyst – Governance (Remote)", 139_360, 156_000),
+            ("Business Data Analyst (Remote)", 104_000, 104_000),
+            ("Data Analyst – SQL/Python (Remote)", 104_000, 114_400),
+            ("Data Analyst – Mass General (Full-time)", 53_040, 75_889),
+            ("Senior Data Analyst – Guardian Life (Full-time)", 79_310, 130_295),
+            ("Data Analyst – QinetiQ (Full-time)", 100_000, 120_000),
+            ("Data Analyst – Robert Half (Contract)", 104_000, 124_800),
+            ("School Data Analyst – Stride K12 (Full-time)", 58_000, 60_000),
+            ("Data Analyst II – Centene (Full-time)", 56_200, 101_000),
+            ("Spatial Data Analyst – Cushman & Wakefield (Full-time)", 68_000, 80_000),
+            ("Senior Data Analyst – UnitedHealth (Remote)", 89_900, 160_600),
+            ("Lead Data Analyst – Northwestern Mutual (Hybrid)", 92_750, 92_750),
+            ("Senior Enterprise Data Analyst – M&T Bank (Hybrid)", 125_600, 209_400),
+            ("IT Data Analyst II – Centene (Full-time)", 63_600, 114_600),
+            ("Senior IT Data Analyst – Centene (Full-time)", 75_300, 135_400),
+            ("Full Stack Data Analyst – M&T Bank (Full-time)", 54_080, 90_147),
+            ("Data Analyst – Cardinal Health (Full-time)", 80_900, 115_500),
+            ("Life Sciences Data Analyst – Guidehouse (Full-time)", 113_000, 188_000),
+            ("Architecture Lead Data Analyst VP – Citi (Full-time)", 142_320, 213_480),
+            ("Data Analyst, Clinical – DaVita (Full-time)", 57_784, 85_000),
+            ("Data Analytics Lead Analyst VP – Citi (Full-time)", 113_840, 170_760),
+            ("Master & Reference Data Sr. Lead – Citi (Full-time)", 156_160, 234_240),
+            ("VP Global Workforce Data Lead – Citi (Full-time)", 113_840, 170_760),
+            ("Senior Data Programmer Analyst – Boeing (Full-time)", 141_950, 192_050),
+            ("Provider Data Mgmt Analyst I – Centene (Full-time)", 40_414, 68_598),
+            ("Sr Clinical Data Analyst – Roth Staffing (Contract)", 99_840, 105_269),
+            ("Data Analyst – IT Heroes (Contract)", 104_000, 114_400),
+            ("Data Analyst – Vaco Healthcare (Contract)", 121_867, 121_867),
+        ],
+    },
+    "Python Developer": {
+        "total_results": 83,
+        "nashville_local": [
+            {"title": "Python Data Azure Engineer", "company": "SIAL Technology", "location": "Nashville, TN",
+             "type": "Contract", "workplace": "Hybrid", "salary_annual_low": None, "salary_annual_high": None},
+            {"title": "Python Analytics Developer", "company": "SIAL Technology", "location": "Nashville, TN",
+             "type": "Contract", "workplace": "Hybrid", "salary_annual_low": None, "salary_annual_high": None},
+            {"title": "Python Analytics Developer", "company": "SANS", "location": "Nashville, TN",
+             "type": "Contract", "workplace": "On-Site", "salary_annual_low": 166_400, "salary_annual_high": 208_000},
+            {"title": "Team Lead Software (C#/Python)", "company": "SIAL Technology", "location": "Nashville, TN",
+             "type": "Full-time", "workplace": "On-Site", "salary_annual_low": None, "salary_annual_high": None},
+        ],
+        "national_salary_samples_annual": [
+            ("Python & Data Analytics Developer – Security (Remote)", 135_000, 155_000),
+            ("Technical Ops Analyst w/ Python (Remote)", 100_000, 170_000),
+            ("Python Web App Developer – SAIC (Remote)", 120_001, 160_000),
+            ("Senior Python Software Engineer (Remote)", 140_000, 160_000),
+            ("Lead Python Engineer – S&P (Remote)", 100_000, 150_000),
+            ("Python DB Developer – Citi (NYC)", 121_200, 181_800),
+            ("Senior Systems Engineer – ServiceNow (Full-time)", 140_700, 239_200),
+            ("Staff Systems Engineer – ServiceNow (Full-time)", 140_700, 239_200),
+            ("Lead Python Engineer – Morgan Stanley (Remote)", 150_000, 210_000),
+            ("Lead ML Engineer (Python) – Target (Full-time)", 132_000, 286_000),
+            ("Senior Python Developer – Accenture (Contract)", 106_080, 126_880),
+            ("AI & Python Engineering Lead VP – Citi (Full-time)", 142_320, 213_480),
+            ("Python & Database Developer AVP – Citi (Full-time)", 121_200, 181_800),
+            ("Senior GenAI Python Developer VP – Citi (Full-time)", 142_320, 213_480),
+            ("Benchling Developer w/ Python – Excelra (Contract)", 83_200, 93_600),
+            ("Reliability Engineer (Python/MATLAB) – OSI (Contract)", 124_800, 156_000),
+        ],
+    },
+    "AI / ML Engineer": {
+        "total_results": 1_062,
+        "nashville_local": [
+            {"title": "AI Engineer", "company": "Jobot (AI Startup)", "location": "Nashville, TN",
+             "type": "Full-time", "workplace": "On-Site", "salary_annual_low": 175_000, "salary_annual_high": 200_000},
+            {"title": "Sr AI Research Engineer", "company": "Vanderbilt University", "location": "Nashville, TN",
+             "type": "Full-time", "workplace": "On-Site", "salary_annual_low": None, "salary_annual_high": None},
+        ],
+        "national_salary_samples_annual": [
+            ("Senior AI/ML Engineer – UnitedHealth (Remote)", 91_700, 163_700),
+            ("Principal AI/ML Engineer – UnitedHealth (Remote)", 134_600, 230_800),
+            ("Staff ML Engineer – Coinbase (Remote)", 218_025, 256_500),
+            ("ML Engineer Risk – Coinbase (Remote)", 161_500, 190_000),
+            ("Junior AI Engineer – Tria Federal (Remote)", 80_000, 100_000),
+            ("AI/ML Engineer – Booz Allen (Full-time)", 86_800, 198_000),
+            ("AI/ML Engineer – Lockheed Martin (Telework)", 89_300, 157_435),
+            ("Lead AI/ML Solutions Architect – Booz Allen (Full-time)", 112_800, 257_000),
+            ("Principal AI/ML Engineer – Leidos (Full-time)", 131_300, 237_350),
+            ("Full Stack AI/ML Engineer – Lockheed Martin (Full-time)", 89_300, 157_435),
+            ("AI/ML Engineer Clearance – LMI (Full-time)", 110_986, 195_154),
+        ],
+    },
+    "Business Intelligence Analyst": {
+        "total_results": 213,
+        "nashville_local": [
+            {"title": "Senior BI Analyst", "company": "Vaco by Highspring", "location": "Nashville, TN (Green Hills)",
+             "type": "Contract-to-Hire", "workplace": "Hybrid", "salary_annual_low": 135_200, "salary_annual_high": 145_600},
+            {"title": "Sr. BI Engineer", "company": "Vaco by Highspring", "location": "Brentwood, TN",
+             "type": "Contract-to-Hire", "workplace": "Hybrid", "salary_annual_low": 156_000, "salary_annual_high": 176_800},
+            {"title": "BI Developer", "company": "Nobl Q", "location": "Nashville, TN",
+             "type": "Contract", "workplace": "On-Site", "salary_annual_low": None, "salary_annual_high": None},
+            {"title": "Sr. BI Engineer (Remote, Nashville co.)", "company": "Vaco by Highspring", "location": "Remote",
+             "type": "Contract-to-Hire", "workplace": "Remote", "salary_annual_low": 135_200, "salary_annual_high": 166_400},
+            {"title": "Business Analyst II", "company": "Apex Systems", "location": "Nashville, TN",
+             "type": "Contract", "workplace": "On-Site", "salary_annual_low": 62_400, "salary_annual_high": 70_720},
+            {"title": "Sr. Associate – Transaction Analytics", "company": "Alvarez & Marsal", "location": "Nashville, TN",
+             "type": "Full-time", "workplace": "On-Site", "salary_annual_low": 130_000, "salary_annual_high": 130_000},
+        ],
+        "national_salary_samples_annual": [
+            ("Sr Analyst, Data Analytics & BI – Comcast (Remote)", 78_016, 117_025),
+            ("Senior BI & Data Engineer (Remote)", 112_112, 160_160),
+            ("Lead BI Developer – Launch Potato (Remote)", 120_000, 150_000),
+            ("Senior Tableau BI Analyst – ICF (Remote)", 108_476, 184_409),
+            ("IS Business Intelligence Analyst – Robert Half (Contract)", 62_400, 68_640),
+        ],
+    },
+    "Power BI / Data Visualization": {
+        "total_results": 29,
+        "nashville_local": [
+            {"title": "Power BI Developer/Analyst", "company": "OtterBase", "location": "Nashville, TN",
+             "type": "Full-time", "workplace": "On-Site", "salary_annual_low": 90_000, "salary_annual_high": 95_000},
+        ],
+        "national_salary_samples_annual": [
+            ("BI Developer – Robert Half (Remote)", 108_160, 118_560),
+            ("BI Solutions Architect (On-Site CA)", 145_600, 145_600),
+            ("Senior Data Analyst Power BI – UnitedHealth (Remote)", 91_700, 163_700),
+            ("Power BI Analyst – Randstad (Contract)", 62_400, 83_200),
+            ("Data Science Analyst Power BI – Stefanini (Contract)", 156_000, 166_400),
+            ("Power BI Fabric Solution (Remote)", 120_000, 150_000),
+            ("Data Literacy Specialist (Power BI) – HonorVet (Contract)", 124_800, 145_600),
+        ],
+    },
+    "MCP / AI Automation": {
+        "total_results": 158,
+        "nashville_local": [],
+        "national_salary_samples_annual": [
+            ("Staff Cyber AI Researcher – Leidos (Remote)", 107_900, 195_050),
+            ("Principal Agentic AI Systems Engineer – Leidos (Remote)", 131_300, 237_350),
+            ("Principal AI Automation – Vertex (Contract)", 135_200, 176_800),
+            ("Junior AI Engineer – Tria Federal (Remote)", 80_000, 100_000),
+            ("Sr Python & Data Analytics Developer – Security (Remote)", 135_000, 155_000),
+            ("Lead AI/ML Engineer – UnitedHealth (Remote)", 112_700, 193_200),
+            ("Director AI – ServiceNow (Full-time)", 221_200, 387_100),
+            ("Analytics Engineer 5 – Netflix (Full-time)", 330_000, 566_000),
+        ],
+        "notes": "MCP is an emerging protocol (Anthropic). Only a handful of job listings "
+                 "explicitly require it, making certified MCP practitioners extremely rare.",
+    },
+    "Node.js / JavaScript Developer": {
+        "total_results": 105,
+        "nashville_local": [
+            {"title": "Sr Software Engineer", "company": "Robert Half", "location": "Nashville, TN",
+             "type": "Contract", "workplace": "On-Site", "salary_annual_low": 112_320, "salary_annual_high": 128_960},
+        ],
+        "national_salary_samples_annual": [
+            ("Senior Software Engineer – JS/React/Node.js (Remote)", 150_000, 150_000),
+            ("Full Stack Developer – USG (Remote)", 100_920, 134_520),
+            (".NET Full Stack Developer (On-Site)", 130_000, 130_000),
+            ("Data Visualization Engineer – Netflix (Remote)", 260_000, 380_000),
+            ("Fullstack Developer NodeJS – Enterprise Solution (Contract)", 135_200, 145_600),
+        ],
+    },
+    "Data Scientist": {
+        "total_results": 128,
+        "nashville_local": [
+            {"title": "Senior Data Scientist", "company": "Oracle", "location": "Nashville, TN",
+             "type": "Full-time", "workplace": "Hybrid", "salary_annual_low": 91_100, "salary_annual_high": 199_500},
+        ],
+        "national_salary_samples_annual": [
+            ("Principal Data Scientist – Maximus (Remote)", 156_740, 156_740),
+            ("Ops Research Data Scientist (Contract)", 156_000, 176_800),
+            ("Data Scientist II GenAI – Robert Half (Contract)", 119_000, 180_000),
+            ("Data Scientist II – ITC (Contract)", 145_600, 145_600),
+            ("Sr Staff Data Scientist – GE Vernova (Full-time)", 144_800, 217_200),
+            ("Lead Observability Data Scientist – Leidos (Full-time)", 131_300, 237_350),
+            ("Senior Data Scientist – Guidehouse (Full-time)", 113_000, 188_000),
+            ("CORP Data Scientist – Mitchell Martin (Contract)", 96_824, 138_320),
+            ("Sr. Computer Vision Data Scientist (Full-time)", 165_000, 190_000),
+            ("Data Scientist – Signal Processing (Contract)", 156_000, 197_600),
+            ("Data Scientist – Kforce (Contract)", 120_640, 135_200),
+            ("Data Scientist – Market Street Talent (Contract)", 104_000, 124_800),
+        ],
+    },
+    "Data Engineer": {
+        "total_results": 292,
+        "nashville_local": [
+            {"title": "Data Engineer", "company": "Kforce", "location": "Nashville, TN",
+             "type": "Contract", "workplace": "Hybrid", "salary_annual_low": 124_800, "salary_annual_high": 145_600},
+        ],
+        "national_salary_samples_annual": [
+            ("IT Data Engineer – Randstad (Contract)", 47_840, 58_240),
+            ("IT Sr Data Engineer – Randstad (Contract)", 52_000, 72_800),
+            ("Data Engineer – Stefanini (Contract)", 212_160, 222_560),
+            ("100% Remote Data Engineer – Whiz (Contract)", 124_800, 145_600),
+            ("Snowflake Data Engineer – Indianapolis (Contract)", 135_200, 145_600),
+            ("Azure Data Engineer (Contract)", 99_840, 99_840),
+            ("Infrastructure Data Engineer (Contract)", 114_400, 135_200),
+            ("Sr Data Engineer Cloud – Bayside (Contract)", 114_400, 135_200),
+        ],
+    },
+}
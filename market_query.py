@@ -0,0 +1,298 @@
+"""
+Market Slice Queries
+====================
+Ad-hoc slices of a ListingStore — "Remote Contract roles in Data Engineer
+or Data Scientist", "Nashville Hybrid only" — as filter expressions
+instead of hand loops:
+
+    q = (category("Data Engineer", "Data Scientist") & workplace("Remote")
+         & job_type("Contract"))
+    MarketQuery(store).summary(q)
+    MarketQuery(store).top(local() & ~workplace("On-Site"), 5)
+
+Every field value has a precomputed bitmap: one bit per row, packed eight
+rows to a byte. Enum fields (category, workplace, type, is_local) get
+theirs by comparison. Interned text fields (company, location, title) go
+through a CSR postings index built once per field, so one company costs
+only its own rows. ``&``, ``|`` and ``~`` on expressions become
+``bitwise_and``/``or``/``not`` over the packed bytes. The resulting row
+set feeds any aggregator: salary summary, group-by stats, top-K or the
+asking-salary curve.
+
+Expressions are immutable and hashable. Field bitmaps, combined bitmaps
+and aggregate results are kept in an LRU cache keyed by expression, so a
+repeated slice is a lookup. The cache is bounded by ``CACHE_BYTES``, the
+approximate memory its entries hold. It stores packed bitmaps (n/8 bytes
+per slice), never boolean masks or row arrays; ``mask`` and ``rows``
+unpack a fresh array per call. Cached arrays are read-only, and cached
+aggregates are handed out as copies (a curve as new containers over its
+read-only arrays), so a caller modifying a result never changes the
+cache.
+"""
+
+import copy
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import numpy as np
+
+from group_stats import KEYS, group_salary_stats, salary_summary
+from listing_store import ListingStore
+from ranking import OpeningRanker
+from salary_sweep import SalaryCurve
+
+CACHE_BYTES = 64 * 2**20
+
+# Fields whose codes index a shared interned-string table; looked up through postings lists.
+TEXT_FIELDS = ("company", "title", "location")
+
+# Set bits in each byte value, for NumPy < 2.0 (no ``np.bitwise_count``).
+_BYTE_POPCOUNT = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1)
+
+
+def popcount(bits: np.ndarray) -> int:
+    """Set bits in a packed uint8 bitmap."""
+    if hasattr(np, "bitwise_count"):
+        return int(np.bitwise_count(bits).sum())
+    return int(_BYTE_POPCOUNT[bits].sum())
+
+
+def _nbytes(value) -> int:
+    """Approximate memory held by a cached value: array buffers plus Python containers."""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(_nbytes(k) + _nbytes(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(_nbytes(v) for v in value)
+    if hasattr(value, "__dict__"):
+        return _nbytes(vars(value))
+    return sys.getsizeof(value)
+
+
+class Expr:
+    """A row filter; combine with ``&`` (AND), ``|`` (OR) and ``~`` (NOT)."""
+
+    def __and__(self, other: "Expr") -> "Expr":
+        return And((self, other))
+
+    def __or__(self, other: "Expr") -> "Expr":
+        return Or((self, other))
+
+    def __invert__(self) -> "Expr":
+        return Not(self)
+
+
+@dataclass(frozen=True)
+class Field(Expr):
+    """Rows whose ``name`` column holds any of ``values``."""
+    name: str
+    values: tuple
+
+
+@dataclass(frozen=True)
+class And(Expr):
+    parts: tuple
+
+
+@dataclass(frozen=True)
+class Or(Expr):
+    parts: tuple
+
+
+@dataclass(frozen=True)
+class Not(Expr):
+    part: Expr
+
+
+@dataclass(frozen=True)
+class All(Expr):
+    """Every row."""
+
+
+ALL = All()
+
+
+def field(name: str, *values) -> Field:
+    if name not in KEYS:
+        raise ValueError(f"unknown field {name!r}; expected one of {sorted(KEYS)}")
+    return Field(name, tuple(sorted(set(values), key=str)))
+
+
+def category(*names) -> Field:
+    return field("category", *names)
+
+
+def workplace(*names) -> Field:
+    return field("workplace", *names)
+
+
+def job_type(*names) -> Field:
+    return field("type", *names)
+
+
+def company(*names) -> Field:
+    return field("company", *names)
+
+
+def location(*names) -> Field:
+    return field("location", *names)
+
+
+def local(flag: bool = True) -> Field:
+    """Nashville-local rows (or, with ``flag=False``, national ones)."""
+    return field("is_local", bool(flag))
+
+
+class MarketQuery:
+    """Bitmap-indexed filters and cached aggregates over one store."""
+
+    def __init__(self, store: ListingStore, cache_bytes: int = CACHE_BYTES):
+        self.store = store
+        self.n_rows = len(store)
+        self.cache_bytes = cache_bytes
+        self.cached_bytes = 0
+        self._postings: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        self._cache: OrderedDict = OrderedDict()
+        self._ranker: OpeningRanker | None = None
+        self.hits = self.misses = 0
+
+    # ── bitmaps ──
+
+    def _codes(self, name: str, value) -> list[int]:
+        column, table = KEYS[name]
+        if table is None:
+            return [int(bool(value))]
+        code = getattr(self.store, table).code(value)
+        return [code] if code >= 0 else []
+
+    def _postings_list(self, name: str) -> tuple[np.ndarray, np.ndarray]:
+        """(rows sorted by code, offsets per code) for a text field."""
+        if name not in self._postings:
+            codes = getattr(self.store, KEYS[name][0])
+            order = np.argsort(codes, kind="stable")
+            counts = np.bincount(codes, minlength=len(self.store.strings))
+            self._postings[name] = order, np.concatenate(([0], np.cumsum(counts)))
+        return self._postings[name]
+
+    def _leaf(self, name: str, value) -> np.ndarray:
+        def compute():
+            codes = self._codes(name, value)
+            if not codes:
+                mask = np.zeros(self.n_rows, dtype=bool)
+            elif name in TEXT_FIELDS:
+                order, offsets = self._postings_list(name)
+                mask = np.zeros(self.n_rows, dtype=bool)
+                mask[order[offsets[codes[0]]:offsets[codes[0] + 1]]] = True
+            else:
+                mask = getattr(self.store, KEYS[name][0]) == codes[0]
+            return np.packbits(mask)
+        return self._cached(("leaf", name, value), compute)
+
+    def _clear_tail(self, bits: np.ndarray) -> np.ndarray:
+        """Zero the padding bits past the last row (set by NOT/ALL)."""
+        if self.n_rows % 8:
+            bits[-1] &= np.uint8((0xFF << (8 - self.n_rows % 8)) & 0xFF)
+        return bits
+
+    def bitmap(self, expr: Expr) -> np.ndarray:
+        """Packed row bitmap (``np.packbits`` layout, zero-padded) for ``expr``.
+
+        The array is cached and read-only; copy it before modifying.
+        """
+        if isinstance(expr, Field) and len(expr.values) == 1:
+            return self._leaf(expr.name, expr.values[0])
+        return self._cached(("bits", expr), lambda: self._combine(expr))
+
+    def _combine(self, expr: Expr) -> np.ndarray:
+        if isinstance(expr, All):
+            return self._clear_tail(np.full((self.n_rows + 7) // 8, 0xFF, dtype=np.uint8))
+        if isinstance(expr, Field):
+            bits = [self._leaf(expr.name, v) for v in expr.values]
+            if not bits:
+                return np.zeros((self.n_rows + 7) // 8, dtype=np.uint8)
+            return np.bitwise_or.reduce(bits)
+        if isinstance(expr, Not):
+            return self._clear_tail(np.invert(self.bitmap(expr.part)))
+        if isinstance(expr, (And, Or)):
+            op = np.bitwise_and if isinstance(expr, And) else np.bitwise_or
+            out = self.bitmap(expr.parts[0]).copy()
+            for part in expr.parts[1:]:
+                op(out, self.bitmap(part), out=out)
+            return out
+        raise TypeError(f"not a query expression: {expr!r}")
+
+    # ── cache ──
+
+    def _cached(self, key, compute):
+        if key in self._cache:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return self._cache[key][0]
+        self.misses += 1
+        value = compute()
+        if isinstance(value, np.ndarray):
+            value.flags.writeable = False
+        size = _nbytes(value)
+        if size <= self.cache_bytes:
+            self._cache[key] = value, size
+            self.cached_bytes += size
+            while self.cached_bytes > self.cache_bytes:
+                _, (_, evicted) = self._cache.popitem(last=False)
+                self.cached_bytes -= evicted
+        return value
+
+    def clear_cache(self):
+        self._cache.clear()
+        self.cached_bytes = 0
+        self.hits = self.misses = 0
+
+    # ── row sets ──
+
+    def mask(self, expr: Expr) -> np.ndarray:
+        """Boolean row mask for ``expr``, unpacked from the cached bitmap."""
+        return np.unpackbits(self.bitmap(expr), count=self.n_rows).view(bool)
+
+    def rows(self, expr: Expr) -> np.ndarray:
+        return np.flatnonzero(self.mask(expr))
+
+    def count(self, expr: Expr) -> int:
+        """Rows matching ``expr``, by popcount over the bitmap."""
+        return self._cached(("count", expr), lambda: popcount(self.bitmap(expr)))
+
+    def select(self, expr: Expr) -> ListingStore:
+        return self.store.select(self.rows(expr))
+
+    # ── aggregates ──
+
+    def summary(self, expr: Expr) -> dict:
+        """Salary summary of the slice, keyed like ``compute_salary_stats``."""
+        return copy.deepcopy(self._cached(("summary", expr),
+                                          lambda: salary_summary(self.store, self.rows(expr))))
+
+    def stats(self, expr: Expr, by="category") -> dict:
+        """Per-group salary summaries of the slice (see ``group_salary_stats``)."""
+        key = ("stats", expr, by if isinstance(by, str) else tuple(by))
+        return copy.deepcopy(self._cached(key, lambda: group_salary_stats(self.store, by,
+                                                                          self.rows(expr))))
+
+    def top(self, expr: Expr, k: int = 10, by: str = "midpoint") -> list[dict]:
+        """The best ``k`` openings of the slice, as ``OpeningRanker.records``."""
+        if self._ranker is None:
+            self._ranker = OpeningRanker(self.store)
+        ranker = self._ranker
+        return copy.deepcopy(self._cached(
+            ("top", expr, k, by), lambda: ranker.records(ranker.top(k, by, mask=self.mask(expr)), by)))
+
+    def curve(self, expr: Expr) -> SalaryCurve:
+        """Asking-salary percentiles for the slice (``SalaryCurve.lookup``/``sweep``)."""
+        def build():
+            curve = SalaryCurve.build(self.select(expr))
+            for segment in curve.segments.values():
+                for column in segment.values():
+                    column.flags.writeable = False
+            return curve
+        cached = self._cached(("curve", expr), build)
+        # New containers, shared read-only columns: no O(n) copy per call.
+        return SalaryCurve({name: dict(segment) for name, segment in cached.segments.items()})
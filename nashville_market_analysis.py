@@ -10,370 +10,216 @@ Author: AI-assisted analysis
 Date:   February 14, 2026
 """
 
+import functools
+import hashlib
+import importlib.util
 import json
+import os
+import pickle
 from datetime import datetime
-from collections import Counter
+from collections import Counter, OrderedDict
+from typing import TYPE_CHECKING
+
+# numpy and the analysis modules load on first use, in the functions and
+# AnalysisContext properties that need them, so importing this module (or
+# running ``cli.py`` against a warm cache) stays cheap.
+if TYPE_CHECKING:
+    import numpy as np
+
+    from dedup import DuplicateReport
+    from listing_store import ListingStore
+    from market_query import MarketQuery
+    from ranking import OpeningRanker
+    from salary_sweep import SalaryCurve
+    from skill_matrix import SkillMatrix
+    from term_index import TermIndex
 
 TOTAL_DICE_TECH_JOBS = 68_718
 
-candidate = {
-    "name": "Joshua Jones",
-    "location": "Indianapolis, IN",
-    "target_market": "Nashville, TN",
-    "asking_salary": 60_000,
-    "asking_hourly": round(60_000 / 2080, 2),
-    "education": "BS Data Analytics – Western Governors University (expected Dec 2026)",
-    "certifications": [
-        "CompTIA A+",
-        "CompTIA Data+",
-        "CompTIA Cloud+",
-        "CompTIA Network+",
-        "Anthropic Advanced MCP",
-    ],
-    "core_skills": [
-        "Python",
-        "JavaScript / Node.js",
-        "AI / ML",
-        "Model Context Protocol (MCP)",
-        "Power BI",
-        "Excel",
-        "Data Visualization & Dashboarding",
-        "Revenue Forecasting & Profitability Modeling",
-        "Customer Behavior Analytics",
-        "APIs & Webhooks (Square, proprietary)",
-        "Cursor AI Tooling",
-    ],
-    "experience_highlights": [
-        "Engineered predictive revenue models for 12 storefronts using AI (Cursor)",
-        "Automated Node.js dashboards for Marketing team",
-        "Extracted/analyzed high-volume customer & sales data via Square APIs",
-        "4 CompTIA certs + Anthropic Advanced MCP certification",
-        "Multi-discipline background: data, development, creative, e-commerce",
-    ],
+
+def __getattr__(name):
+    # ``candidate`` and ``market_searches`` live in market_data, loaded on first use.
+    if name in ("candidate", "market_searches"):
+        import market_data
+        return getattr(market_data, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# ── ANALYSIS ──
+
+def _summarize_salaries(lows: "np.ndarray", highs: "np.ndarray") -> dict:
+    """Min/max/mean plus exact median and percentiles over posted lows and highs."""
+    from order_stats import salary_percentiles
+
+    low_q = salary_percentiles(lows, "low")
+    high_q = salary_percentiles(highs, "high")
+    return {
+        "min_low": int(lows.min()) if lows.size else 0,
+        "max_high": int(highs.max()) if highs.size else 0,
+        "avg_low": round(float(lows.sum()) / lows.size) if lows.size else 0,
+        "avg_high": round(float(highs.sum()) / highs.size) if highs.size else 0,
+        "median_low": low_q.pop("median_low"),
+        "median_high": high_q.pop("median_high"),
+        "sample_count": int(lows.size),
+        **low_q,
+        **high_q,
+    }
+
+
+def compute_salary_stats(search_data) -> dict:
+    """Aggregate salary ranges across all search categories."""
+    from listing_store import as_listing_store
+
+    store = as_listing_store(search_data)
+    return _summarize_salaries(*store.salaries())
+
+
+def compute_nashville_salary_stats(search_data) -> dict:
+    """Salary stats specifically for Nashville-local jobs."""
+    from listing_store import as_listing_store
+
+    store = as_listing_store(search_data)
+    return _summarize_salaries(*store.local().salaries())
+
+
+# Title phrases that count as a mention of each skill (any one suffices), and
+# the search category whose every result counts as one.
+SKILL_TERMS = {
+    "MCP": ("mcp", "model context protocol"),
+    "AI / ML": ("ai", "ml", "machine learning", "genai", "agentic"),
+    "Data Analytics": ("data analyst", "analytics", "data analysis"),
+    "CompTIA": ("comptia",),
+    "Power BI / Visualization": ("power bi", "visualization", "tableau", "bi"),
+    "Forecasting": ("forecasting", "forecast"),
+    "Python": ("python",),
+    "APIs": ("api", "apis", "webhooks", "integration"),
+    "JavaScript / Node.js": ("javascript", "node", "nodejs", "js"),
 }
 
-# ── DICE JOB MARKET DATA (Nashville, TN 25-mi radius + remote — Feb 14, 2026) ──
-# Salaries annualized where needed; hourly rates × 2,080 hrs/yr.
-
-market_searches = {
-    "Data Analyst": {
-        "total_results": 144,
-        "nashville_local": [
-            {"title": "Senior Data Analyst", "company": "Ascension Health", "location": "Nashville, TN",
-             "type": "Full-time", "workplace": "Hybrid", "salary_annual_low": 70_000, "salary_annual_high": 100_000},
-            {"title": "SAP Data Analyst", "company": "Judge Group", "location": "Brentwood, TN",
-             "type": "Contract", "workplace": "On-Site", "salary_annual_low": 104_000, "salary_annual_high": 124_800},
-        ],
-        "national_salary_samples_annual": [
-            ("Data Analyst – Healthcare (Remote)", 52_000, 72_800),
-            ("Data Analyst 5 – Healthcare (Remote)", 122_013, 142_813),
-            ("SAP Data Analyst – Governance (Remote)", 139_360, 156_000),
-            ("Business Data Analyst (Remote)", 104_000, 104_000),
-            ("Data Analyst – SQL/Python (Remote)", 104_000, 114_400),
-            ("Data Analyst – Mass General (Full-time)", 53_040, 75_889),
-            ("Senior Data Analyst – Guardian Life (Full-time)", 79_310, 130_295),
-            ("Data Analyst – QinetiQ (Full-time)", 100_000, 120_000),
-            ("Data Analyst – Robert Half (Contract)", 104_000, 124_800),
-            ("School Data Analyst – Stride K12 (Full-time)", 58_000, 60_000),
-            ("Data Analyst II – Centene (Full-time)", 56_200, 101_000),
-            ("Spatial Data Analyst – Cushman & Wakefield (Full-time)", 68_000, 80_000),
-            ("Senior Data Analyst – UnitedHealth (Remote)", 89_900, 160_600),
-            ("Lead Data Analyst – Northwestern Mutual (Hybrid)", 92_750, 92_750),
-            ("Senior Enterprise Data Analyst – M&T Bank (Hybrid)", 125_600, 209_400),
-            ("IT Data Analyst II – Centene (Full-time)", 63_600, 114_600),
-            ("Senior IT Data Analyst – Centene (Full-time)", 75_300, 135_400),
-            ("Full Stack Data Analyst – M&T Bank (Full-time)", 54_080, 90_147),
-            ("Data Analyst – Cardinal Health (Full-time)", 80_900, 115_500),
-            ("Life Sciences Data Analyst – Guidehouse (Full-time)", 113_000, 188_000),
-            ("Architecture Lead Data Analyst VP – Citi (Full-time)", 142_320, 213_480),
-            ("Data Analyst, Clinical – DaVita (Full-time)", 57_784, 85_000),
-            ("Data Analytics Lead Analyst VP – Citi (Full-time)", 113_840, 170_760),
-            ("Master & Reference Data Sr. Lead – Citi (Full-time)", 156_160, 234_240),
-            ("VP Global Workforce Data Lead – Citi (Full-time)", 113_840, 170_760),
-            ("Senior Data Programmer Analyst – Boeing (Full-time)", 141_950, 192_050),
-            ("Provider Data Mgmt Analyst I – Centene (Full-time)", 40_414, 68_598),
-            ("Sr Clinical Data Analyst – Roth Staffing (Contract)", 99_840, 105_269),
-            ("Data Analyst – IT Heroes (Contract)", 104_000, 114_400),
-            ("Data Analyst – Vaco Healthcare (Contract)", 121_867, 121_867),
-        ],
-    },
-    "Python Developer": {
-        "total_results": 83,
-        "nashville_local": [
-            {"title": "Python Data Azure Engineer", "company": "SIAL Technology", "location": "Nashville, TN",
-             "type": "Contract", "workplace": "Hybrid", "salary_annual_low": None, "salary_annual_high": None},
-            {"title": "Python Analytics Developer", "company": "SIAL Technology", "location": "Nashville, TN",
-             "type": "Contract", "workplace": "Hybrid", "salary_annual_low": None, "salary_annual_high": None},
-            {"title": "Python Analytics Developer", "company": "SANS", "location": "Nashville, TN",
-             "type": "Contract", "workplace": "On-Site", "salary_annual_low": 166_400, "salary_annual_high": 208_000},
-            {"title": "Team Lead Software (C#/Python)", "company": "SIAL Technology", "location": "Nashville, TN",
-             "type": "Full-time", "workplace": "On-Site", "salary_annual_low": None, "salary_annual_high": None},
-        ],
-        "national_salary_samples_annual": [
-            ("Python & Data Analytics Developer – Security (Remote)", 135_000, 155_000),
-            ("Technical Ops Analyst w/ Python (Remote)", 100_000, 170_000),
-            ("Python Web App Developer – SAIC (Remote)", 120_001, 160_000),
-            ("Senior Python Software Engineer (Remote)", 140_000, 160_000),
-            ("Lead Python Engineer – S&P (Remote)", 100_000, 150_000),
-            ("Python DB Developer – Citi (NYC)", 121_200, 181_800),
-            ("Senior Systems Engineer – ServiceNow (Full-time)", 140_700, 239_200),
-            ("Staff Systems Engineer – ServiceNow (Full-time)", 140_700, 239_200),
-            ("Lead Python Engineer – Morgan Stanley (Remote)", 150_000, 210_000),
-            ("Lead ML Engineer (Python) – Target (Full-time)", 132_000, 286_000),
-            ("Senior Python Developer – Accenture (Contract)", 106_080, 126_880),
-            ("AI & Python Engineering Lead VP – Citi (Full-time)", 142_320, 213_480),
-            ("Python & Database Developer AVP – Citi (Full-time)", 121_200, 181_800),
-            ("Senior GenAI Python Developer VP – Citi (Full-time)", 142_320, 213_480),
-            ("Benchling Developer w/ Python – Excelra (Contract)", 83_200, 93_600),
-            ("Reliability Engineer (Python/MATLAB) – OSI (Contract)", 124_800, 156_000),
-        ],
+SKILL_CATEGORIES = {
+    "MCP": "MCP / AI Automation",
+    "AI / ML": "AI / ML Engineer",
+    "Data Analytics": "Data Analyst",
+    "Power BI / Visualization": "Power BI / Data Visualization",
+    "Python": "Python Developer",
+    "JavaScript / Node.js": "Node.js / JavaScript Developer",
+}
+
+# Candidate skills, each the combination of SKILL_TERMS entries it requires.
+SKILLS = [
+    {
+        "skill": "Model Context Protocol (MCP)",
+        "label": "Model Context Protocol",
+        "requires": ("MCP",),
+        "notes": "Anthropic's MCP is brand-new (2025-2026). Very few certified practitioners exist. "
+                 "Joshua holds the Anthropic Advanced MCP certification.",
     },
-    "AI / ML Engineer": {
-        "total_results": 1_062,
-        "nashville_local": [
-            {"title": "AI Engineer", "company": "Jobot (AI Startup)", "location": "Nashville, TN",
-             "type": "Full-time", "workplace": "On-Site", "salary_annual_low": 175_000, "salary_annual_high": 200_000},
-            {"title": "Sr AI Research Engineer", "company": "Vanderbilt University", "location": "Nashville, TN",
-             "type": "Full-time", "workplace": "On-Site", "salary_annual_low": None, "salary_annual_high": None},
-        ],
-        "national_salary_samples_annual": [
-            ("Senior AI/ML Engineer – UnitedHealth (Remote)", 91_700, 163_700),
-            ("Principal AI/ML Engineer – UnitedHealth (Remote)", 134_600, 230_800),
-            ("Staff ML Engineer – Coinbase (Remote)", 218_025, 256_500),
-            ("ML Engineer Risk – Coinbase (Remote)", 161_500, 190_000),
-            ("Junior AI Engineer – Tria Federal (Remote)", 80_000, 100_000),
-            ("AI/ML Engineer – Booz Allen (Full-time)", 86_800, 198_000),
-            ("AI/ML Engineer – Lockheed Martin (Telework)", 89_300, 157_435),
-            ("Lead AI/ML Solutions Architect – Booz Allen (Full-time)", 112_800, 257_000),
-            ("Principal AI/ML Engineer – Leidos (Full-time)", 131_300, 237_350),
-            ("Full Stack AI/ML Engineer – Lockheed Martin (Full-time)", 89_300, 157_435),
-            ("AI/ML Engineer Clearance – LMI (Full-time)", 110_986, 195_154),
-        ],
+    {
+        "skill": "AI/ML + Data Analytics (combined)",
+        "label": "AI/ML + Data Analytics",
+        "requires": ("AI / ML", "Data Analytics"),
+        "notes": "Strong demand but most postings require 5+ years. Hands-on predictive modeling "
+                 "experience with Cursor AI at an early career stage is uncommon.",
     },
-    "Business Intelligence Analyst": {
-        "total_results": 213,
-        "nashville_local": [
-            {"title": "Senior BI Analyst", "company": "Vaco by Highspring", "location": "Nashville, TN (Green Hills)",
-             "type": "Contract-to-Hire", "workplace": "Hybrid", "salary_annual_low": 135_200, "salary_annual_high": 145_600},
-            {"title": "Sr. BI Engineer", "company": "Vaco by Highspring", "location": "Brentwood, TN",
-             "type": "Contract-to-Hire", "workplace": "Hybrid", "salary_annual_low": 156_000, "salary_annual_high": 176_800},
-            {"title": "BI Developer", "company": "Nobl Q", "location": "Nashville, TN",
-             "type": "Contract", "workplace": "On-Site", "salary_annual_low": None, "salary_annual_high": None},
-            {"title": "Sr. BI Engineer (Remote, Nashville co.)", "company": "Vaco by Highspring", "location": "Remote",
-             "type": "Contract-to-Hire", "workplace": "Remote", "salary_annual_low": 135_200, "salary_annual_high": 166_400},
-            {"title": "Business Analyst II", "company": "Apex Systems", "location": "Nashville, TN",
-             "type": "Contract", "workplace": "On-Site", "salary_annual_low": 62_400, "salary_annual_high": 70_720},
-            {"title": "Sr. Associate – Transaction Analytics", "company": "Alvarez & Marsal", "location": "Nashville, TN",
-             "type": "Full-time", "workplace": "On-Site", "salary_annual_low": 130_000, "salary_annual_high": 130_000},
-        ],
-        "national_salary_samples_annual": [
-            ("Sr Analyst, Data Analytics & BI – Comcast (Remote)", 78_016, 117_025),
-            ("Senior BI & Data Engineer (Remote)", 112_112, 160_160),
-            ("Lead BI Developer – Launch Potato (Remote)", 120_000, 150_000),
-            ("Senior Tableau BI Analyst – ICF (Remote)", 108_476, 184_409),
-            ("IS Business Intelligence Analyst – Robert Half (Contract)", 62_400, 68_640),
-        ],
+    {
+        "skill": "CompTIA Quad-Stack (A+, Data+, Cloud+, Network+)",
+        "label": "CompTIA Quad-Stack",
+        "requires": ("CompTIA",),
+        "notes": "Breadth across IT fundamentals, data management, cloud architecture, and networking. "
+                 "Very few data analysts also hold Cloud+ and Network+.",
     },
-    "Power BI / Data Visualization": {
-        "total_results": 29,
-        "nashville_local": [
-            {"title": "Power BI Developer/Analyst", "company": "OtterBase", "location": "Nashville, TN",
-             "type": "Full-time", "workplace": "On-Site", "salary_annual_low": 90_000, "salary_annual_high": 95_000},
-        ],
-        "national_salary_samples_annual": [
-            ("BI Developer – Robert Half (Remote)", 108_160, 118_560),
-            ("BI Solutions Architect (On-Site CA)", 145_600, 145_600),
-            ("Senior Data Analyst Power BI – UnitedHealth (Remote)", 91_700, 163_700),
-            ("Power BI Analyst – Randstad (Contract)", 62_400, 83_200),
-            ("Data Science Analyst Power BI – Stefanini (Contract)", 156_000, 166_400),
-            ("Power BI Fabric Solution (Remote)", 120_000, 150_000),
-            ("Data Literacy Specialist (Power BI) – HonorVet (Contract)", 124_800, 145_600),
-        ],
+    {
+        "skill": "Power BI / Data Visualization",
+        "label": "Power BI / Visualization",
+        "requires": ("Power BI / Visualization",),
+        "notes": "Only 1 Power BI-specific role in Nashville. National demand is strong "
+                 "but local supply of practitioners is thin.",
     },
-    "MCP / AI Automation": {
-        "total_results": 158,
-        "nashville_local": [],
-        "national_salary_samples_annual": [
-            ("Staff Cyber AI Researcher – Leidos (Remote)", 107_900, 195_050),
-            ("Principal Agentic AI Systems Engineer – Leidos (Remote)", 131_300, 237_350),
-            ("Principal AI Automation – Vertex (Contract)", 135_200, 176_800),
-            ("Junior AI Engineer – Tria Federal (Remote)", 80_000, 100_000),
-            ("Sr Python & Data Analytics Developer – Security (Remote)", 135_000, 155_000),
-            ("Lead AI/ML Engineer – UnitedHealth (Remote)", 112_700, 193_200),
-            ("Director AI – ServiceNow (Full-time)", 221_200, 387_100),
-            ("Analytics Engineer 5 – Netflix (Full-time)", 330_000, 566_000),
-        ],
-        "notes": "MCP is an emerging protocol (Anthropic). Only a handful of job listings "
-                 "explicitly require it, making certified MCP practitioners extremely rare.",
+    {
+        "skill": "Revenue Forecasting & Profitability Modeling",
+        "label": "Revenue Forecasting",
+        "requires": ("Forecasting",),
+        "notes": "Hands-on revenue forecasting for multi-unit retail is a specialized skill "
+                 "rarely found in early-career candidates.",
     },
-    "Node.js / JavaScript Developer": {
-        "total_results": 105,
-        "nashville_local": [
-            {"title": "Sr Software Engineer", "company": "Robert Half", "location": "Nashville, TN",
-             "type": "Contract", "workplace": "On-Site", "salary_annual_low": 112_320, "salary_annual_high": 128_960},
-        ],
-        "national_salary_samples_annual": [
-            ("Senior Software Engineer – JS/React/Node.js (Remote)", 150_000, 150_000),
-            ("Full Stack Developer – USG (Remote)", 100_920, 134_520),
-            (".NET Full Stack Developer (On-Site)", 130_000, 130_000),
-            ("Data Visualization Engineer – Netflix (Remote)", 260_000, 380_000),
-            ("Fullstack Developer NodeJS – Enterprise Solution (Contract)", 135_200, 145_600),
-        ],
+    {
+        "skill": "Python (Data/Analytics focus)",
+        "label": "Python (Data/Analytics)",
+        "requires": ("Python",),
+        "notes": "Python is the #1 language for data analytics. Strong demand, moderate supply.",
     },
-    "Data Scientist": {
-        "total_results": 128,
-        "nashville_local": [
-            {"title": "Senior Data Scientist", "company": "Oracle", "location": "Nashville, TN",
-             "type": "Full-time", "workplace": "Hybrid", "salary_annual_low": 91_100, "salary_annual_high": 199_500},
-        ],
-        "national_salary_samples_annual": [
-            ("Principal Data Scientist – Maximus (Remote)", 156_740, 156_740),
-            ("Ops Research Data Scientist (Contract)", 156_000, 176_800),
-            ("Data Scientist II GenAI – Robert Half (Contract)", 119_000, 180_000),
-            ("Data Scientist II – ITC (Contract)", 145_600, 145_600),
-            ("Sr Staff Data Scientist – GE Vernova (Full-time)", 144_800, 217_200),
-            ("Lead Observability Data Scientist – Leidos (Full-time)", 131_300, 237_350),
-            ("Senior Data Scientist – Guidehouse (Full-time)", 113_000, 188_000),
-            ("CORP Data Scientist – Mitchell Martin (Contract)", 96_824, 138_320),
-            ("Sr. Computer Vision Data Scientist (Full-time)", 165_000, 190_000),
-            ("Data Scientist – Signal Processing (Contract)", 156_000, 197_600),
-            ("Data Scientist – Kforce (Contract)", 120_640, 135_200),
-            ("Data Scientist – Market Street Talent (Contract)", 104_000, 124_800),
-        ],
+    {
+        "skill": "API Integration (Square, webhooks, custom)",
+        "label": "API Integration",
+        "requires": ("APIs",),
+        "notes": "API-first data extraction is in growing demand. "
+                 "Combining API skills with analytics is a strong differentiator.",
     },
-    "Data Engineer": {
-        "total_results": 292,
-        "nashville_local": [
-            {"title": "Data Engineer", "company": "Kforce", "location": "Nashville, TN",
-             "type": "Contract", "workplace": "Hybrid", "salary_annual_low": 124_800, "salary_annual_high": 145_600},
-        ],
-        "national_salary_samples_annual": [
-            ("IT Data Engineer – Randstad (Contract)", 47_840, 58_240),
-            ("IT Sr Data Engineer – Randstad (Contract)", 52_000, 72_800),
-            ("Data Engineer – Stefanini (Contract)", 212_160, 222_560),
-            ("100% Remote Data Engineer – Whiz (Contract)", 124_800, 145_600),
-            ("Snowflake Data Engineer – Indianapolis (Contract)", 135_200, 145_600),
-            ("Azure Data Engineer (Contract)", 99_840, 99_840),
-            ("Infrastructure Data Engineer (Contract)", 114_400, 135_200),
-            ("Sr Data Engineer Cloud – Bayside (Contract)", 114_400, 135_200),
-        ],
+    {
+        "skill": "JavaScript / Node.js (for data dashboarding)",
+        "label": "JavaScript / Node.js",
+        "requires": ("JavaScript / Node.js",),
+        "notes": "Many JS developers exist, but few combine JS with data analytics and dashboard automation.",
     },
-}
+]
 
-# ── ANALYSIS ──
 
-def compute_salary_stats(search_data: dict) -> dict:
-    """Aggregate salary ranges across all search categories."""
-    all_lows, all_highs = [], []
-    for data in search_data.values():
-        for job in data.get("nashville_local", []):
-            if job["salary_annual_low"] is not None:
-                all_lows.append(job["salary_annual_low"])
-            if job["salary_annual_high"] is not None:
-                all_highs.append(job["salary_annual_high"])
-        for label, lo, hi in data.get("national_salary_samples_annual", []):
-            if lo is not None:
-                all_lows.append(lo)
-            if hi is not None:
-                all_highs.append(hi)
-    return {
-        "min_low": min(all_lows) if all_lows else 0,
-        "max_high": max(all_highs) if all_highs else 0,
-        "avg_low": round(sum(all_lows) / len(all_lows)) if all_lows else 0,
-        "avg_high": round(sum(all_highs) / len(all_highs)) if all_highs else 0,
-        "median_low": sorted(all_lows)[len(all_lows) // 2] if all_lows else 0,
-        "median_high": sorted(all_highs)[len(all_highs) // 2] if all_highs else 0,
-        "sample_count": len(all_lows),
-    }
+def skill_rarity_analysis(matrix: "SkillMatrix", market_total: int = TOTAL_DICE_TECH_JOBS) -> list[dict]:
+    """Rank each skill by scarcity in the job market, measured from the corpus.
 
+    A skill's listings are the Dice-wide estimate for postings mentioning
+    it; for a combined skill, postings mentioning any of its parts (the
+    roles the combination serves), with ``sampled_together`` counting the
+    sampled postings that mention all of them. The rarity score is the
+    log-scaled share of ``market_total`` those listings make up; a skill no
+    sampled posting mentions scores 10. Ties rank fewer listings first.
+    """
+    from skill_matrix import rarity_score, rarity_tier
 
-def compute_nashville_salary_stats(search_data: dict) -> dict:
-    """Salary stats specifically for Nashville-local jobs."""
-    all_lows, all_highs = [], []
-    for data in search_data.values():
-        for job in data.get("nashville_local", []):
-            if job["salary_annual_low"] is not None:
-                all_lows.append(job["salary_annual_low"])
-            if job["salary_annual_high"] is not None:
-                all_highs.append(job["salary_annual_high"])
-    return {
-        "min_low": min(all_lows) if all_lows else 0,
-        "max_high": max(all_highs) if all_highs else 0,
-        "avg_low": round(sum(all_lows) / len(all_lows)) if all_lows else 0,
-        "avg_high": round(sum(all_highs) / len(all_highs)) if all_highs else 0,
-        "median_low": sorted(all_lows)[len(all_lows) // 2] if all_lows else 0,
-        "median_high": sorted(all_highs)[len(all_highs) // 2] if all_highs else 0,
-        "sample_count": len(all_lows),
-    }
+    ranked = []
+    for s in SKILLS:
+        requires = s["requires"]
+        sampled = matrix.count(*requires, any_of=True)
+        listings = matrix.estimated_listings(*requires, any_of=True)
+        if sampled:
+            mentions = f"~{listings:,} listings (from {sampled} sampled postings)"
+        else:
+            mentions = "none in sampled postings"
+        score = rarity_score(listings, market_total)
+        ranked.append({
+            "skill": s["skill"],
+            "label": s["label"],
+            "dice_mentions": mentions,
+            "rarity": rarity_tier(score),
+            "rarity_score": score,
+            "requires": list(requires),
+            "measured": bool(sampled),
+            "sampled_postings": sampled,
+            "sampled_together": matrix.count(*requires),
+            "listings": listings,
+            "salary_ceiling": matrix.salary_ceiling(*requires, any_of=True),
+            "notes": s["notes"],
+        })
+    return sorted(ranked, key=lambda s: (-s["rarity_score"], s["listings"]))
+
+
+def compute_category_salary_stats(search_data) -> dict:
+    """Per-category Dice total and salary summary, with Nashville/national splits."""
+    from group_stats import category_breakdown
+    from listing_store import as_listing_store
 
+    return category_breakdown(as_listing_store(search_data))
 
-def skill_rarity_analysis() -> list[dict]:
-    """Rank each skill by scarcity in the job market."""
-    skills = [
-        {
-            "skill": "Model Context Protocol (MCP)",
-            "dice_mentions": "~5-10 explicit listings nationally",
-            "rarity": "ULTRA-RARE",
-            "rarity_score": 10,
-            "notes": "Anthropic's MCP is brand-new (2025-2026). Very few certified practitioners exist. "
-                     "Joshua holds the Anthropic Advanced MCP certification.",
-        },
-        {
-            "skill": "AI/ML + Data Analytics (combined)",
-            "dice_mentions": "~1,062 listings nationally",
-            "rarity": "HIGH-DEMAND / RARE at entry level",
-            "rarity_score": 8,
-            "notes": "Strong demand but most postings require 5+ years. Hands-on predictive modeling "
-                     "experience with Cursor AI at an early career stage is uncommon.",
-        },
-        {
-            "skill": "CompTIA Quad-Stack (A+, Data+, Cloud+, Network+)",
-            "dice_mentions": "N/A (certification, not search keyword)",
-            "rarity": "RARE combination",
-            "rarity_score": 8,
-            "notes": "Breadth across IT fundamentals, data management, cloud architecture, and networking. "
-                     "Very few data analysts also hold Cloud+ and Network+.",
-        },
-        {
-            "skill": "Power BI / Data Visualization",
-            "dice_mentions": "~29 listings (Nashville + remote)",
-            "rarity": "HIGH-DEMAND / LOW-SUPPLY in Nashville",
-            "rarity_score": 7,
-            "notes": "Only 1 Power BI-specific role in Nashville. National demand is strong "
-                     "but local supply of practitioners is thin.",
-        },
-        {
-            "skill": "Revenue Forecasting & Profitability Modeling",
-            "dice_mentions": "0 exact Nashville matches",
-            "rarity": "NICHE",
-            "rarity_score": 7,
-            "notes": "Hands-on revenue forecasting for multi-unit retail is a specialized skill "
-                     "rarely found in early-career candidates.",
-        },
-        {
-            "skill": "Python (Data/Analytics focus)",
-            "dice_mentions": "~83 listings (Nashville + remote)",
-            "rarity": "IN-DEMAND",
-            "rarity_score": 6,
-            "notes": "Python is the #1 language for data analytics. Strong demand, moderate supply.",
-        },
-        {
-            "skill": "API Integration (Square, webhooks, custom)",
-            "dice_mentions": "Embedded in many roles but rarely standalone",
-            "rarity": "MODERATE-HIGH when combined with analytics",
-            "rarity_score": 6,
-            "notes": "API-first data extraction is in growing demand. "
-                     "Combining API skills with analytics is a strong differentiator.",
-        },
-        {
-            "skill": "JavaScript / Node.js (for data dashboarding)",
-            "dice_mentions": "~105 listings (Nashville + remote)",
-            "rarity": "MODERATE",
-            "rarity_score": 5,
-            "notes": "Many JS developers exist, but few combine JS with data analytics and dashboard automation.",
-        },
-    ]
-    return sorted(skills, key=lambda s: s["rarity_score"], reverse=True)
+
+def skill_demand(rarity: list[dict]) -> list[dict]:
+    """Listings and salary ceiling per ranked skill (the rarity charts' inputs)."""
+    return [{
+        "skill": s["skill"],
+        "label": s["label"],
+        "rarity_score": s["rarity_score"],
+        "listings": s["listings"],
+        "salary_ceiling": s["salary_ceiling"],
+    } for s in rarity]
 
 
 def value_proposition(asking: int, market_stats: dict, nashville_stats: dict) -> dict:
@@ -395,155 +241,497 @@ def value_proposition(asking: int, market_stats: dict, nashville_stats: dict) ->
     }
 
 
+# ── SHARED ANALYSIS CONTEXT ──
+
+TOP_OPENINGS = 10  # openings exported under "top_openings"
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".analysis_cache")
+
+
+# Bump to invalidate every cached result (e.g. after a change in result shapes).
+CACHE_VERSION = 2
+# Modules besides this one whose code shapes the cached results; a change to any expires the cache.
+ANALYSIS_MODULES = ("listing_store", "label_parser", "order_stats",
+                    "group_stats", "salary_aggregator", "dedup", "term_index", "skill_matrix",
+                    "ranking", "salary_sweep", "market_query")
+MAX_CACHED_CONTEXTS = 8  # datasets kept in memory per process
+MAX_CACHE_FILES = 8      # result pickles kept in ``cache_dir``
+
+
+@functools.cache
+def _code_fingerprint() -> bytes:
+    """Digest of the analysis modules' sources, so cached results expire when that code changes."""
+    h = hashlib.sha256(str(CACHE_VERSION).encode())
+    # Located, not imported: a warm cache must not pay for loading numpy.
+    paths = [__file__] + [importlib.util.find_spec(name).origin for name in ANALYSIS_MODULES]
+    for path in paths:
+        with open(path, "rb") as f:
+            h.update(hashlib.sha256(f.read()).digest())
+    return h.digest()
+
+
+def dataset_hash(search_data, person: dict, total_jobs: int = TOTAL_DICE_TECH_JOBS) -> str:
+    """Content hash of the market data, the candidate and the board-wide job total."""
+    h = hashlib.sha256(_code_fingerprint())
+    if hasattr(search_data, "content_hash"):  # a ListingStore
+        h.update(search_data.content_hash().encode())
+    else:
+        h.update(json.dumps(search_data, sort_keys=True, default=str).encode())
+    h.update(json.dumps(person, sort_keys=True, default=str).encode())
+    h.update(str(total_jobs).encode())
+    return h.hexdigest()
+
+
+def load_source(snapshot: str | None = None, inputs=(), api_url: str | None = None):
+    """(ListingStore, Dice-wide tech job total) from one market source.
+
+    ``api_url`` runs every ``market_searches`` category against a Dice-style
+    job-search API (see ``ingestion.HttpJobSearchClient``), whose count
+    endpoint supplies the total. ``inputs`` are JSONL/CSV record files and
+    ``snapshot`` a binary snapshot; neither carries a board-wide count, so
+    the total is the one saved with the snapshot's aggregates, else the
+    number of listings loaded. With no source, returns ``(None, None)``:
+    the built-in data and ``TOTAL_DICE_TECH_JOBS``.
+    """
+    if api_url:
+        from ingestion import HttpJobSearchClient, fetch_market
+        from market_data import market_searches
+
+        with HttpJobSearchClient(api_url) as client:
+            return fetch_market(client, market_searches), client.total_jobs()
+    if inputs:
+        from ingestion import load_files
+
+        store = load_files(inputs)
+        return store, int(store.total_results.sum())
+    if snapshot:
+        from snapshot import Snapshot
+
+        snap = Snapshot(snapshot)
+        store = snap.store()
+        total = (snap.aggregates() or {}).get("total_dice_tech_jobs")
+        return store, int(total) if total else int(store.total_results.sum())
+    return None, None
+
+
+class AnalysisContext:
+    """Computes each derived result once, on first use, and shares it.
+
+    Results are cached per dataset content hash, so every context built
+    over the same data (report, JSON export, charts) reuses one set of
+    computations. With ``cache_dir`` the results also persist across
+    processes, e.g. from this script to ``generate_visualizations.py``.
+    """
+
+    _results_by_hash: OrderedDict[str, dict] = OrderedDict()  # LRU, MAX_CACHED_CONTEXTS entries
+
+    def __init__(self, search_data=None, person: dict | None = None, cache_dir: str | None = None,
+                 total_jobs: int | None = None):
+        if search_data is None:
+            from market_data import market_searches as search_data
+        if person is None:
+            from market_data import candidate as person
+        self.search_data = search_data
+        self.candidate = person
+        # Tech postings on the whole board: the denominator of market share and rarity.
+        self.total_jobs = TOTAL_DICE_TECH_JOBS if total_jobs is None else total_jobs
+        self.key = dataset_hash(self.search_data, self.candidate, self.total_jobs)
+        self.cache_dir = cache_dir
+        self._results = self._results_by_hash.setdefault(self.key, {})
+        self._results_by_hash.move_to_end(self.key)
+        while len(self._results_by_hash) > MAX_CACHED_CONTEXTS:
+            self._results_by_hash.popitem(last=False)
+        if cache_dir and not self._results:
+            self._load()
+
+    def _cache_path(self) -> str:
+        return os.path.join(self.cache_dir, f"{self.key}.pkl")
+
+    def _load(self):
+        try:
+            with open(self._cache_path(), "rb") as f:
+                self._results.update(pickle.load(f))
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+
+    def save(self):
+        """Persist the derived results computed so far to ``cache_dir``."""
+        if not self.cache_dir:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        derived = {k: v for k, v in self._results.items()
+                   if k not in ("store", "unique_store", "ranker", "term_index", "skill_matrix",
+                                "salary_curve", "query")}
+        with open(self._cache_path(), "wb") as f:
+            pickle.dump(derived, f, protocol=pickle.HIGHEST_PROTOCOL)
+        self._prune()
+
+    def _prune(self):
+        """Delete all but the MAX_CACHE_FILES most recently written result pickles."""
+        paths = [os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir)
+                 if name.endswith(".pkl")]
+        paths.sort(key=os.path.getmtime, reverse=True)
+        for path in paths[MAX_CACHE_FILES:]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _get(self, name: str, compute):
+        if name not in self._results:
+            self._results[name] = compute()
+        return self._results[name]
+
+    @property
+    def store(self) -> "ListingStore":
+        from listing_store import as_listing_store
+
+        return self._get("store", lambda: as_listing_store(self.search_data))
+
+    @property
+    def term_index(self) -> "TermIndex":
+        """Inverted index over posting titles, persisted per data snapshot in ``cache_dir``."""
+        from term_index import TermIndex
+
+        return self._get("term_index", lambda: TermIndex.for_store(self.store, self.cache_dir))
+
+    @property
+    def duplicates(self) -> "DuplicateReport":
+        from dedup import find_duplicates
+
+        return self._get("duplicates", lambda: find_duplicates(self.store))
+
+    @property
+    def unique_store(self) -> "ListingStore":
+        """The store with postings repeated across searches counted once."""
+        return self._get("unique_store", lambda: self.store.select(self.duplicates.keep))
+
+    @property
+    def market_stats(self) -> dict:
+        return self._get("market_stats", lambda: compute_salary_stats(self.unique_store))
+
+    @property
+    def nashville_stats(self) -> dict:
+        return self._get("nashville_stats", lambda: compute_nashville_salary_stats(self.unique_store))
+
+    @property
+    def skill_matrix(self) -> "SkillMatrix":
+        from skill_matrix import SkillMatrix
+
+        return self._get("skill_matrix", lambda: SkillMatrix.build(
+            self.store, self.term_index, SKILL_TERMS, SKILL_CATEGORIES))
+
+    @property
+    def skill_rarity(self) -> list[dict]:
+        return self._get("skill_rarity", lambda: skill_rarity_analysis(self.skill_matrix, self.total_jobs))
+
+    @property
+    def category_stats(self) -> dict:
+        return self._get("category_stats", lambda: compute_category_salary_stats(self.store))
+
+    @property
+    def skill_demand(self) -> list[dict]:
+        return self._get("skill_demand", lambda: skill_demand(self.skill_rarity))
+
+    @property
+    def ranker(self) -> "OpeningRanker":
+        from ranking import OpeningRanker
+
+        return self._get("ranker", lambda: OpeningRanker(self.store))
+
+    @property
+    def top_openings(self) -> list[dict]:
+        """The best-paying Nashville openings, by salary midpoint."""
+        return self._get("top_openings", lambda: self.ranker.records(
+            self.ranker.top(TOP_OPENINGS, "midpoint", local=True)))
+
+    @property
+    def value_proposition(self) -> dict:
+        return self._get("value_proposition", lambda: value_proposition(
+            self.candidate["asking_salary"], self.market_stats, self.nashville_stats))
+
+    @property
+    def salary_curve(self) -> "SalaryCurve":
+        from salary_sweep import SalaryCurve
+
+        return self._get("salary_curve", lambda: SalaryCurve.build(self.unique_store))
+
+    @property
+    def salary_sweep(self) -> dict:
+        """Percentile, share paying above and discount for asks across the sweep range."""
+        return self._get("salary_sweep", lambda: self.salary_curve.sweep())
+
+    @property
+    def query(self) -> "MarketQuery":
+        """Bitmap-indexed slices of the deduplicated postings, e.g. ``ctx.query.summary(q)``."""
+        from market_query import MarketQuery
+
+        return self._get("query", lambda: MarketQuery(self.unique_store))
+
+    @property
+    def total_listings(self) -> int:
+        return self._get("total_listings", lambda: int(self.store.total_results.sum()))
+
+    def json_data(self) -> dict:
+        """The structured export written to ``nashville_analysis_data.json``."""
+        return {
+            "candidate": self.candidate,
+            "market_stats": self.market_stats,
+            "nashville_stats": self.nashville_stats,
+            "skill_rarity": self.skill_rarity,
+            "value_proposition": self.value_proposition,
+            "category_stats": self.category_stats,
+            "duplicates": self.duplicates.summary(),
+            "skill_demand": self.skill_demand,
+            "skill_cooccurrence": self.skill_matrix.cooccurrence(),
+            "top_openings": self.top_openings,
+            "salary_sweep": self.salary_sweep,
+            "total_listings_analyzed": self.total_listings,
+            "total_dice_tech_jobs": self.total_jobs,
+            "generated_at": datetime.now().isoformat(),
+        }
+
+
 # ── REPORT GENERATION ──
 
-def generate_report():
-    market_stats = compute_salary_stats(market_searches)
-    nashville_stats = compute_nashville_salary_stats(market_searches)
-    rarity = skill_rarity_analysis()
-    value = value_proposition(candidate["asking_salary"], market_stats, nashville_stats)
-    total_listings = sum(d["total_results"] for d in market_searches.values())
-
-    r = []  # report lines
-
-    # ── Header ──
-    r.append("=" * 72)
-    r.append("  NASHVILLE TECH TALENT MARKET ANALYSIS")
-    r.append("  Joshua Jones  |  February 14, 2026")
-    r.append(f"  Source: Dice.com — {total_listings:,} listings across 9 skill categories")
-    r.append("=" * 72)
-
-    # ── 1. Candidate Profile ──
-    r.append("\n  1. CANDIDATE PROFILE")
-    r.append("  " + "─" * 70)
-    r.append(f"  {candidate['name']}  |  {candidate['location']} → {candidate['target_market']}")
-    r.append(f"  Asking: ${candidate['asking_salary']:,}/yr (${candidate['asking_hourly']}/hr)")
-    r.append(f"  Education: {candidate['education']}")
-    r.append(f"  Certs: {', '.join(candidate['certifications'])}")
-    r.append(f"  Skills: {', '.join(candidate['core_skills'][:6])},")
-    r.append(f"          {', '.join(candidate['core_skills'][6:])}")
-    r.append("")
-    r.append("  Key experience:")
+def _report_header(ctx: AnalysisContext):
+    total_listings = ctx.total_listings
+    yield "=" * 72
+    yield "  NASHVILLE TECH TALENT MARKET ANALYSIS"
+    yield "  Joshua Jones  |  February 14, 2026"
+    yield f"  Source: Dice.com — {total_listings:,} listings across 9 skill categories"
+    yield "=" * 72
+
+
+def _report_profile(ctx: AnalysisContext):
+    candidate = ctx.candidate
+    total_listings = ctx.total_listings
+    yield "\n  1. CANDIDATE PROFILE"
+    yield "  " + "─" * 70
+    yield f"  {candidate['name']}  |  {candidate['location']} → {candidate['target_market']}"
+    yield f"  Asking: ${candidate['asking_salary']:,}/yr (${candidate['asking_hourly']}/hr)"
+    yield f"  Education: {candidate['education']}"
+    yield f"  Certs: {', '.join(candidate['certifications'])}"
+    yield f"  Skills: {', '.join(candidate['core_skills'][:6])},"
+    yield f"          {', '.join(candidate['core_skills'][6:])}"
+    yield ""
+    yield "  Key experience:"
     for exp in candidate["experience_highlights"]:
-        r.append(f"    • {exp}")
-    r.append("")
-    r.append(f"  Of {TOTAL_DICE_TECH_JOBS:,} tech jobs listed on Dice.com nationwide, {total_listings:,}")
-    r.append(f"  fall within Joshua's skill categories — and very few candidates can")
-    r.append(f"  cover as many of them simultaneously.")
-
-    # ── 2. Skill Rarity & Market Value ──
-    r.append("\n  2. SKILL RARITY & MARKET VALUE")
-    r.append("  " + "─" * 70)
-    r.append("  Joshua's certifications and hands-on experience place him in a")
-    r.append("  remarkably thin talent pool. The index below reflects how scarce")
-    r.append("  each skill is among current Dice.com candidates and job postings.")
-    r.append("")
-    r.append("  (1 = common → 10 = extremely rare)\n")
+        yield f"    • {exp}"
+    yield ""
+    yield f"  Of {ctx.total_jobs:,} tech jobs listed on Dice.com nationwide, {total_listings:,}"
+    yield f"  fall within Joshua's skill categories — and very few candidates can"
+    yield f"  cover as many of them simultaneously."
+
+
+def _report_rarity(ctx: AnalysisContext):
+    rarity = ctx.skill_rarity
+    yield "\n  2. SKILL RARITY & MARKET VALUE"
+    yield "  " + "─" * 70
+    yield "  Joshua's certifications and hands-on experience place him in a"
+    yield "  remarkably thin talent pool. The index below reflects how scarce"
+    yield "  each skill is among current Dice.com candidates and job postings."
+    yield ""
+    yield "  (1 = common → 10 = extremely rare)\n"
     for s in rarity:
         bar = "█" * s["rarity_score"] + "░" * (10 - s["rarity_score"])
-        r.append(f"  [{bar}] {s['rarity_score']:>2}/10  {s['skill']}")
-        r.append(f"  {'':>15}{s['notes']}")
-        r.append("")
-    r.append("  The combination is what matters most. Thousands of professionals")
-    r.append("  possess one or two of these skills; almost none hold all of them.")
-    r.append("  The Anthropic Advanced MCP credential alone narrows the field to")
-    r.append("  a handful of practitioners nationally — and Joshua pairs it with")
-    r.append("  four CompTIA certifications, production AI/ML work, and full-stack")
-    r.append("  development experience.")
-
-    # ── 3. What This Skillset Commands ──
-    r.append("\n  3. WHAT THIS SKILLSET COMMANDS")
-    r.append("  " + "─" * 70)
-    r.append(f"  Based on {market_stats['sample_count']} national and "
-             f"{nashville_stats['sample_count']} Nashville salary data points:\n")
-    r.append(f"    National median range:  ${market_stats['median_low']:,} – ${market_stats['median_high']:,}/yr")
-    r.append(f"    Nashville avg range:    ${nashville_stats['avg_low']:,} – ${nashville_stats['avg_high']:,}/yr")
-    r.append(f"    National median midpt:  ${value['market_median_midpoint']:,}/yr")
-    r.append(f"    Nashville avg midpt:    ${value['nashville_avg_midpoint']:,}/yr")
-    r.append(f"    Joshua's ask:           ${candidate['asking_salary']:,}/yr")
-    r.append("")
-    r.append(f"    → {value['discount_pct_vs_national']}% below national median  "
+        yield f"  [{bar}] {s['rarity_score']:>2}/10  {s['skill']}"
+        yield f"  {'':>15}{s['notes']}"
+        yield ""
+    yield "  The combination is what matters most. Thousands of professionals"
+    yield "  possess one or two of these skills; almost none hold all of them."
+    yield "  The Anthropic Advanced MCP credential alone narrows the field to"
+    yield "  a handful of practitioners nationally — and Joshua pairs it with"
+    yield "  four CompTIA certifications, production AI/ML work, and full-stack"
+    yield "  development experience."
+
+
+def _report_market_value(ctx: AnalysisContext):
+    from order_stats import REPORT_PERCENTILES
+
+    candidate = ctx.candidate
+    market_stats = ctx.market_stats
+    nashville_stats = ctx.nashville_stats
+    value = ctx.value_proposition
+    yield "\n  3. WHAT THIS SKILLSET COMMANDS"
+    yield "  " + "─" * 70
+    yield (f"  Based on {market_stats['sample_count']} national and "
+             f"{nashville_stats['sample_count']} Nashville salary data points"
+             f" ({ctx.duplicates.removed} duplicate postings excluded):\n")
+    yield f"    National median range:  ${market_stats['median_low']:,} – ${market_stats['median_high']:,}/yr"
+    yield f"    Nashville avg range:    ${nashville_stats['avg_low']:,} – ${nashville_stats['avg_high']:,}/yr"
+    yield f"    National median midpt:  ${value['market_median_midpoint']:,}/yr"
+    yield f"    Nashville avg midpt:    ${value['nashville_avg_midpoint']:,}/yr"
+    yield f"    Joshua's ask:           ${candidate['asking_salary']:,}/yr"
+    yield ""
+    yield (f"    → {value['discount_pct_vs_national']}% below national median  "
              f"(~${value['savings_vs_national_median']:,}/yr difference)")
-    r.append(f"    → {value['discount_pct_vs_nashville']}% below Nashville avg   "
+    yield (f"    → {value['discount_pct_vs_nashville']}% below Nashville avg   "
              f"(~${value['savings_vs_nashville_avg']:,}/yr difference)")
-    r.append("")
-    r.append("  Individually, each skill area Joshua covers commands:")
-    r.append("")
-    cat_salary_ranges = {
-        "Data Analyst":                 "$56K – $213K",
-        "Python Developer":             "$83K – $286K",
-        "AI / ML Engineer":             "$80K – $257K",
-        "BI Analyst / Power BI":        "$62K – $184K",
-        "MCP / AI Automation":          "Emerging — very few benchmarks exist",
-        "Node.js / JavaScript":         "$101K – $380K",
-        "Data Scientist":               "$97K – $237K",
-        "Data Engineer":                "$48K – $223K",
-    }
-    for area, sal_range in cat_salary_ranges.items():
-        r.append(f"    {area:<30} {sal_range}")
-    r.append("")
-    r.append("  A candidate who spans multiple rows of this table — particularly")
-    r.append("  MCP, AI/ML, and analytics together — represents a rare convergence")
-    r.append("  of capability that the market has not yet fully priced.")
-
-    # ── 4. Nashville Openings ──
-    r.append("\n  4. CURRENT NASHVILLE OPENINGS (Dice, Feb 2026)")
-    r.append("  " + "─" * 70)
-    r.append("  18 live positions in or near Nashville match Joshua's skills.\n")
-    nashville_jobs = []
-    for data in market_searches.values():
-        for job in data.get("nashville_local", []):
-            sal = "DOE"
-            if job["salary_annual_low"] and job["salary_annual_high"]:
-                lo_k = f"${job['salary_annual_low'] // 1000}K"
-                hi_k = f"${job['salary_annual_high'] // 1000}K"
-                sal = f"{lo_k}–{hi_k}"
-            nashville_jobs.append((job["title"], job["company"], job["workplace"], sal))
-    max_title = max(len(t) for t, *_ in nashville_jobs)
-    max_co = max(len(c) for _, c, *_ in nashville_jobs)
-    for title, company, wp, sal in nashville_jobs:
-        r.append(f"    {title:<{max_title}}  {company:<{max_co}}  {wp:<7}  {sal}")
-    r.append("")
-    r.append("  Every listed salary above exceeds Joshua's $60K ask — most by a")
-    r.append("  wide margin. These are the roles his skillset qualifies him for,")
-    r.append("  and the rates the market is willing to pay for them.")
-
-    # ── Footer ──
-    r.append(f"\n  {'═' * 70}")
-    r.append(f"  Generated from live Dice.com data via the Dice MCP API.")
-    r.append(f"  Salary figures based on posted ranges; hourly rates annualized")
-    r.append(f"  at 2,080 hours/year.")
-    r.append(f"  {'═' * 70}")
-
-    return "\n".join(r)
+    yield ""
+    yield "  Spread of posted salary ranges (exact percentiles):"
+    yield ""
+    cols = [f"median_{{side}}" if p == 50 else f"p{p}_{{side}}" for p in REPORT_PERCENTILES] + ["iqr_{side}"]
+    heads = ["Median" if p == 50 else f"P{p}" for p in REPORT_PERCENTILES] + ["IQR"]
+    yield f"    {'':<16}" + "".join(f"{h:>10}" for h in heads)
+    for label, stats in (("National", market_stats), ("Nashville", nashville_stats)):
+        for side in ("low", "high"):
+            cells = "".join(f"{'$' + format(stats[c.format(side=side)], ','):>10}" for c in cols)
+            yield f"    {label + ' ' + side + 's':<16}{cells}"
+    yield ""
+    yield "  Individually, each skill area Joshua covers commands:"
+    yield ""
+    for area, stats in ctx.category_stats.items():
+        if stats["sample_count"]:
+            sal_range = f"${stats['min_low'] // 1000}K – ${stats['max_high'] // 1000}K"
+            detail = (f"median ${stats['median_low'] // 1000}K–${stats['median_high'] // 1000}K, "
+                      f"{stats['sample_count']} pts ({stats['nashville']['sample_count']} Nashville)")
+            yield f"    {area:<32}{sal_range:<16}{detail}"
+        else:
+            yield f"    {area:<32}No posted salaries yet"
+    yield ""
+    yield "  A candidate who spans multiple rows of this table — particularly"
+    yield "  MCP, AI/ML, and analytics together — represents a rare convergence"
+    yield "  of capability that the market has not yet fully priced."
+
+
+def _report_openings(ctx: AnalysisContext, page_size: int | None = None,
+                     width_sample: int | None = None, top: int | None = None,
+                     by: str = "midpoint", workplace=None, job_type=None,
+                     chunk_size: int = 4096):
+    """Section 4: Nashville openings ranked ``by`` a ranking score, streamed in chunks.
+
+    With ``top`` only the best ``top`` scored openings are listed;
+    otherwise unscored ones (no posted salary) follow the ranked rows.
+    ``workplace``/``job_type`` filter the openings.
+    Column widths come from the store's interned-string length index, or
+    from the first ``width_sample`` rows when set (longer values then just
+    overrun their column). ``page_size`` splits the table into pages.
+    """
+    import numpy as np
+
+    store = ctx.store
+    yield "\n  4. CURRENT NASHVILLE OPENINGS (Dice, Feb 2026)"
+    yield "  " + "─" * 70
+    filters = {"local": True, "workplace": workplace, "job_type": job_type}
+    rows = ctx.ranker.top(top, by, **filters)
+    if top is None:
+        listed = np.zeros(len(store), dtype=bool)
+        listed[rows] = True
+        unscored = ctx.ranker.mask(**filters) & ~listed
+        rows = np.concatenate((rows, np.flatnonzero(unscored)))
+        yield f"  {len(rows)} live positions in or near Nashville match Joshua's skills.\n"
+    else:
+        yield f"  Top {len(rows)} live positions in or near Nashville by salary {by}.\n"
+    lengths = store.strings.lengths()
+    sample = rows[:width_sample] if width_sample else rows
+    max_title = int(lengths[store.title[sample]].max()) if len(sample) else 0
+    max_co = int(lengths[store.company[sample]].max()) if len(sample) else 0
+    page_len = page_size or max(len(rows), 1)
+    pages = -(-len(rows) // page_len)
+    for page_start in range(0, len(rows), page_len):
+        page_end = min(page_start + page_len, len(rows))
+        if pages > 1:
+            if page_start:
+                yield ""
+            yield f"    ── Page {page_start // page_len + 1} of {pages} ──"
+        for start in range(page_start, page_end, chunk_size):
+            idx = rows[start:min(start + chunk_size, page_end)]
+            lows, highs = store.salary_low[idx], store.salary_high[idx]
+            lo_k, hi_k = lows // 1000, highs // 1000
+            has_salary = (lows > 0) & (highs > 0)  # NaN compares False
+            titles = store.strings.decode(store.title[idx])
+            companies = store.strings.decode(store.company[idx])
+            workplaces = store.workplaces.decode(store.workplace[idx])
+            for i in range(len(idx)):
+                sal = f"${int(lo_k[i])}K–${int(hi_k[i])}K" if has_salary[i] else "DOE"
+                yield (f"    {titles[i]:<{max_title}}  {companies[i]:<{max_co}}  "
+                       f"{workplaces[i]:<7}  {sal}")
+    yield ""
+    yield "  Every listed salary above exceeds Joshua's $60K ask — most by a"
+    yield "  wide margin. These are the roles his skillset qualifies him for,"
+    yield "  and the rates the market is willing to pay for them."
+
+
+def _report_footer(ctx: AnalysisContext):
+    yield f"\n  {'═' * 70}"
+    yield f"  Generated from live Dice.com data via the Dice MCP API."
+    yield f"  Salary figures based on posted ranges; hourly rates annualized"
+    yield f"  at 2,080 hours/year."
+    yield f"  {'═' * 70}"
+
+
+REPORT_SECTIONS = (
+    ("header", _report_header),
+    ("profile", _report_profile),
+    ("rarity", _report_rarity),
+    ("market_value", _report_market_value),
+    ("openings", _report_openings),
+    ("footer", _report_footer),
+)
+
+
+def iter_report(ctx: AnalysisContext | None = None, **openings):
+    """Yield (section name, line iterator) pairs; nothing is buffered.
+
+    ``openings`` are options for section 4 (see ``_report_openings``).
+    """
+    if ctx is None:
+        ctx = AnalysisContext()
+    for name, section in REPORT_SECTIONS:
+        if name == "openings":
+            yield name, section(ctx, **openings)
+        else:
+            yield name, section(ctx)
+
+
+def iter_report_lines(ctx: AnalysisContext | None = None, **options):
+    for _, lines in iter_report(ctx, **options):
+        yield from lines
+
+
+def write_report(ctx: AnalysisContext | None = None, *outputs, **options) -> int:
+    """Stream the report to every file-like object in ``outputs``; returns the line count."""
+    n = 0
+    for line in iter_report_lines(ctx, **options):
+        chunk = line if n == 0 else "\n" + line
+        for out in outputs:
+            out.write(chunk)
+        n += 1
+    return n
+
+
+def generate_report(ctx: AnalysisContext | None = None, **options) -> str:
+    """The whole report as one string (for small data; prefer ``write_report``)."""
+    return "\n".join(iter_report_lines(ctx, **options))
 
 
 # ── MAIN ──
 
 if __name__ == "__main__":
-    report_text = generate_report()
-    print(report_text)
+    import argparse
+    import sys
 
+    parser = argparse.ArgumentParser(description="Write the executive summary and JSON export.")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--snapshot", help="analyze a binary market snapshot (see snapshot.py) "
+                                           "instead of the built-in market data")
+    source.add_argument("--input", nargs="+", metavar="FILE",
+                        help="analyze JSONL/CSV posting files (see ingestion.py)")
+    source.add_argument("--api", metavar="URL", help="fetch the market from a Dice-style job-search API")
+    parser.add_argument("--total-jobs", type=int,
+                        help="board-wide tech job total (default: from the source)")
+    args = parser.parse_args()
+
+    store, total_jobs = load_source(args.snapshot, args.input or (), args.api)
+    ctx = AnalysisContext(store, cache_dir=CACHE_DIR, total_jobs=args.total_jobs or total_jobs)
     output_path = "Nashville_Market_Analysis_Executive_Summary.txt"
     with open(output_path, "w") as f:
-        f.write(report_text)
-    print(f"\n✅ Report saved to: {output_path}")
-
-    json_data = {
-        "candidate": candidate,
-        "market_stats": compute_salary_stats(market_searches),
-        "nashville_stats": compute_nashville_salary_stats(market_searches),
-        "skill_rarity": skill_rarity_analysis(),
-        "value_proposition": value_proposition(
-            candidate["asking_salary"],
-            compute_salary_stats(market_searches),
-            compute_nashville_salary_stats(market_searches),
-        ),
-        "total_listings_analyzed": sum(d["total_results"] for d in market_searches.values()),
-        "total_dice_tech_jobs": TOTAL_DICE_TECH_JOBS,
-        "generated_at": datetime.now().isoformat(),
-    }
+        write_report(ctx, sys.stdout, f)
+    print(f"\n\n✅ Report saved to: {output_path}")
+
     json_path = "nashville_analysis_data.json"
     with open(json_path, "w") as f:
-        json.dump(json_data, f, indent=2, default=str)
+        json.dump(ctx.json_data(), f, indent=2, default=str)
     print(f"✅ Structured data saved to: {json_path}")
+    ctx.save()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Streaming NDJSON Export
+=======================
+Writes the analysis as newline-delimited JSON, one record per line, in
+constant memory, so the export can carry every posting rather than only
+summary statistics.
+
+Each line has a ``record`` field naming its kind:
+
+* ``header`` — first line: format version plus the summary
+  (``AnalysisContext.json_data()``, the content of
+  ``nashville_analysis_data.json``);
+* ``posting`` — one per store row, with its row number and, for
+  duplicates, the row it collapses into;
+* ``category`` — one per search category, its aggregate salary stats;
+* ``candidate`` — one per candidate evaluated (the context's own
+  candidate, or a stream of ``batch_eval`` results).
+
+Postings are encoded a chunk of rows at a time from a fixed line
+template. Columns are pulled out with ``tolist``, and each interned string is
+JSON-encoded once per export, so no per-row dict is built or serialized.
+Lines are formatted straight into bytes, and each chunk is written as one
+buffer. Output is gzip-compressed for ``.gz`` paths and zstd-compressed
+for ``.zst`` (needs the ``zstandard`` package). The other records
+are encoded with ``orjson`` when it is installed, and with the standard
+library's ``json`` otherwise.
+
+Usage:
+    python3 ndjson_export.py export.ndjson.gz [--candidates candidates.jsonl] [--snapshot PATH]
+"""
+
+import gzip
+import json
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # optional: faster encoder
+    orjson = None
+
+NDJSON_VERSION = 1
+CHUNK_ROWS = 65_536
+GZIP_LEVEL = 1  # favour throughput; recompress for archival
+ZSTD_LEVEL = 3
+
+_json_encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def encode(record: dict) -> bytes:
+    """One record as a compact JSON line (with trailing newline)."""
+    if orjson is not None:
+        return orjson.dumps(record, default=str, option=orjson.OPT_APPEND_NEWLINE
+                            | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return (_json_encoder.encode(record) + "\n").encode()
+
+
+def open_output(path: str, compression: str | None = None):
+    """Binary writer for ``path``; ``compression`` is "gzip", "zstd" or None (by extension)."""
+    if compression is None:
+        compression = "gzip" if path.endswith(".gz") else "zstd" if path.endswith(".zst") else ""
+    if compression == "gzip":
+        return gzip.open(path, "wb", compresslevel=GZIP_LEVEL)
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError:
+            raise RuntimeError("zstd output needs the 'zstandard' package") from None
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(open(path, "wb"))
+    if compression:
+        raise ValueError(f"unknown compression {compression!r}; expected 'gzip' or 'zstd'")
+    return open(path, "wb")
+
+
+def _json_values(table) -> list[bytes]:
+    """Every value of a string table as an encoded JSON string literal, indexed by code."""
+    return [_json_encoder.encode(v).encode() for v in table.values]
+
+
+def _json_numbers(values: np.ndarray) -> list[bytes]:
+    """JSON literal per value (NaN → null); each distinct salary is formatted once."""
+    uniq, inverse = np.unique(values, return_inverse=True)
+    literals = [b"null" if v != v else repr(v).encode() for v in uniq.tolist()]
+    return [literals[i] for i in inverse.reshape(-1).tolist()]
+
+
+_POSTING = (b'{"record":"posting","row":%d,"category":%s,"title":%s,"company":%s,"location":%s,'
+            b'"type":%s,"workplace":%s,"salary_annual_low":%s,"salary_annual_high":%s,'
+            b'"nashville_local":%s,"duplicate_of":%s}\n')
+
+
+def posting_chunks(store, duplicates=None, chunk_rows: int = CHUNK_ROWS):
+    """Encoded ``posting`` lines, one bytes buffer per ``chunk_rows`` rows.
+
+    Each interned string is JSON-encoded once, not once per row that uses
+    it, and lines are filled in from a fixed template.
+    """
+    strings = _json_values(store.strings)
+    cats, wps, types = (_json_values(t) for t in (store.categories, store.workplaces, store.job_types))
+    for start in range(0, len(store), chunk_rows):
+        stop = min(start + chunk_rows, len(store))
+        rows = slice(start, stop)
+        clusters = duplicates.cluster[rows].tolist() if duplicates is not None else range(start, stop)
+        yield b"".join(_POSTING % (
+            row, cats[category], strings[title], strings[company], strings[location],
+            types[job_type], wps[workplace], low, high, b"true" if local else b"false",
+            b"null" if cluster == row else b"%d" % cluster,
+        ) for row, category, title, company, location, job_type, workplace, low, high, local, cluster
+            in zip(range(start, stop), store.category[rows].tolist(), store.title[rows].tolist(),
+                   store.company[rows].tolist(), store.location[rows].tolist(),
+                   store.job_type[rows].tolist(), store.workplace[rows].tolist(),
+                   _json_numbers(store.salary_low[rows]), _json_numbers(store.salary_high[rows]),
+                   store.is_local[rows].tolist(), clusters))
+
+
+def write_ndjson(ctx, path: str, candidates=None, compression: str | None = None,
+                 chunk_rows: int = CHUNK_ROWS) -> dict:
+    """Stream ``ctx``'s summary, postings, category aggregates and candidates to ``path``.
+
+    ``candidates`` is any iterable of candidate result dicts (e.g. from
+    ``batch_eval.evaluate_candidates``); by default the context's own
+    candidate with its value proposition. Returns the count of each record kind.
+    """
+    counts = {"header": 1, "posting": 0, "category": 0, "candidate": 0}
+    with open_output(path, compression) as out:
+        out.write(encode({"record": "header", "version": NDJSON_VERSION, **ctx.json_data()}))
+        store = ctx.store
+        for buf in posting_chunks(store, ctx.duplicates, chunk_rows):
+            out.write(buf)
+        counts["posting"] = len(store)
+        for name, stats in ctx.category_stats.items():
+            out.write(encode({"record": "category", "category": name, **stats}))
+            counts["category"] += 1
+        if candidates is None:
+            candidates = [{**ctx.candidate, **ctx.value_proposition}]
+        for cand in candidates:
+            out.write(encode({"record": "candidate", **cand}))
+            counts["candidate"] += 1
+    return counts
+
+
+# ── MAIN ──
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    from nashville_market_analysis import CACHE_DIR, AnalysisContext
+
+    parser = argparse.ArgumentParser(description="Stream the analysis as NDJSON.")
+    parser.add_argument("output", help="output path (.ndjson, .ndjson.gz or .ndjson.zst)")
+    parser.add_argument("--candidates", help="JSONL/CSV of candidates to evaluate and include")
+    parser.add_argument("--snapshot", help="export a binary market snapshot (see snapshot.py)")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="candidate evaluation processes")
+    args = parser.parse_args()
+
+    if args.snapshot:
+        from snapshot import load_snapshot
+
+        ctx = AnalysisContext(load_snapshot(args.snapshot), cache_dir=CACHE_DIR)
+    else:
+        ctx = AnalysisContext(cache_dir=CACHE_DIR)
+    candidates = None
+    if args.candidates:
+        from batch_eval import MarketModel, evaluate_candidates
+        from ingestion import read_records
+
+        candidates = evaluate_candidates(MarketModel.from_context(ctx),
+                                         read_records(args.candidates), args.jobs)
+    start = time.perf_counter()
+    counts = write_ndjson(ctx, args.output, candidates)
+    print(f"✅ Wrote {sum(counts.values()):,} records to {args.output} "
+          f"({', '.join(f'{n:,} {kind}' for kind, n in counts.items())}) "
+          f"in {time.perf_counter() - start:.2f}s")
@@ -0,0 +1,62 @@
+"""
+Exact Order Statistics
+======================
+Medians and percentiles by selection instead of full sorts.
+
+All requested ranks are resolved with a single ``numpy.partition`` call
+(introselect), which is O(n) per pass and leaves the input untouched.
+Ranks follow the convention the report has always used for its median —
+the element at index ``floor(q · n)`` of the sorted values — so the
+median of an even-length sample is the upper of the two middle values.
+"""
+
+import numpy as np
+
+# Percentiles shown in the report and exported with every salary summary.
+REPORT_PERCENTILES = (10, 25, 50, 75, 90)
+
+
+def rank_indices(n: int, qs) -> np.ndarray:
+    """Sorted-order index of each quantile in ``qs`` for a sample of size ``n``."""
+    idx = np.floor(np.asarray(qs, dtype=np.float64) * n).astype(np.int64)
+    return np.clip(idx, 0, max(n - 1, 0))
+
+
+def order_statistics(values, qs) -> np.ndarray:
+    """Exact quantiles of ``values`` for every q in ``qs`` from one partitioning pass."""
+    values = np.asarray(values)
+    if not values.size:
+        return np.full(len(qs), np.nan)
+    idx = rank_indices(values.size, qs)
+    kth = np.unique(idx)
+    return np.partition(values, kth)[idx]
+
+
+def median(values) -> float:
+    return float(order_statistics(values, [0.5])[0])
+
+
+def summary_quantiles(percentiles=REPORT_PERCENTILES) -> list[float]:
+    """Quantiles a salary summary needs: ``percentiles``, the median and both quartiles."""
+    return sorted({0.5, 0.25, 0.75, *(p / 100 for p in percentiles)})
+
+
+def percentile_fields(by_quantile: dict, side: str, percentiles=REPORT_PERCENTILES) -> dict:
+    """Salary-summary keys (``p10_low`` … ``iqr_low``) from ``{q: value}`` over ``summary_quantiles``.
+
+    The IQR is always included, whether or not P25 and P75 are reported.
+    The median itself is reported under its existing ``median_<side>`` key
+    by the caller, so P50 is not repeated here.
+    """
+    fields = {f"p{p}_{side}": int(by_quantile[p / 100]) for p in percentiles if p != 50}
+    fields[f"iqr_{side}"] = int(by_quantile[0.75]) - int(by_quantile[0.25])
+    return fields
+
+
+def salary_percentiles(values, side: str, percentiles=REPORT_PERCENTILES) -> dict:
+    """``median_<side>`` plus the percentile/IQR fields for one salary column."""
+    values = np.asarray(values)
+    qs = summary_quantiles(percentiles)
+    by_quantile = dict(zip(qs, order_statistics(values, qs) if values.size else [0] * len(qs)))
+    return {f"median_{side}": int(by_quantile[0.5]),
+            **percentile_fields(by_quantile, side, percentiles)}
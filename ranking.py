@@ -0,0 +1,131 @@
+"""
+Top-K Opening Ranking
+=====================
+Picks the best openings from a ListingStore without sorting the corpus.
+
+Openings are scored by salary midpoint, salary floor, or skill match (how
+many of the candidate's skill keywords the title contains). A one-off
+query selects its K rows with ``numpy.argpartition`` — O(n) — and sorts
+only those K. ``OpeningRanker`` also keeps a full descending index per
+score, built on first use. Repeated queries with any K then only read
+the front of that index. Ties rank in row (insertion) order, so both paths return
+the same rows. Rows whose score is missing (no posted salary) are never
+ranked.
+"""
+
+import re
+
+import numpy as np
+
+from listing_store import ListingStore
+
+SCORES = ("midpoint", "floor", "skill")
+
+# Title keywords that signal a match with the candidate's skills; matched
+# case-insensitively on word boundaries.
+SKILL_KEYWORDS = (
+    "data", "analyst", "analytics", "python", "bi", "power bi", "visualization",
+    "dashboard", "ai", "ml", "mcp", "automation", "node.js", "nodejs", "javascript",
+    "api", "forecasting",
+)
+
+
+def title_match_counts(strings, keywords=SKILL_KEYWORDS) -> np.ndarray:
+    """Number of ``keywords`` in each interned string, indexed by string code."""
+    pattern = re.compile(r"(?<![\w.])(?:" + "|".join(
+        re.escape(k) for k in sorted(keywords, key=len, reverse=True)) + r")(?![\w])", re.I)
+    return np.fromiter((len(set(m.lower() for m in pattern.findall(v))) for v in strings.values),
+                       dtype=np.float64, count=len(strings))
+
+
+def score_column(store: ListingStore, by: str, keywords=SKILL_KEYWORDS) -> np.ndarray:
+    """Per-row score for ``by`` (one of ``SCORES``); NaN where it cannot be scored."""
+    if by == "midpoint":
+        return (store.salary_low + store.salary_high) / 2
+    if by == "floor":
+        return store.salary_low.copy()
+    if by == "skill":
+        return title_match_counts(store.strings, keywords)[store.title]
+    raise ValueError(f"unknown score {by!r}; expected one of {SCORES}")
+
+
+def top_k(scores: np.ndarray, k: int, rows: np.ndarray | None = None) -> np.ndarray:
+    """Indices of the ``k`` highest-scoring rows (of ``rows``), best first.
+
+    Selection by partitioning: only the ``k`` survivors are sorted. ``k <= 0``
+    selects nothing.
+    """
+    if k <= 0:
+        return np.zeros(0, dtype=np.int64)
+    rows = np.arange(len(scores)) if rows is None else np.asarray(rows)
+    rows = rows[~np.isnan(scores[rows])]
+    if k < len(rows):
+        s = scores[rows]
+        kth = s[np.argpartition(s, len(s) - k)[len(s) - k]]
+        above = rows[s > kth]
+        rows = np.concatenate((above, rows[s == kth][:k - len(above)]))
+    return rows[np.lexsort((rows, -scores[rows]))][:k]
+
+
+class OpeningRanker:
+    """Top-K queries over one store, with filters and a cached sorted index per score."""
+
+    def __init__(self, store: ListingStore, keywords=SKILL_KEYWORDS):
+        self.store = store
+        self.keywords = keywords
+        self._scores: dict[str, np.ndarray] = {}
+        self._index: dict[str, np.ndarray] = {}
+
+    def scores(self, by: str = "midpoint") -> np.ndarray:
+        if by not in self._scores:
+            self._scores[by] = score_column(self.store, by, self.keywords)
+        return self._scores[by]
+
+    def index(self, by: str = "midpoint") -> np.ndarray:
+        """Every scored row, best first (ties in row order)."""
+        if by not in self._index:
+            s = self.scores(by)
+            rows = np.flatnonzero(~np.isnan(s))
+            self._index[by] = rows[np.lexsort((rows, -s[rows]))]
+        return self._index[by]
+
+    def mask(self, workplace=None, job_type=None, category=None, local=None) -> np.ndarray | None:
+        """Row filter; each criterion is a name or a collection of names (``local`` a bool)."""
+        store = self.store
+        mask = None
+        for values, column, table in ((workplace, store.workplace, store.workplaces),
+                                      (job_type, store.job_type, store.job_types),
+                                      (category, store.category, store.categories)):
+            if values is None:
+                continue
+            names = [values] if isinstance(values, str) else list(values)
+            m = np.isin(column, [table.code(n) for n in names])
+            mask = m if mask is None else mask & m
+        if local is not None:
+            m = store.is_local == bool(local)
+            mask = m if mask is None else mask & m
+        return mask
+
+    def top(self, k: int | None = None, by: str = "midpoint", use_index: bool = True,
+            mask: np.ndarray | None = None, **filters) -> np.ndarray:
+        """Row indices of the best ``k`` openings (all scored rows if ``k`` is None).
+
+        ``filters`` are passed to ``mask`` and combined with an explicit
+        boolean ``mask``. With ``use_index`` the cached sorted index is used
+        (built on first call); otherwise a one-off partition selects the rows.
+        """
+        filtered = self.mask(**filters)
+        if filtered is not None:
+            mask = filtered if mask is None else mask & filtered
+        if use_index or k is None:
+            idx = self.index(by)
+            if mask is not None:
+                idx = idx[mask[idx]]
+            return idx if k is None else idx[:max(k, 0)]
+        rows = None if mask is None else np.flatnonzero(mask)
+        return top_k(self.scores(by), k, rows)
+
+    def records(self, rows, by: str = "midpoint") -> list[dict]:
+        """Posting dicts for ``rows`` (as from ``top``), each with its ``score``."""
+        scores = self.scores(by)
+        return [{**row, "score": float(scores[i])} for i, row in zip(rows, self.store.rows(rows))]
@@ -0,0 +1,310 @@
+"""
+Streaming Salary Aggregator
+===========================
+Single-pass, bounded-memory salary statistics.
+
+Count, min, max and mean are tracked exactly. Medians and other quantiles
+come from a KLL sketch, which is mergeable (partial aggregates from
+different chunks, files or categories can be combined) and keeps a
+configurable rank-error bound regardless of how many postings stream
+through. While the number of values is below the sketch's capacity the
+quantiles are exact.
+"""
+
+import math
+import random
+
+import numpy as np
+
+from label_parser import parse_label
+from order_stats import percentile_fields, summary_quantiles
+
+DEFAULT_ERROR = 0.01
+
+
+def k_for_error(error: float) -> int:
+    """KLL accuracy parameter for a target normalized rank error (~1.65 / k)."""
+    return max(8, math.ceil(1.65 / error))
+
+
+class KLLSketch:
+    """Mergeable quantile sketch (Karnin–Lang–Liberty compactor hierarchy)."""
+
+    C = 2 / 3  # capacity decay between levels
+
+    def __init__(self, k: int = 200, seed: int | None = None):
+        self.k = k
+        self.n = 0
+        self.levels: list[list[float]] = [[]]
+        self._rng = random.Random(seed)
+        self._size = 0
+        self._max_size = self._capacity(0)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(2, math.ceil(self.k * self.C ** depth))
+
+    def _grow(self):
+        self.levels.append([])
+        self._max_size = sum(self._capacity(h) for h in range(len(self.levels)))
+
+    def _compress(self):
+        for h in range(len(self.levels)):
+            level = self.levels[h]
+            if len(level) >= self._capacity(h):
+                if h + 1 >= len(self.levels):
+                    self._grow()
+                level.sort()
+                # Keep every other item (random parity); the survivors carry double weight.
+                odd = len(level) % 2
+                tail = level[-1:] if odd else []
+                offset = self._rng.random() < 0.5
+                self.levels[h + 1].extend(level[offset:len(level) - odd:2])
+                self.levels[h] = tail
+                self._size = sum(len(lv) for lv in self.levels)
+                if self._size < self._max_size:
+                    break
+
+    def update(self, value: float):
+        self.levels[0].append(value)
+        self.n += 1
+        self._size += 1
+        if self._size >= self._max_size:
+            self._compress()
+
+    def update_many(self, values):
+        """Feed an iterable/array of values, in chunks no larger than level 0."""
+        values = list(values)
+        step = max(1, self._capacity(0))
+        for i in range(0, len(values), step):
+            chunk = values[i:i + step]
+            self.levels[0].extend(chunk)
+            self.n += len(chunk)
+            self._size += len(chunk)
+            while self._size >= self._max_size:
+                self._compress()
+
+    def merge(self, other: "KLLSketch"):
+        while len(self.levels) < len(other.levels):
+            self._grow()
+        for h, level in enumerate(other.levels):
+            self.levels[h].extend(level)
+        self.n += other.n
+        self._size = sum(len(lv) for lv in self.levels)
+        while self._size >= self._max_size:
+            self._compress()
+
+    def _weighted(self) -> tuple[np.ndarray, np.ndarray]:
+        items = np.concatenate([np.asarray(lv, dtype=np.float64) for lv in self.levels])
+        weights = np.concatenate([np.full(len(lv), 2 ** h, dtype=np.int64)
+                                  for h, lv in enumerate(self.levels)])
+        order = np.argsort(items, kind="stable")
+        return items[order], np.cumsum(weights[order])
+
+    def quantiles(self, qs) -> np.ndarray:
+        """Item at rank floor(q · n) for each q — exact while nothing has been compacted."""
+        if self.n == 0:
+            return np.full(len(qs), np.nan)
+        items, cum = self._weighted()
+        ranks = np.floor(np.asarray(qs, dtype=np.float64) * cum[-1])
+        idx = np.searchsorted(cum, ranks, side="right")
+        return items[np.minimum(idx, len(items) - 1)]
+
+    def quantile(self, q: float) -> float:
+        return float(self.quantiles([q])[0])
+
+    def rank(self, value: float) -> float:
+        """Approximate fraction of values ≤ ``value``."""
+        if self.n == 0:
+            return 0.0
+        items, cum = self._weighted()
+        idx = np.searchsorted(items, value, side="right")
+        return float(cum[idx - 1] / cum[-1]) if idx else 0.0
+
+    def to_dict(self) -> dict:
+        return {"k": self.k, "n": self.n, "levels": [list(lv) for lv in self.levels]}
+
+    @classmethod
+    def from_dict(cls, state: dict, seed: int | None = None) -> "KLLSketch":
+        sketch = cls(state["k"], seed)
+        sketch.levels = [list(lv) for lv in state["levels"]] or [[]]
+        sketch.n = state["n"]
+        sketch._size = sum(len(lv) for lv in sketch.levels)
+        sketch._max_size = sum(sketch._capacity(h) for h in range(len(sketch.levels)))
+        return sketch
+
+
+class RunningStats:
+    """Exact count/sum/min/max plus a quantile sketch for one value stream."""
+
+    def __init__(self, error: float = DEFAULT_ERROR, seed: int | None = None):
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.sketch = KLLSketch(k_for_error(error), seed)
+
+    def add(self, value: float):
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.sketch.update(value)
+
+    def add_many(self, values: np.ndarray):
+        values = values[~np.isnan(values)]
+        if not values.size:
+            return
+        self.count += int(values.size)
+        self.total += float(values.sum())
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self.sketch.update_many(values.tolist())
+
+    def merge(self, other: "RunningStats"):
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.sketch.merge(other.sketch)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def to_dict(self) -> dict:
+        return {"count": self.count, "total": self.total, "min": self.min, "max": self.max,
+                "sketch": self.sketch.to_dict()}
+
+    @classmethod
+    def from_dict(cls, state: dict, seed: int | None = None) -> "RunningStats":
+        stats = cls.__new__(cls)
+        stats.count = state["count"]
+        stats.total = state["total"]
+        stats.min = state["min"]
+        stats.max = state["max"]
+        stats.sketch = KLLSketch.from_dict(state["sketch"], seed)
+        return stats
+
+
+class SalaryAggregator:
+    """Streaming salary statistics over posting lows and highs."""
+
+    def __init__(self, error: float = DEFAULT_ERROR, seed: int | None = None):
+        self.error = error
+        self.low = RunningStats(error, seed)
+        self.high = RunningStats(error, seed)
+
+    def add(self, low, high):
+        """Add one posting; ``None`` (or NaN) salaries are skipped."""
+        if low is not None and low == low:
+            self.low.add(low)
+        if high is not None and high == high:
+            self.high.add(high)
+
+    def add_many(self, lows, highs):
+        self.low.add_many(np.asarray(lows, dtype=np.float64))
+        self.high.add_many(np.asarray(highs, dtype=np.float64))
+
+    def merge(self, other: "SalaryAggregator") -> "SalaryAggregator":
+        self.low.merge(other.low)
+        self.high.merge(other.high)
+        return self
+
+    def quantiles(self, qs, which: str = "low") -> np.ndarray:
+        return getattr(self, which).sketch.quantiles(qs)
+
+    def summary(self) -> dict:
+        """Same keys as ``compute_salary_stats``; medians and percentiles come from the sketch."""
+        lo, hi = self.low, self.high
+        qs = summary_quantiles()
+        low_q = dict(zip(qs, lo.sketch.quantiles(qs) if lo.count else [0] * len(qs)))
+        high_q = dict(zip(qs, hi.sketch.quantiles(qs) if hi.count else [0] * len(qs)))
+        return {
+            "min_low": int(lo.min) if lo.count else 0,
+            "max_high": int(hi.max) if hi.count else 0,
+            "avg_low": round(lo.mean) if lo.count else 0,
+            "avg_high": round(hi.mean) if hi.count else 0,
+            "median_low": int(lo.sketch.quantile(0.5)) if lo.count else 0,
+            "median_high": int(hi.sketch.quantile(0.5)) if hi.count else 0,
+            "sample_count": lo.count,
+            **percentile_fields(low_q, "low"),
+            **percentile_fields(high_q, "high"),
+        }
+
+    def to_dict(self) -> dict:
+        return {"error": self.error, "low": self.low.to_dict(), "high": self.high.to_dict()}
+
+    @classmethod
+    def from_dict(cls, state: dict, seed: int | None = None) -> "SalaryAggregator":
+        agg = cls(state["error"], seed)
+        agg.low = RunningStats.from_dict(state["low"], seed)
+        agg.high = RunningStats.from_dict(state["high"], seed)
+        return agg
+
+
+class MarketAggregator:
+    """Market-wide, Nashville-local and per-category aggregates from one pass."""
+
+    def __init__(self, error: float = DEFAULT_ERROR, seed: int | None = None):
+        self.error = error
+        self.seed = seed
+        self.market = SalaryAggregator(error, seed)
+        self.nashville = SalaryAggregator(error, seed)
+        self.categories: dict[str, SalaryAggregator] = {}
+
+    def category(self, name: str) -> SalaryAggregator:
+        agg = self.categories.get(name)
+        if agg is None:
+            agg = self.categories[name] = SalaryAggregator(self.error, self.seed)
+        return agg
+
+    def add(self, posting: dict):
+        lo, hi = posting["salary_annual_low"], posting["salary_annual_high"]
+        self.market.add(lo, hi)
+        if posting.get("nashville_local"):
+            self.nashville.add(lo, hi)
+        self.category(posting["category"]).add(lo, hi)
+
+    def add_store(self, store):
+        """Fold a ListingStore chunk in with vectorized updates."""
+        self.market.add_many(store.salary_low, store.salary_high)
+        self.nashville.add_many(store.salary_low[store.is_local], store.salary_high[store.is_local])
+        for code in np.unique(store.category):
+            mask = store.category == code
+            self.category(store.categories[code]).add_many(store.salary_low[mask],
+                                                           store.salary_high[mask])
+
+    def merge(self, other: "MarketAggregator") -> "MarketAggregator":
+        self.market.merge(other.market)
+        self.nashville.merge(other.nashville)
+        for name, agg in other.categories.items():
+            self.category(name).merge(agg)
+        return self
+
+    def summary(self) -> dict:
+        return {
+            "market_stats": self.market.summary(),
+            "nashville_stats": self.nashville.summary(),
+            "category_stats": {name: agg.summary() for name, agg in self.categories.items()},
+        }
+
+
+def iter_postings(search_data: dict):
+    """Yield ``market_searches`` entries one posting at a time in a flat shape."""
+    for name, data in search_data.items():
+        for job in data.get("nashville_local", []):
+            yield {**job, "category": name, "nashville_local": True}
+        for label, lo, hi in data.get("national_salary_samples_annual", []):
+            yield {**parse_label(label)._asdict(), "category": name, "nashville_local": False,
+                   "salary_annual_low": lo, "salary_annual_high": hi}
+
+
+def aggregate_postings(postings, error: float = DEFAULT_ERROR, seed: int | None = None) -> MarketAggregator:
+    """Consume an iterable of postings once and return the combined aggregates."""
+    agg = MarketAggregator(error, seed)
+    for posting in postings:
+        agg.add(posting)
+    return agg
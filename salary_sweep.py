@@ -0,0 +1,114 @@
+"""
+Asking-Salary Sweep
+===================
+Positions one asking salary — or a whole array of them — against the
+market, overall, for Nashville-local openings and per search category.
+
+For every segment the posted lows, highs and midpoints are sorted once
+(one ``np.lexsort`` by (category, value) per column, split into per-category
+views). A lookup is then a ``searchsorted`` per segment over the entire asking
+array, so a 10,000-point sweep costs about what a single lookup does:
+
+* ``percentile`` — share of openings whose midpoint is at or below the ask;
+* ``share_above`` — share of openings whose posted high exceeds the ask;
+* ``discount_pct`` — how far the ask sits below the segment's median
+  midpoint, (median low + median high) / 2 as in ``value_proposition``.
+
+Medians follow ``order_stats`` (element at floor(q · n)). Openings without
+a posted salary are left out of every segment. A segment left with none
+has no reference midpoint, so ``lookup`` reports its ``discount_pct`` as
+NaN; ``sweep`` leaves such segments out, so its output is valid JSON.
+"""
+
+import numpy as np
+
+from listing_store import ListingStore
+from order_stats import rank_indices
+
+SWEEP_START = 40_000
+SWEEP_STOP = 200_000
+SWEEP_STEP = 1_000
+
+OVERALL = "overall"
+NASHVILLE = "nashville"
+
+
+def sweep_range(start: int = SWEEP_START, stop: int = SWEEP_STOP, step: int = SWEEP_STEP) -> np.ndarray:
+    """Asking salaries from ``start`` to ``stop`` inclusive."""
+    return np.arange(start, stop + step, step, dtype=np.float64)
+
+
+def _sorted_by_group(ids: np.ndarray, values: np.ndarray, n_groups: int) -> list[np.ndarray]:
+    """``values`` (NaN dropped) sorted within each group, as one view per group."""
+    valid = ~np.isnan(values)
+    g, v = ids[valid], values[valid]
+    v = v[np.lexsort((v, g))]
+    return np.split(v, np.cumsum(np.bincount(g, minlength=n_groups))[:-1])
+
+
+class SalaryCurve:
+    """Pre-sorted salary columns per segment (``overall``, ``nashville``, each category)."""
+
+    def __init__(self, segments: dict[str, dict[str, np.ndarray]]):
+        self.segments = segments
+        self.reference_mid = {}
+        for name, s in segments.items():
+            lows, highs = s["low"], s["high"]
+            if lows.size and highs.size:
+                mid_low = lows[rank_indices(lows.size, [0.5])[0]]
+                mid_high = highs[rank_indices(highs.size, [0.5])[0]]
+                self.reference_mid[name] = float((mid_low + mid_high) / 2)
+            else:
+                self.reference_mid[name] = float("nan")
+
+    @classmethod
+    def build(cls, store: ListingStore) -> "SalaryCurve":
+        low, high = store.salary_low, store.salary_high
+        mid = (low + high) / 2
+        columns = {"low": low, "high": high, "mid": mid}
+        segments = {
+            OVERALL: {k: np.sort(v[~np.isnan(v)]) for k, v in columns.items()},
+            NASHVILLE: {k: np.sort(v[store.is_local & ~np.isnan(v)]) for k, v in columns.items()},
+        }
+        n_cat = len(store.categories)
+        by_category = {k: _sorted_by_group(store.category, v, n_cat) for k, v in columns.items()}
+        for code, name in enumerate(store.categories.values):
+            if by_category["mid"][code].size:
+                segments[name] = {k: runs[code] for k, runs in by_category.items()}
+        return cls(segments)
+
+    def __contains__(self, segment: str) -> bool:
+        return segment in self.segments
+
+    def openings(self, segment: str = OVERALL) -> int:
+        return int(self.segments[segment]["mid"].size)
+
+    def lookup(self, asking, segment: str = OVERALL) -> dict:
+        """``percentile``, ``share_above`` and ``discount_pct`` for each ask (arrays, or floats
+        for a scalar ask)."""
+        s = self.segments[segment]
+        ask = np.asarray(asking, dtype=np.float64)
+        mids, highs = s["mid"], s["high"]
+        percentile = (np.searchsorted(mids, ask, side="right") / mids.size * 100 if mids.size
+                      else np.zeros(ask.shape))
+        share_above = ((highs.size - np.searchsorted(highs, ask, side="right")) / highs.size * 100
+                       if highs.size else np.zeros(ask.shape))
+        ref = self.reference_mid[segment]
+        discount = (ref - ask) / ref * 100
+        out = {"percentile": percentile, "share_above": share_above, "discount_pct": discount}
+        return {k: float(v) for k, v in out.items()} if ask.ndim == 0 else out
+
+    def sweep(self, asking=None) -> dict:
+        """JSON-ready curve for every segment with openings over ``asking`` (default ``sweep_range()``)."""
+        ask = sweep_range() if asking is None else np.asarray(asking, dtype=np.float64)
+        segments = {}
+        for name in self.segments:
+            if not self.openings(name):
+                continue
+            curve = self.lookup(ask, name)
+            segments[name] = {
+                "openings": self.openings(name),
+                "median_midpoint": round(self.reference_mid[name]),
+                **{k: np.round(v, 1).tolist() for k, v in curve.items()},
+            }
+        return {"asking": ask.astype(np.int64).tolist(), "segments": segments}
@@ -0,0 +1,164 @@
+"""
+Skill Frequency and Co-Occurrence
+=================================
+Measures how often each skill appears in the posting corpus and how often
+skills appear together, so rarity and demand come from the data instead
+of hand-assigned numbers.
+
+A posting mentions a skill when its title matches one of the skill's
+phrases in the ``TermIndex``, or when it was returned by a search
+category that stands for the skill. From the skill × posting incidence
+lists the matrix keeps:
+
+* document frequency per skill, and
+* a sparse (CSR) skill × skill co-occurrence matrix holding only
+  the nonzero pairs,
+
+so single skills and pairs are O(1) lookups. Larger combinations intersect
+(or, with ``any_of``, union) the incidence lists once and are memoized.
+Sample counts are scaled to Dice-wide listing estimates using each
+category's ``total_results``.
+"""
+
+import math
+
+import numpy as np
+
+from listing_store import ListingStore
+from term_index import TermIndex
+
+
+def rarity_score(listings: float, market_total: int) -> int:
+    """1 (everywhere) … 10 (nowhere): log-scaled share of the market's listings."""
+    if market_total <= 0:
+        return 10
+    share = math.log1p(max(listings, 0)) / math.log1p(market_total)
+    return int(min(10, max(1, round(10 - 9 * share))))
+
+
+def rarity_tier(score: int) -> str:
+    if score >= 9:
+        return "ULTRA-RARE"
+    if score >= 7:
+        return "RARE"
+    if score >= 5:
+        return "MODERATE"
+    return "IN-DEMAND"
+
+
+class SkillMatrix:
+    """Per-skill posting lists, frequencies and sparse co-occurrence counts."""
+
+    def __init__(self, skills: list[str], rows: list[np.ndarray], store: ListingStore):
+        self.skills = skills
+        self._ids = {name: i for i, name in enumerate(skills)}
+        self._rows = rows
+        self.n_rows = len(store)
+        self.df = np.array([len(r) for r in rows], dtype=np.int64)
+        self._category = store.category
+        self._salary_high = store.salary_high
+        self._category_rows = np.bincount(store.category, minlength=len(store.categories))
+        self._category_totals = store.total_results
+        self._combos: dict[tuple[bool, tuple[int, ...]], np.ndarray] = {}
+        self._build_cooccurrence()
+
+    @classmethod
+    def build(cls, store: ListingStore, index: TermIndex, terms: dict,
+              categories: dict | None = None) -> "SkillMatrix":
+        """``terms``: skill → alternative title phrases; ``categories``: skill → search category
+        whose every result counts as mentioning the skill."""
+        rows = []
+        for skill, phrases in terms.items():
+            hit = index.any_of(*phrases).astype(np.int64)
+            category = (categories or {}).get(skill)
+            if category is not None:
+                hit = np.union1d(hit, np.flatnonzero(store.category_mask(category)))
+            rows.append(hit)
+        return cls(list(terms), rows, store)
+
+    def _build_cooccurrence(self):
+        """CSR over skills: for skill i, ``indices`` are co-occurring skills, ``data`` the counts."""
+        k = len(self.skills)
+        skill_of = np.repeat(np.arange(k, dtype=np.int64), self.df)
+        row_of = np.concatenate(self._rows) if k else np.zeros(0, dtype=np.int64)
+        # Group (row, skill) by row, then emit every skill pair within each row.
+        order = np.lexsort((skill_of, row_of))
+        row_of, skill_of = row_of[order], skill_of[order]
+        starts = np.flatnonzero(np.concatenate(([True], row_of[1:] != row_of[:-1]))) if row_of.size \
+            else np.zeros(0, dtype=np.int64)
+        sizes = np.diff(np.append(starts, row_of.size))
+        a_parts, b_parts = [], []
+        for size in np.unique(sizes):  # rows with the same number of skills, in one batch
+            base = starts[sizes == size]
+            members = skill_of[base[:, None] + np.arange(size)]
+            ii, jj = np.triu_indices(size)
+            a_parts.append(members[:, ii].ravel())
+            b_parts.append(members[:, jj].ravel())
+        a = np.concatenate(a_parts) if a_parts else np.zeros(0, dtype=np.int64)
+        b = np.concatenate(b_parts) if b_parts else np.zeros(0, dtype=np.int64)
+        a, b = np.concatenate((a, b[a != b])), np.concatenate((b, a[a != b]))  # symmetric
+        pair, counts = np.unique(a * max(k, 1) + b, return_counts=True)
+        self.indptr = np.searchsorted(pair // max(k, 1), np.arange(k + 1))
+        self.indices = pair % max(k, 1)
+        self.data = counts
+
+    # ── lookups ──
+
+    def _id(self, skill: str) -> int:
+        try:
+            return self._ids[skill]
+        except KeyError:
+            raise KeyError(f"unknown skill {skill!r}") from None
+
+    def pair(self, a: str, b: str) -> int:
+        """Postings mentioning both skills (``pair(a, a)`` is a's frequency)."""
+        i, j = self._id(a), self._id(b)
+        lo, hi = self.indptr[i], self.indptr[i + 1]
+        pos = lo + np.searchsorted(self.indices[lo:hi], j)
+        return int(self.data[pos]) if pos < hi and self.indices[pos] == j else 0
+
+    def rows(self, *skills, any_of: bool = False) -> np.ndarray:
+        """Postings mentioning every one of ``skills`` (with ``any_of``, at least one); memoized."""
+        ids = tuple(sorted({self._id(s) for s in skills}))
+        key = (any_of, ids)
+        if key not in self._combos:
+            lists = sorted((self._rows[i] for i in ids), key=len)
+            if any_of:
+                out = np.unique(np.concatenate(lists)) if lists else np.zeros(0, dtype=np.int64)
+            else:
+                out = lists[0] if lists else np.arange(self.n_rows)
+                for other in lists[1:]:
+                    out = np.intersect1d(out, other, assume_unique=True)
+            self._combos[key] = out
+        return self._combos[key]
+
+    def count(self, *skills, any_of: bool = False) -> int:
+        ids = {self._id(s) for s in skills}
+        if len(ids) == 1:
+            return int(self.df[ids.pop()])
+        if len(ids) == 2 and not any_of:
+            return self.pair(*(self.skills[i] for i in ids))
+        return len(self.rows(*skills, any_of=any_of))
+
+    def estimated_listings(self, *skills, any_of: bool = False) -> int:
+        """Dice-wide listings for the combination: each category's total × its sampled match rate."""
+        rows = self.rows(*skills, any_of=any_of)
+        hits = np.bincount(self._category[rows], minlength=len(self._category_rows))
+        rate = np.divide(hits, self._category_rows, out=np.zeros(len(hits)),
+                         where=self._category_rows > 0)
+        return round(float((rate * self._category_totals).sum()))
+
+    def salary_ceiling(self, *skills, any_of: bool = False) -> int:
+        """Highest posted high among the combination's postings (0 when none posts a salary)."""
+        highs = self._salary_high[self.rows(*skills, any_of=any_of)]
+        highs = highs[~np.isnan(highs)]
+        return int(highs.max()) if highs.size else 0
+
+    def cooccurrence(self) -> dict:
+        """``{skill: {other skill: postings with both}}`` for every nonzero pair."""
+        out = {}
+        for i, skill in enumerate(self.skills):
+            lo, hi = self.indptr[i], self.indptr[i + 1]
+            out[skill] = {self.skills[j]: int(n)
+                          for j, n in zip(self.indices[lo:hi], self.data[lo:hi]) if j != i}
+        return out
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Binary Market Snapshots
+=======================
+A versioned on-disk format for a ListingStore plus the derived aggregates
+computed from it, loadable in milliseconds regardless of size.
+
+A snapshot is a directory:
+
+* ``manifest.json`` — format version, row count, content hash and the
+  file, dtype and shape of every array;
+* one ``.npy`` per column (``salary_low.npy``, ``title.npy``, …);
+* each string table as two arrays: its UTF-8 bytes concatenated
+  (``<table>.data.npy``) and the start offset of every value
+  (``<table>.offsets.npy``);
+* ``aggregates.json`` — the derived results (the JSON export), if saved.
+
+Arrays are opened with ``np.load(..., mmap_mode="r")``, so loading maps
+the files without reading them. Only the pages a computation touches are
+paged in, and a script that needs two columns reads two columns. String
+tables are decoded on first use, and only single values are decoded
+for display lookups.
+The stored content hash seeds ``ListingStore.content_hash``, so the
+analysis cache key costs nothing to compute either.
+
+Usage:
+    python3 snapshot.py write market.snapshot   # current market data + aggregates
+    python3 snapshot.py info market.snapshot
+"""
+
+import json
+import os
+import shutil
+
+import numpy as np
+
+from listing_store import ListingStore, StringTable
+
+SNAPSHOT_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+AGGREGATES_NAME = "aggregates.json"
+
+TABLES = ("categories", "strings", "workplaces", "job_types")
+
+
+class SnapshotError(ValueError):
+    """The directory is not a snapshot this version can read."""
+
+
+class MappedStringTable(StringTable):
+    """StringTable over a snapshot's encoded bytes; values are decoded on first use."""
+
+    def __init__(self, data: np.ndarray, offsets: np.ndarray):
+        self._data = data
+        self._offsets = offsets
+        self._lengths = np.zeros(0, dtype=np.int32)
+
+    def __getattr__(self, name):
+        # ``values``/``_codes`` exist only once materialized; until then, decode on demand.
+        if name not in ("values", "_codes"):
+            raise AttributeError(name)
+        buf = self._data.tobytes()
+        bounds = self._offsets.tolist()
+        self.values = [buf[a:b].decode() for a, b in zip(bounds[:-1], bounds[1:])]
+        self._codes = {v: i for i, v in enumerate(self.values)}
+        return self.__dict__[name]
+
+    def __getitem__(self, code: int) -> str:
+        if "values" in self.__dict__:
+            return self.values[code]
+        return self._data[self._offsets[code]:self._offsets[code + 1]].tobytes().decode()
+
+    def __len__(self) -> int:
+        if "values" in self.__dict__:
+            return len(self.values)
+        return len(self._offsets) - 1
+
+    def decode(self, codes) -> list[str]:
+        values = self.values  # bulk lookups: decode the table once
+        return [values[c] for c in codes]
+
+
+def _encode_table(table: StringTable) -> tuple[np.ndarray, np.ndarray]:
+    encoded = [v.encode() for v in table.values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+def write_snapshot(path: str, store: ListingStore, aggregates: dict | None = None) -> dict:
+    """Write ``store`` (and ``aggregates``) to the snapshot directory ``path``; returns the manifest.
+
+    The snapshot is assembled next to ``path`` and swapped in when complete,
+    so readers never see a half-written one.
+    """
+    tmp = f"{path}.tmp"
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+    arrays = {name: np.ascontiguousarray(col) for name, col in store.columns().items()}
+    arrays["total_results"] = store.total_results
+    for table in TABLES:
+        arrays[f"{table}.data"], arrays[f"{table}.offsets"] = _encode_table(getattr(store, table))
+    entries = {}
+    for name, arr in arrays.items():
+        np.save(os.path.join(tmp, f"{name}.npy"), arr)
+        entries[name] = {"file": f"{name}.npy", "dtype": arr.dtype.str, "shape": list(arr.shape)}
+    manifest = {
+        "version": SNAPSHOT_VERSION,
+        "rows": len(store),
+        "content_hash": store.content_hash(),
+        "columns": list(ListingStore.COLUMNS),
+        "arrays": entries,
+        "notes": store.notes,
+        "aggregates": AGGREGATES_NAME if aggregates is not None else None,
+    }
+    if aggregates is not None:
+        with open(os.path.join(tmp, AGGREGATES_NAME), "w", encoding="utf-8") as f:
+            json.dump(aggregates, f, default=str)
+    with open(os.path.join(tmp, MANIFEST_NAME), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+    old = f"{path}.old"
+    if os.path.exists(path):
+        os.replace(path, old)
+    os.replace(tmp, path)
+    shutil.rmtree(old, ignore_errors=True)
+    return manifest
+
+
+class Snapshot:
+    """A snapshot directory opened for reading; arrays are memory-mapped on first access."""
+
+    def __init__(self, path: str, mmap: bool = True):
+        self.path = path
+        self.mmap_mode = "r" if mmap else None
+        try:
+            with open(os.path.join(path, MANIFEST_NAME), encoding="utf-8") as f:
+                self.manifest = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            raise SnapshotError(f"{path}: not a snapshot ({e})") from None
+        if self.manifest.get("version") != SNAPSHOT_VERSION:
+            raise SnapshotError(f"{path}: snapshot version {self.manifest.get('version')}, "
+                                f"expected {SNAPSHOT_VERSION}")
+        self._arrays: dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return self.manifest["rows"]
+
+    @property
+    def content_hash(self) -> str:
+        return self.manifest["content_hash"]
+
+    def array(self, name: str) -> np.ndarray:
+        if name not in self._arrays:
+            entry = self.manifest["arrays"].get(name)
+            if entry is None:
+                raise KeyError(f"{self.path}: no array {name!r}")
+            self._arrays[name] = np.load(os.path.join(self.path, entry["file"]),
+                                         mmap_mode=self.mmap_mode, allow_pickle=False)
+        return self._arrays[name]
+
+    def column(self, name: str) -> np.ndarray:
+        """One store column, e.g. ``salary_high``, without touching the others."""
+        if name not in self.manifest["columns"]:
+            raise KeyError(f"{self.path}: no column {name!r}")
+        return self.array(name)
+
+    def table(self, name: str) -> MappedStringTable:
+        return MappedStringTable(self.array(f"{name}.data"), self.array(f"{name}.offsets"))
+
+    def store(self) -> ListingStore:
+        """The full ListingStore, every column mapped rather than read."""
+        columns = {name: self.column(name) for name in self.manifest["columns"]}
+        return ListingStore(columns, *(self.table(t) for t in TABLES),
+                            self.array("total_results"), dict(self.manifest["notes"]),
+                            content_hash=self.content_hash)
+
+    def aggregates(self) -> dict | None:
+        """The derived results saved with the snapshot, or None."""
+        name = self.manifest.get("aggregates")
+        if not name:
+            return None
+        with open(os.path.join(self.path, name), encoding="utf-8") as f:
+            return json.load(f)
+
+
+def load_snapshot(path: str, mmap: bool = True) -> ListingStore:
+    return Snapshot(path, mmap).store()
+
+
+# ── MAIN ──
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Write or inspect a binary market snapshot.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    write = sub.add_parser("write", help="snapshot the current market data and its aggregates")
+    write.add_argument("path")
+    info = sub.add_parser("info", help="show a snapshot's manifest")
+    info.add_argument("path")
+    args = parser.parse_args()
+
+    if args.command == "write":
+        from nashville_market_analysis import CACHE_DIR, AnalysisContext
+
+        ctx = AnalysisContext(cache_dir=CACHE_DIR)
+        start = time.perf_counter()
+        manifest = write_snapshot(args.path, ctx.store, ctx.json_data())
+        print(f"✅ Wrote {manifest['rows']:,} rows to {args.path} "
+              f"in {time.perf_counter() - start:.2f}s")
+    else:
+        start = time.perf_counter()
+        snap = Snapshot(args.path)
+        elapsed = time.perf_counter() - start
+        size = sum(os.path.getsize(os.path.join(args.path, e["file"]))
+                   for e in snap.manifest["arrays"].values())
+        print(f"{args.path}: version {snap.manifest['version']}, {len(snap):,} rows, "
+              f"{size / 1e6:.1f} MB, opened in {elapsed * 1000:.1f} ms")
+        print(f"  content hash: {snap.content_hash}")
+        for name, entry in snap.manifest["arrays"].items():
+            print(f"  {name:24} {entry['dtype']:6} {tuple(entry['shape'])}")
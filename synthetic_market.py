@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Synthetic Market Data
+=====================
+Seeded generator of realistic job postings at any scale (10³ to 10⁸
+rows), written as a stream in the ingestion formats (JSONL or CSV, with
+``ingestion.RECORD_FIELDS``), so that every loader and analysis can be
+exercised on large, reproducible inputs.
+
+The vocabulary comes from the real market data. It uses the search
+categories, weighted by their Dice ``total_results`` (category
+imbalance). Titles are taken per category, and companies are the real
+ones plus generated names, drawn with Zipf-like frequencies. On top of
+that, ``MarketProfile`` sets:
+
+* salary midpoints — lognormal around each category's real median
+  midpoint (long right tail), with a gamma-distributed range width;
+* the hourly/annual mix — contracts mostly quote hourly rates, other
+  postings rarely; hourly values are emitted as rates, as sources do;
+* missing salaries (``None``), the Nashville-local share and the
+  workplace (remote/hybrid/on-site) and job type mix;
+* duplicates — reposts copying an earlier posting of the same block.
+  With a vocabulary this size, large outputs also repeat postings by
+  chance, mostly among those without a salary.
+
+Rows are generated in fixed blocks of ``BLOCK_ROWS``, each from its own
+``(seed, block)`` random stream, with columns drawn as NumPy arrays. A
+seed therefore gives the same rows whatever the total size. The first
+million rows of a 10⁸-row file equal a 10⁶-row file, and any block can
+be regenerated on its own. Output lines are filled into a byte template
+from strings encoded once per run, so memory stays constant.
+
+Usage:
+    python3 synthetic_market.py 1e6 postings.jsonl.gz [--seed 7]
+    python3 synthetic_market.py 1e8 postings.csv.gz --seed 7
+"""
+
+import json
+from dataclasses import dataclass
+
+import numpy as np
+
+from ingestion import HOURS_PER_YEAR, RECORD_FIELDS, records_from_market_searches
+
+BLOCK_ROWS = 65_536
+DEFAULT_SEED = 2026
+
+NASHVILLE = "Nashville, TN"
+REMOTE = "Remote"
+NATIONAL_LOCATIONS = [
+    "New York, NY", "San Francisco, CA", "Seattle, WA", "Austin, TX", "Chicago, IL",
+    "Atlanta, GA", "Boston, MA", "Denver, CO", "Dallas, TX", "Charlotte, NC",
+    "Raleigh, NC", "Indianapolis, IN", "Columbus, OH", "Phoenix, AZ", "Minneapolis, MN",
+    "Washington, DC", "Los Angeles, CA", "Salt Lake City, UT", "Tampa, FL", "Louisville, KY",
+]
+# Generated employer names, in addition to the real companies.
+_COMPANY_PREFIXES = ["Summit", "Harbor", "Cedar", "Vertex", "Bluegrass", "Meridian", "Pioneer",
+                     "Granite", "Riverbend", "Keystone", "Northstar", "Magnolia", "Ironwood",
+                     "Lakeshore", "Beacon", "Copperline"]
+_COMPANY_MIDDLES = ["Valley", "Ridge", "Point", "Creek", "Bridge", "Stone", "Park", "Field",
+                    "Gate", "Rock", "Springs", "Hill", "Bay", "Crest", "Forge", "Union"]
+_COMPANY_SUFFIXES = ["Health", "Analytics", "Financial", "Systems", "Logistics", "Labs",
+                     "Insurance", "Partners", "Software", "Consulting", "Retail", "Energy"]
+
+CONTRACT_TYPES = ("Contract", "Contract-to-Hire")
+
+
+@dataclass(frozen=True)
+class MarketProfile:
+    """Shape of the generated market; shares are fractions of all postings."""
+    nashville_share: float = 0.25
+    workplace_shares: tuple = (("Remote", 0.30), ("Hybrid", 0.12), ("On-Site", 0.15), ("", 0.43))
+    type_shares: tuple = (("Full-time", 0.36), ("Contract", 0.30), ("Contract-to-Hire", 0.04),
+                          ("Part-time", 0.02), ("", 0.28))
+    hourly_share: float = 0.05           # non-contract postings quoting an hourly rate
+    contract_hourly_share: float = 0.70  # contract postings quoting an hourly rate
+    missing_salary_share: float = 0.30
+    duplicate_share: float = 0.05
+    salary_sigma: float = 0.35           # lognormal shape of midpoints around the category median
+    range_width: float = 0.30            # mean of high / low - 1
+    company_skew: float = 1.1            # Zipf exponent of company frequencies
+
+
+def _json_literal(value: str) -> bytes:
+    return json.dumps(value, ensure_ascii=False).encode()
+
+
+def _csv_literal(value: str) -> bytes:
+    if any(c in value for c in ',"\r\n'):
+        value = '"' + value.replace('"', '""') + '"'
+    return value.encode()
+
+
+def _salary_literals(values: np.ndarray, missing: bytes) -> list[bytes]:
+    """Literal per value (NaN → ``missing``); each distinct salary is formatted once."""
+    uniq, inverse = np.unique(values, return_inverse=True)
+    literals = [missing if v != v else b"%d" % v if v == int(v) else repr(v).encode()
+                for v in uniq.tolist()]
+    return [literals[i] for i in inverse.reshape(-1).tolist()]
+
+
+class Vocabulary:
+    """Categories, titles, companies and locations to draw from, with their weights."""
+
+    def __init__(self, search_data: dict, company_skew: float = 1.1):
+        records = list(records_from_market_searches(search_data))
+        self.categories = list(search_data)
+        totals = np.array([max(search_data[c].get("total_results", 1), 1) for c in self.categories],
+                          dtype=np.float64)
+        self.category_weights = totals / totals.sum()
+
+        mids = {c: [] for c in self.categories}
+        titles = {c: {} for c in self.categories}
+        companies, local_locations = {}, {NASHVILLE: None}
+        for rec in records:
+            titles[rec["category"]].setdefault(rec["title"] or rec["category"])
+            if rec["company"]:
+                companies.setdefault(rec["company"])
+            if rec["nashville_local"] and rec["location"] and rec["location"] != REMOTE:
+                local_locations.setdefault(rec["location"])
+            if rec["salary_min"] is not None and rec["salary_max"] is not None:
+                mids[rec["category"]].append((rec["salary_min"] + rec["salary_max"]) / 2)
+        overall = float(np.median([m for ms in mids.values() for m in ms]))
+        self.median_mid = np.array([float(np.median(mids[c])) if mids[c] else overall
+                                    for c in self.categories])
+
+        # Titles of every category in one list; category c owns [offsets[c], offsets[c + 1]).
+        per_category = [list(titles[c]) or [c] for c in self.categories]
+        self.titles = [t for ts in per_category for t in ts]
+        self.title_counts = np.array([len(ts) for ts in per_category])
+        self.title_offsets = np.concatenate(([0], np.cumsum(self.title_counts)[:-1]))
+
+        self.companies = list(companies) + [f"{a} {b} {c}" for a in _COMPANY_PREFIXES
+                                            for b in _COMPANY_MIDDLES for c in _COMPANY_SUFFIXES]
+        ranks = np.arange(1, len(self.companies) + 1, dtype=np.float64)
+        weights = ranks ** -company_skew
+        self.company_weights = weights / weights.sum()
+
+        # Locations: Nashville-area ones, then REMOTE, then national metros.
+        self.locations = list(local_locations) + [REMOTE] + NATIONAL_LOCATIONS
+        self.n_local_locations = len(local_locations)
+
+
+class SyntheticMarket:
+    """Reproducible synthetic postings: ``blocks`` (columns), ``records`` (dicts), ``store`` or ``write``."""
+
+    def __init__(self, seed: int = DEFAULT_SEED, profile: MarketProfile | None = None,
+                 search_data: dict | None = None):
+        if search_data is None:
+            from market_data import market_searches as search_data
+        self.seed = seed
+        self.profile = profile or MarketProfile()
+        self.vocab = Vocabulary(search_data, self.profile.company_skew)
+        self.workplaces, wp_shares = zip(*self.profile.workplace_shares)
+        self.job_types, type_shares = zip(*self.profile.type_shares)
+        self._wp_p = np.array(wp_shares) / sum(wp_shares)
+        self._type_p = np.array(type_shares) / sum(type_shares)
+        self._remote = self.workplaces.index(REMOTE) if REMOTE in self.workplaces else -1
+        self._contract = np.isin(self.job_types, CONTRACT_TYPES)
+
+    def block(self, index: int) -> dict[str, np.ndarray]:
+        """Columns of block ``index`` (``BLOCK_ROWS`` rows); string columns hold vocabulary codes.
+
+        ``salary_min``/``salary_max`` are in the posting's unit (NaN when
+        missing) and ``hourly`` marks rates quoted per hour.
+        """
+        rng = np.random.default_rng((self.seed, index))
+        v, p, n = self.vocab, self.profile, BLOCK_ROWS
+
+        category = rng.choice(len(v.categories), n, p=v.category_weights)
+        title = v.title_offsets[category] + (rng.random(n) * v.title_counts[category]).astype(np.int64)
+        company = rng.choice(len(v.companies), n, p=v.company_weights)
+        workplace = rng.choice(len(self.workplaces), n, p=self._wp_p)
+        job_type = rng.choice(len(self.job_types), n, p=self._type_p)
+        local = rng.random(n) < p.nashville_share
+        # Local postings sit in the Nashville area; the rest in a metro, or "Remote" when remote.
+        national = v.n_local_locations + 1 + rng.integers(0, len(NATIONAL_LOCATIONS), n)
+        location = np.where(local, rng.integers(0, v.n_local_locations, n),
+                            np.where(workplace == self._remote, v.n_local_locations, national))
+
+        mid = v.median_mid[category] * rng.lognormal(0.0, p.salary_sigma, n)
+        ratio = 1 + rng.gamma(2.0, p.range_width / 2, n)
+        low, high = mid / np.sqrt(ratio), mid * np.sqrt(ratio)
+        hourly = rng.random(n) < np.where(self._contract[job_type], p.contract_hourly_share,
+                                          p.hourly_share)
+        # Annual salaries to the nearest $500, hourly rates to the nearest quarter.
+        low = np.where(hourly, np.round(low / HOURS_PER_YEAR * 4) / 4, np.round(low / 500) * 500)
+        high = np.where(hourly, np.round(high / HOURS_PER_YEAR * 4) / 4, np.round(high / 500) * 500)
+        missing = rng.random(n) < p.missing_salary_share
+        low[missing] = high[missing] = np.nan
+
+        # Reposts: a duplicate row copies an earlier row of the block.
+        source = np.arange(n)
+        dup = np.flatnonzero(rng.random(n) < p.duplicate_share)
+        dup = dup[dup > 0]
+        source[dup] = (rng.random(dup.size) * dup).astype(np.int64)
+        columns = {"category": category, "title": title, "company": company, "location": location,
+                   "type": job_type, "workplace": workplace, "salary_min": low, "salary_max": high,
+                   "hourly": hourly, "nashville_local": local}
+        return {name: col[source] for name, col in columns.items()}
+
+    def blocks(self, n_rows: int):
+        """``(block columns, rows to use)`` covering the first ``n_rows`` postings."""
+        for index in range(-(-n_rows // BLOCK_ROWS)):
+            yield self.block(index), min(BLOCK_ROWS, n_rows - index * BLOCK_ROWS)
+
+    def _tables(self) -> dict[str, list[str]]:
+        v = self.vocab
+        return {"category": v.categories, "title": v.titles, "company": v.companies,
+                "location": v.locations, "type": list(self.job_types),
+                "workplace": list(self.workplaces)}
+
+    def records(self, n_rows: int):
+        """The first ``n_rows`` postings as ingestion records (``RECORD_FIELDS`` dicts)."""
+        tables = self._tables()
+        for cols, n in self.blocks(n_rows):
+            text = {name: [table[c] for c in cols[name][:n].tolist()] for name, table in tables.items()}
+            lows = np.where(np.isnan(cols["salary_min"][:n]), None, cols["salary_min"][:n]).tolist()
+            highs = np.where(np.isnan(cols["salary_max"][:n]), None, cols["salary_max"][:n]).tolist()
+            units = np.where(cols["hourly"][:n], "hour", "year").tolist()
+            for i, local in enumerate(cols["nashville_local"][:n].tolist()):
+                yield {"category": text["category"][i], "title": text["title"][i],
+                       "company": text["company"][i], "location": text["location"][i],
+                       "type": text["type"][i], "workplace": text["workplace"][i],
+                       "salary_min": lows[i], "salary_max": highs[i], "salary_unit": units[i],
+                       "nashville_local": local}
+
+    def store(self, n_rows: int):
+        """The first ``n_rows`` postings loaded through ``ingestion.load_records``.
+
+        Category result totals are the loaded counts, as in ``ingestion.load_files``.
+        """
+        from ingestion import load_records
+
+        store = load_records(self.records(n_rows),
+                             category_totals={c: 0 for c in self.vocab.categories})
+        counts = np.bincount(store.category, minlength=len(store.categories))
+        store.total_results = counts.astype(np.int64)
+        return store
+
+    def lines(self, n_rows: int, fmt: str = "jsonl"):
+        """Encoded output, one bytes buffer per block; ``fmt`` is "jsonl" or "csv"."""
+        if fmt == "jsonl":
+            literal, missing, true, false = _json_literal, b"null", b"true", b"false"
+            template = ("{" + ",".join(f'"{f}":%s' for f in RECORD_FIELDS) + "}\n").encode()
+        elif fmt == "csv":
+            literal, missing, true, false = _csv_literal, b"", b"True", b"False"
+            template = b",".join([b"%s"] * len(RECORD_FIELDS)) + b"\r\n"
+            yield ",".join(RECORD_FIELDS).encode() + b"\r\n"
+        else:
+            raise ValueError(f"unknown format {fmt!r}; expected 'jsonl' or 'csv'")
+        tables = {name: [literal(s) for s in table] for name, table in self._tables().items()}
+        units = [literal("year"), literal("hour")]
+        for cols, n in self.blocks(n_rows):
+            text = [[table[c] for c in cols[name][:n].tolist()]
+                    for name, table in tables.items()]
+            yield b"".join(template % (cat, title, company, loc, typ, wp, low, high,
+                                       units[hourly], true if local else false)
+                           for cat, title, company, loc, typ, wp, low, high, hourly, local in zip(
+                               *text, _salary_literals(cols["salary_min"][:n], missing),
+                               _salary_literals(cols["salary_max"][:n], missing),
+                               cols["hourly"][:n].tolist(), cols["nashville_local"][:n].tolist()))
+
+    def write(self, path: str, n_rows: int, fmt: str | None = None) -> int:
+        """Stream the first ``n_rows`` postings to ``path`` (``.jsonl``/``.csv``, optionally
+        ``.gz``); returns the bytes written before compression."""
+        from ndjson_export import open_output
+
+        if fmt is None:
+            base = path[:-3] if path.endswith(".gz") else path
+            fmt = "csv" if base.endswith(".csv") else "jsonl"
+        size = 0
+        with open_output(path, "gzip" if path.endswith(".gz") else "") as out:
+            for buf in self.lines(n_rows, fmt):
+                out.write(buf)
+                size += len(buf)
+        return size
+
+
+def generate_records(n_rows: int, seed: int = DEFAULT_SEED, profile: MarketProfile | None = None):
+    """Shorthand for ``SyntheticMarket(seed, profile).records(n_rows)``."""
+    return SyntheticMarket(seed, profile).records(n_rows)
+
+
+# ── MAIN ──
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Write seeded synthetic postings for load testing.")
+    parser.add_argument("rows", type=lambda s: int(float(s)), help="postings to generate (e.g. 1e6)")
+    parser.add_argument("output", help="output path (.jsonl or .csv, optionally .gz)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    size = SyntheticMarket(args.seed).write(args.output, args.rows)
+    elapsed = time.perf_counter() - start
+    print(f"✅ Wrote {args.rows:,} postings ({size / 1e6:.1f} MB) to {args.output} "
+          f"in {elapsed:.2f}s ({args.rows / elapsed:,.0f} rows/s)")
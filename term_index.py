@@ -0,0 +1,201 @@
+"""
+Inverted Term Index
+===================
+Maps every token in the postings' titles (national sample labels keep
+their specialization there, e.g. ``Data Analyst – SQL/Python``) and any
+extra per-row text (e.g. descriptions when a source provides them) to the
+sorted row numbers of the postings that contain it. Company names are
+not indexed, so an employer's name never matches a skill query.
+
+Postings lists live in one CSR layout: a sorted vocabulary, an
+``offsets`` array and a single uint32 ``postings`` array, so a term's
+rows are a zero-copy slice. Text is tokenized once per interned
+string rather than per row. A query phrase matches the rows containing
+all of its tokens; several phrases are intersected (AND) or unioned
+(OR), smallest list first.
+
+The index is saved as an ``.npz`` keyed by the store's content hash,
+so it is built once per data snapshot and reloaded after that.
+"""
+
+import os
+import re
+
+import numpy as np
+
+from listing_store import ListingStore
+
+INDEX_VERSION = 4
+
+# Interned text columns indexed for every row.
+TEXT_COLUMNS = ("title",)
+
+_TOKEN = re.compile(r"[a-z0-9+#]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lower-cased alphanumeric tokens (``+`` and ``#`` kept, so C++ and C# survive)."""
+    return _TOKEN.findall(text.lower())
+
+
+class TermIndex:
+    """Inverted index over a ListingStore's rows."""
+
+    def __init__(self, vocab: list[str], offsets: np.ndarray, postings: np.ndarray,
+                 n_rows: int, snapshot: str = ""):
+        self.vocab = vocab
+        self.offsets = offsets      # int64, len(vocab) + 1
+        self.postings = postings    # uint32 row numbers, sorted within each term
+        self.n_rows = n_rows
+        self.snapshot = snapshot    # content hash of the store it was built from
+        self._ids = {term: i for i, term in enumerate(vocab)}
+
+    @classmethod
+    def build(cls, store: ListingStore, extra_text=None, columns=TEXT_COLUMNS) -> "TermIndex":
+        """Index every row's text ``columns``.
+
+        ``extra_text`` is an optional per-row string sequence.
+        """
+        # Tokens per interned string, then expanded to the rows using that string.
+        term_ids: dict[str, int] = {}
+        tokens: dict[int, list[int]] = {}
+        term_parts, row_parts = [], []
+        for column in columns:
+            codes = getattr(store, column)
+            pair_terms, pair_strings = [], []
+            for code in np.unique(codes).tolist():
+                if code not in tokens:
+                    tokens[code] = [term_ids.setdefault(t, len(term_ids))
+                                    for t in set(tokenize(store.strings[code]))]
+                pair_terms.extend(tokens[code])
+                pair_strings.extend([code] * len(tokens[code]))
+            pair_terms = np.asarray(pair_terms, dtype=np.int64)
+            pair_strings = np.asarray(pair_strings, dtype=np.int64)
+
+            by_string = np.argsort(codes, kind="stable")
+            string_counts = np.bincount(codes, minlength=len(store.strings))
+            string_starts = np.concatenate(([0], np.cumsum(string_counts)[:-1]))
+            counts = string_counts[pair_strings]
+            # rows of each (term, string) pair, laid end to end
+            seg_start = np.repeat(string_starts[pair_strings] - np.concatenate(([0], np.cumsum(counts)[:-1])),
+                                  counts)
+            rows = by_string[seg_start + np.arange(counts.sum())]
+            row_parts.append(rows)
+            term_parts.append(np.repeat(pair_terms, counts))
+        rows = np.concatenate(row_parts) if row_parts else np.zeros(0, dtype=np.int64)
+        terms = np.concatenate(term_parts) if term_parts else np.zeros(0, dtype=np.int64)
+
+        if extra_text is not None:
+            extra_terms, extra_rows = [], []
+            for row, text in enumerate(extra_text):
+                for term in set(tokenize(text or "")):
+                    extra_terms.append(term_ids.setdefault(term, len(term_ids)))
+                    extra_rows.append(row)
+            terms = np.concatenate((terms, np.asarray(extra_terms, dtype=np.int64)))
+            rows = np.concatenate((rows, np.asarray(extra_rows, dtype=np.int64)))
+
+        # Renumber terms alphabetically, then sort pairs by (term, row) and drop repeats.
+        vocab = sorted(term_ids)
+        rank = np.empty(len(term_ids), dtype=np.int64)
+        rank[[term_ids[t] for t in vocab]] = np.arange(len(vocab))
+        terms = rank[terms]
+        key = np.sort(terms * max(len(store), 1) + rows)
+        key = key[np.concatenate(([True], key[1:] != key[:-1]))] if key.size else key
+        terms, rows = key // max(len(store), 1), key % max(len(store), 1)
+        offsets = np.concatenate(([0], np.cumsum(np.bincount(terms, minlength=len(vocab)))))
+        return cls(vocab, offsets.astype(np.int64), rows.astype(np.uint32), len(store),
+                   store.content_hash())
+
+    # ── lookups ──
+
+    def __len__(self) -> int:
+        return len(self.vocab)
+
+    def __contains__(self, term: str) -> bool:
+        return term in self._ids
+
+    def term_rows(self, term: str) -> np.ndarray:
+        i = self._ids.get(term)
+        if i is None:
+            return np.zeros(0, dtype=np.uint32)
+        return self.postings[self.offsets[i]:self.offsets[i + 1]]
+
+    def phrase_rows(self, phrase: str) -> np.ndarray:
+        """Rows containing every token of ``phrase`` (in any order)."""
+        return self._intersect([self.term_rows(t) for t in tokenize(phrase)])
+
+    @staticmethod
+    def _intersect(lists) -> np.ndarray:
+        if not lists:
+            return np.zeros(0, dtype=np.uint32)
+        lists = sorted(lists, key=len)
+        out = lists[0]
+        for other in lists[1:]:
+            if not out.size:
+                break
+            out = np.intersect1d(out, other, assume_unique=True)
+        return out
+
+    def all_of(self, *phrases) -> np.ndarray:
+        """Rows matching every phrase, e.g. ``all_of("python", "power bi")``."""
+        return self._intersect([self.phrase_rows(p) for p in phrases])
+
+    def any_of(self, *phrases) -> np.ndarray:
+        """Rows matching at least one phrase."""
+        lists = [self.phrase_rows(p) for p in phrases]
+        if len(lists) == 1:
+            return lists[0]
+        hit = np.zeros(self.n_rows, dtype=bool)
+        for rows in lists:
+            hit[rows] = True
+        return np.flatnonzero(hit).astype(np.uint32)
+
+    def document_frequency(self, phrase: str) -> int:
+        return len(self.phrase_rows(phrase))
+
+    def mask(self, rows) -> np.ndarray:
+        out = np.zeros(self.n_rows, dtype=bool)
+        out[rows] = True
+        return out
+
+    def match_counts(self, skills: dict) -> np.ndarray:
+        """Per row, how many skills it matches; ``skills`` maps name → alternative phrases."""
+        counts = np.zeros(self.n_rows, dtype=np.int64)
+        for phrases in skills.values():
+            counts[self.any_of(*phrases)] += 1
+        return counts
+
+    # ── persistence ──
+
+    def save(self, path: str):
+        tmp = f"{path}.tmp.npz"
+        np.savez(tmp, version=INDEX_VERSION, vocab=np.array(self.vocab, dtype=str),
+                 offsets=self.offsets, postings=self.postings, n_rows=self.n_rows,
+                 snapshot=self.snapshot)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> "TermIndex":
+        with np.load(path) as f:
+            if int(f["version"]) != INDEX_VERSION:
+                raise ValueError(f"{path}: index version {int(f['version'])}, expected {INDEX_VERSION}")
+            return cls(f["vocab"].tolist(), f["offsets"], f["postings"], int(f["n_rows"]),
+                       str(f["snapshot"]))
+
+    @classmethod
+    def for_store(cls, store: ListingStore, cache_dir: str | None = None) -> "TermIndex":
+        """Load the index saved for this store's snapshot, or build (and save) it."""
+        if not cache_dir:
+            return cls.build(store)
+        snapshot = store.content_hash()
+        path = os.path.join(cache_dir, f"terms-{snapshot[:16]}.npz")
+        try:
+            index = cls.load(path)
+            if index.snapshot == snapshot:
+                return index
+        except (OSError, ValueError, KeyError):
+            pass
+        index = cls.build(store)
+        os.makedirs(cache_dir, exist_ok=True)
+        index.save(path)
+        return index
@@ -0,0 +1,19 @@
+import os
+import sys
+
+# The modules live at the repository root, not in a package.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+
+def _records(category: str, n: int) -> list[dict]:
+    return [{"category": category, "title": f"Analyst {i}", "company": "Acme", "location": "",
+             "type": "", "workplace": "", "salary_min": 50_000 + i, "salary_max": 60_000 + i,
+             "salary_unit": "year", "nashville_local": i % 2 == 0} for i in range(n)]
+
+
+@pytest.fixture
+def records() -> list[dict]:
+    """Ingestion-format postings for the fake Dice server: 250 Data Analyst, 40 Data Engineer."""
+    return _records("Data Analyst", 250) + _records("Data Engineer", 40)
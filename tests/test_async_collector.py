@@ -0,0 +1,41 @@
+import email.utils
+import math
+import time
+
+from async_collector import collect_market
+from fake_dice_server import FakeDiceServer
+
+CATEGORIES = ["Data Analyst", "Data Engineer"]
+
+
+def test_collects_every_page_despite_http_date_retry_after(records):
+    past = email.utils.formatdate(time.time() - 30, usegmt=True)
+    with FakeDiceServer(records, fail_every=3, retry_after=past) as server:
+        collector = collect_market(server.url, CATEGORIES, page_size=50, backoff=0.001)
+    assert collector.totals == {"Data Analyst": 250, "Data Engineer": 40}
+    assert collector.pages_fetched == 5 + 1
+
+
+def test_latency_overlaps_within_the_concurrency_limit(records):
+    latency, concurrency = 0.1, 4
+    with FakeDiceServer(records, latency=latency) as server:
+        start = time.perf_counter()
+        collector = collect_market(server.url, CATEGORIES, page_size=25, concurrency=concurrency)
+        elapsed = time.perf_counter() - start
+    pages = 10 + 2
+    assert collector.pages_fetched == server.requests == pages
+    assert collector.aggregator.summary()["market_stats"]["sample_count"] == 290
+    assert server.max_in_flight == concurrency
+    serial = pages * latency
+    # first pages together, then the other ten four at a time: ~4 round trips
+    assert elapsed < serial / 2
+
+
+def test_rate_limit_spaces_requests(records):
+    rate = 20.0  # the token bucket's burst is ceil(rate)
+    with FakeDiceServer(records) as server:
+        start = time.perf_counter()
+        collect_market(server.url, CATEGORIES, page_size=10, rate_limit=rate)
+        elapsed = time.perf_counter() - start
+    assert server.requests == 25 + 4
+    assert elapsed >= (server.requests - math.ceil(rate)) / rate * 0.9
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from batch_eval import MarketModel, evaluate_candidates, skill_phrases
+from market_data import candidate
+from nashville_market_analysis import AnalysisContext
+
+
+@pytest.fixture(scope="module")
+def ctx():
+    return AnalysisContext()
+
+
+@pytest.fixture(scope="module")
+def model(ctx):
+    return MarketModel.from_context(ctx)
+
+
+def _candidates(n: int) -> list[dict]:
+    rng = np.random.default_rng(5)
+    skills = candidate["core_skills"]
+    return [{"name": f"c{i}", "asking_salary": int(rng.integers(40, 180)) * 1000,
+             "skills": ";".join(rng.choice(skills, int(rng.integers(0, 4)), replace=False)),
+             "target_market": "Nashville, TN" if i % 3 else "Remote"} for i in range(n)]
+
+
+def _brute_force(model: MarketModel, cand: dict) -> tuple[int, int]:
+    """(matching openings, those paying at least the ask), one dense mask per skill."""
+    market = "nashville" if "Nashville" in cand["target_market"] else "national"
+    hit = np.zeros(len(model.salary_high), dtype=bool)
+    for skill in filter(None, cand["skills"].split(";")):
+        hit[model.index.any_of(*skill_phrases(skill, model.aliases))] = True
+    hit &= model.rows[market]
+    return int(hit.sum()), int((model.salary_high[hit] >= cand["asking_salary"]).sum())
+
+
+def test_single_candidate_matches_value_proposition(ctx, model):
+    result = next(evaluate_candidates(model, [candidate]))
+    value = ctx.value_proposition
+    assert result["market"] == "nashville"
+    assert result["discount_pct_vs_national"] == value["discount_pct_vs_national"]
+    assert result["discount_pct_vs_nashville"] == value["discount_pct_vs_nashville"]
+    assert 0 < result["matching_openings_above_ask"] <= result["matching_openings"]
+
+
+def test_matching_openings_match_brute_force(model):
+    for cand, result in zip(_candidates(60), evaluate_candidates(model, _candidates(60), chunk_size=7)):
+        expected = _brute_force(model, cand)
+        assert (result["matching_openings"], result["matching_openings_above_ask"]) == expected
+
+
+def test_parallel_results_keep_input_order(model):
+    cands = _candidates(200)
+    serial = list(evaluate_candidates(model, cands, chunk_size=16))
+    assert list(evaluate_candidates(model, iter(cands), jobs=2, chunk_size=16)) == serial
+    assert [r["name"] for r in serial] == [c["name"] for c in cands]
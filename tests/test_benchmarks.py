@@ -0,0 +1,62 @@
+import json
+
+import pytest
+
+import benchmarks
+from benchmarks import Benchmark, compare, load_baseline, measure, run_suite
+from cli import build_parser
+from synthetic_market import SyntheticMarket
+
+
+@pytest.fixture
+def in_process(tmp_path, monkeypatch):
+    """Run the suite without worker interpreters, with markets cached under ``tmp_path``."""
+    monkeypatch.setattr(benchmarks, "BENCH_CACHE", str(tmp_path / "cache"))
+    monkeypatch.setattr(benchmarks, "run_isolated", benchmarks.run_worker)
+    return tmp_path
+
+
+def test_compare_flags_growth_past_threshold_and_noise():
+    baseline = {"a@1000": {"time_s": 0.100, "peak_rss_mb": 50.0, "alloc_peak_mb": 4.0},
+                "b@1000": {"time_s": 0.001, "peak_rss_mb": 50.0, "alloc_peak_mb": 4.0}}
+    results = {"a@1000": {"time_s": 0.130, "peak_rss_mb": 51.0, "alloc_peak_mb": 4.0},
+               "b@1000": {"time_s": 0.002, "peak_rss_mb": 50.0, "alloc_peak_mb": 6.0},
+               "c@1000": {"time_s": 9.0}}
+    assert [(key, metric) for key, metric, *_ in compare(results, baseline)] == [
+        ("a@1000", "time_s"), ("b@1000", "alloc_peak_mb")]
+    assert compare(results, baseline, threshold=0.4) == [
+        ("b@1000", "alloc_peak_mb", 4.0, 6.0, 1.5)]
+
+
+def test_load_baseline(tmp_path):
+    path = tmp_path / "baseline.json"
+    assert load_baseline(str(path)) == {}
+    path.write_text(json.dumps({"version": 99, "results": {}}))
+    with pytest.raises(SystemExit):
+        load_baseline(str(path))
+
+
+def test_measure_reports_every_metric():
+    store = SyntheticMarket(1).store(1_000)
+    result = measure(Benchmark("sum", lambda s: s.salary_low, lambda lows: lows.sum()), store, repeat=3)
+    assert result["runs"] == 3
+    assert 0 <= result["time_min_s"] <= result["time_s"]
+    assert result["peak_rss_mb"] > 0 and result["alloc_peak_mb"] >= 0
+
+
+def test_suite_without_baseline_then_against_it(in_process, capsys):
+    baseline = str(in_process / "baseline.json")
+    options = dict(scales=[1_000], patterns=["value_proposition"], repeat=2, baseline_path=baseline)
+    assert run_suite(**options) == 0
+    assert "No baseline" in capsys.readouterr().out
+    assert run_suite(**options, require_baseline=True) == 2
+    assert run_suite(**options, save=True) == 0
+    assert list(load_baseline(baseline)) == ["value_proposition@1000"]
+    assert run_suite(**options, threshold=1e9) == 0
+    assert "No regressions" in capsys.readouterr().out
+
+
+def test_cli_bench_options():
+    args = build_parser().parse_args(["bench", "--scales", "1e3", "-b", "report", "--save"])
+    assert benchmarks.parse_scales(args.scales) == [1_000]
+    assert args.bench == ["report"] and args.save and not args.imports_only
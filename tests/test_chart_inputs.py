@@ -0,0 +1,46 @@
+import json
+
+import pytest
+
+from generate_visualizations import CHARTS
+from market_data import candidate
+from nashville_market_analysis import AnalysisContext
+from synthetic_market import SyntheticMarket
+
+
+@pytest.fixture(scope="module")
+def ctx():
+    return AnalysisContext()
+
+
+@pytest.fixture(scope="module")
+def synthetic():
+    return AnalysisContext(SyntheticMarket(3).store(5_000),
+                           person={**candidate, "asking_salary": 95_000})
+
+
+def _inputs(ctx) -> dict:
+    return {name: inputs_fn(ctx) for name, (_, inputs_fn, _) in CHARTS.items()}
+
+
+def test_inputs_follow_the_analysis(ctx):
+    inputs = _inputs(ctx)
+    gap = inputs["salary_gap"]
+    assert gap["lows"] == [ctx.category_stats[c]["min_low"] // 1000 for c in gap["categories"]]
+    assert gap["asking"] == ctx.candidate["asking_salary"] // 1000
+    assert inputs["skill_rarity"]["scores"] == [s["rarity_score"] for s in ctx.skill_demand[::-1]]
+    assert inputs["rarity_bubble"]["dice_listings"] == [s["listings"] for s in ctx.skill_demand]
+    sweep = inputs["salary_sweep"]
+    assert sweep["asking_k"] == [a / 1000 for a in ctx.salary_sweep["asking"]]
+    assert set(sweep["percentile"]) == set(ctx.salary_sweep["segments"])
+
+
+def test_inputs_change_with_the_data(ctx, synthetic):
+    built_in, other = _inputs(ctx), _inputs(synthetic)
+    assert other["salary_gap"]["asking"] == 95
+    for name in ("salary_gap", "salary_sweep"):
+        assert built_in[name] != other[name]
+
+
+def test_inputs_are_json_serializable(ctx):
+    json.dumps(_inputs(ctx), allow_nan=False)  # chart cache keys hash them as JSON
@@ -0,0 +1,66 @@
+import json
+import os
+
+import pytest
+
+pytest.importorskip("matplotlib")
+
+import generate_visualizations as gv
+from nashville_market_analysis import AnalysisContext
+
+SUBSET = ("salary_gap", "skill_rarity", "salary_sweep")
+
+
+@pytest.fixture
+def visuals(tmp_path, monkeypatch):
+    monkeypatch.setattr(gv, "OUTPUT_DIR", str(tmp_path))
+    monkeypatch.setattr(gv, "CHARTS", {name: gv.CHARTS[name] for name in SUBSET})
+    return tmp_path
+
+
+@pytest.fixture(scope="module")
+def ctx():
+    return AnalysisContext()
+
+
+def _pngs(directory) -> dict:
+    return {p.name: p.read_bytes() for p in sorted(directory.glob("*.png"))}
+
+
+def test_parallel_render_matches_serial(visuals, ctx, tmp_path_factory, monkeypatch):
+    results = gv.render_charts(ctx, jobs=3)
+    assert [name for name, _, _ in results] == list(SUBSET)
+    assert all(seconds is not None for _, _, seconds in results)
+    parallel = _pngs(visuals)
+    assert len(parallel) == len(SUBSET)
+
+    serial_dir = tmp_path_factory.mktemp("serial")
+    monkeypatch.setattr(gv, "OUTPUT_DIR", str(serial_dir))
+    gv.render_charts(ctx, jobs=1)
+    assert _pngs(serial_dir) == parallel
+
+
+def test_unchanged_charts_are_skipped(visuals, ctx):
+    gv.render_charts(ctx, jobs=1)
+    assert all(seconds is None for _, _, seconds in gv.render_charts(ctx, jobs=2))
+    forced = gv.render_charts(ctx, jobs=1, force=True)
+    assert all(seconds is not None for _, _, seconds in forced)
+
+
+def test_modified_output_is_redrawn(visuals, ctx):
+    gv.render_charts(ctx, jobs=1)
+    filename = gv.CHARTS["skill_rarity"][0]
+    (visuals / filename).write_bytes(b"truncated")
+    redrawn = {name for name, _, seconds in gv.render_charts(ctx, jobs=1) if seconds is not None}
+    assert redrawn == {"skill_rarity"}
+    assert (visuals / filename).read_bytes().startswith(b"\x89PNG")
+
+
+def test_removed_chart_is_evicted(visuals, ctx, monkeypatch):
+    gv.render_charts(ctx, jobs=1)
+    gone = gv.CHARTS["salary_sweep"][0]
+    monkeypatch.setattr(gv, "CHARTS", {name: gv.CHARTS[name] for name in SUBSET[:2]})
+    gv.render_charts(ctx, jobs=1)
+    assert not os.path.exists(visuals / gone)
+    manifest = json.loads((visuals / "manifest.json").read_text())
+    assert set(manifest["charts"]) == set(SUBSET[:2])
@@ -0,0 +1,60 @@
+import json
+import subprocess
+import sys
+
+from cli import HERE, _context, build_parser
+
+HEAVY = ("numpy", "listing_store", "term_index", "skill_matrix", "dedup", "group_stats",
+         "market_query", "ranking", "salary_sweep", "order_stats", "matplotlib")
+
+
+def _loaded_after(statement: str) -> set:
+    code = f"import sys; {statement}; print(' '.join(sys.modules))"
+    out = subprocess.run([sys.executable, "-c", code], cwd=HERE, capture_output=True, text=True,
+                         check=True).stdout
+    return set(out.split())
+
+
+def test_analysis_module_imports_lazily():
+    loaded = _loaded_after("import nashville_market_analysis")
+    assert not loaded & set(HEAVY)
+
+
+def test_cli_imports_standard_library_only():
+    loaded = _loaded_after("import cli")
+    assert not loaded & set(HEAVY + ("nashville_market_analysis", "market_data"))
+
+
+def test_parser():
+    args = build_parser().parse_args(["json", "-o", "-"])
+    assert args.output == "-" and args.snapshot is None
+
+
+def test_source_supplies_total_jobs(records):
+    from fake_dice_server import FakeDiceServer
+    from nashville_market_analysis import AnalysisContext, iter_report_lines
+
+    with FakeDiceServer(records, total_jobs=12_345) as server:
+        args = build_parser().parse_args(["json", "--api", server.url])
+        ctx = _context(args)
+    assert len(ctx.store) == len(records)
+    assert ctx.total_jobs == 12_345
+    assert ctx.json_data()["total_dice_tech_jobs"] == 12_345
+    assert "Of 12,345 tech jobs" in "\n".join(iter_report_lines(ctx))
+    assert AnalysisContext(ctx.store).key != ctx.key
+
+
+def test_input_files_and_override(tmp_path, records):
+    path = tmp_path / "postings.jsonl"
+    path.write_text("".join(json.dumps(r) + "\n" for r in records))
+    ctx = _context(build_parser().parse_args(["report", "--input", str(path)]))
+    assert len(ctx.store) == ctx.total_jobs == len(records)
+    ctx = _context(build_parser().parse_args(["report", "--input", str(path), "--total-jobs", "900"]))
+    assert ctx.total_jobs == 900
+
+
+def test_no_source_falls_back_to_constant():
+    from nashville_market_analysis import TOTAL_DICE_TECH_JOBS
+
+    ctx = _context(build_parser().parse_args(["json"]))
+    assert ctx.total_jobs == TOTAL_DICE_TECH_JOBS
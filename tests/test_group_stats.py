@@ -0,0 +1,55 @@
+import pytest
+
+from group_stats import group_salary_stats, salary_summary
+from listing_store import build_listing_store
+from market_data import market_searches
+
+
+@pytest.fixture(scope="module")
+def store():
+    return build_listing_store(market_searches)
+
+
+def test_custom_percentiles_without_quartiles(store):
+    stats = group_salary_stats(store, "category", percentiles=(50, 90))
+    default = group_salary_stats(store, "category")
+    for name, summary in stats.items():
+        assert "p25_low" not in summary and "p75_high" not in summary
+        assert summary["p90_low"] == default[name]["p90_low"]
+        assert summary["iqr_low"] == default[name]["iqr_low"]
+        assert summary["iqr_high"] == default[name]["iqr_high"]
+
+
+def test_salary_summary_custom_percentiles(store):
+    summary = salary_summary(store, percentiles=(10,))
+    assert summary["iqr_low"] == salary_summary(store)["iqr_low"]
+    assert "p10_high" in summary and "p90_high" not in summary
+
+
+def test_one_summary_shape_everywhere(store):
+    from order_stats import salary_percentiles
+    from salary_aggregator import SalaryAggregator
+
+    for percentiles in ((50, 90), (10, 25, 50, 75, 90)):
+        grouped = next(iter(group_salary_stats(store, "category", percentiles=percentiles).values()))
+        exact = {**salary_percentiles(store.salary_low[:5], "low", percentiles),
+                 **salary_percentiles(store.salary_high[:5], "high", percentiles)}
+        assert set(exact) < set(grouped)
+        assert {k for k in grouped if k.startswith(("p", "iqr"))} == {
+            k for k in exact if k.startswith(("p", "iqr"))}
+    agg = SalaryAggregator()
+    agg.add_many(store.salary_low, store.salary_high)
+    assert agg.summary().keys() == salary_summary(store).keys()
+
+
+def test_group_ids_without_int64_headroom(store, monkeypatch):
+    import group_stats
+
+    by = ("category", "company", "is_local")
+    expected_ids, expected_labels = group_stats.group_ids(store, by)
+    expected_stats = group_salary_stats(store, by)
+    monkeypatch.setattr(group_stats, "_MAX_COMBINED_KEY", 1)  # force the tuple fallback
+    ids, labels = group_stats.group_ids(store, by)
+    assert labels == expected_labels
+    assert ids.tolist() == expected_ids.tolist()
+    assert group_salary_stats(store, by) == expected_stats
@@ -0,0 +1,63 @@
+import copy
+
+import pytest
+
+from incremental import IncrementalAnalysis
+from market_data import market_searches
+
+
+@pytest.fixture
+def data():
+    return copy.deepcopy(market_searches)
+
+
+@pytest.fixture
+def synced(tmp_path, data):
+    inc = IncrementalAnalysis(str(tmp_path / "aggregates.json"))
+    inc.sync(data)
+    inc.save()
+    return IncrementalAnalysis.load(inc.path)
+
+
+def _exact(summary: dict) -> dict:
+    """The summary fields that do not depend on sketch compaction."""
+    return {k: summary[k] for k in ("sample_count", "min_low", "max_high", "avg_low", "avg_high")}
+
+
+def test_unchanged_sync_folds_nothing(synced, data):
+    assert synced.sync(data) == {}
+    assert synced.folded == 0
+
+
+def test_appends_fold_only_the_new_postings(synced, data):
+    analyst = data["Data Analyst"]
+    analyst["nashville_local"].append({**analyst["nashville_local"][0], "title": "New Analyst"})
+    analyst["national_salary_samples_annual"] += [("Data Analyst (Remote)", 61_000, 81_000)] * 2
+    assert synced.sync(data) == {"Data Analyst": "+3"}
+    assert synced.folded == 3
+
+    fresh = IncrementalAnalysis(synced.path)
+    fresh.sync(data)
+    for key in ("market_stats", "nashville_stats"):
+        assert _exact(synced.summary()[key]) == _exact(fresh.summary()[key])
+    assert synced.summary()["total_listings_analyzed"] == fresh.summary()["total_listings_analyzed"]
+
+
+def test_changed_last_entry_rebuilds_only_its_category(synced, data):
+    samples = data["Data Engineer"]["national_salary_samples_annual"]
+    label, lo, hi = samples[-1]
+    samples[-1] = (label, lo + 1, hi)
+    assert synced.sync(data) == {"Data Engineer": "rebuilt"}
+    assert synced.folded == sum(len(data["Data Engineer"][s]) for s in
+                                ("nashville_local", "national_salary_samples_annual"))
+
+
+def test_shrunk_and_removed_categories(synced, data):
+    data["Data Scientist"]["nashville_local"].pop()
+    del data["Data Engineer"]
+    assert synced.sync(data) == {"Data Scientist": "rebuilt", "Data Engineer": "removed"}
+    assert "Data Engineer" not in synced.summary()["category_stats"]
+
+
+def test_incompatible_state_starts_over(synced):
+    assert IncrementalAnalysis.load(synced.path, error=0.05).categories == {}
@@ -0,0 +1,85 @@
+import email.utils
+import time
+
+import pytest
+
+from fake_dice_server import FakeDiceServer
+from ingestion import (DEFAULT_CACHE_TTL, MAX_RETRY_DELAY, HttpJobSearchClient, IngestionError,
+                       JobSearchSource, ResponseCache, fetch_market, retry_delay)
+
+
+def test_search_all_pages_in_order(records):
+    with FakeDiceServer(records) as server, HttpJobSearchClient(server.url) as client:
+        total, fetched = client.search_all("Data Analyst", page_size=100)
+    assert total == 250
+    assert [r["title"] for r in fetched] == [f"Analyst {i}" for i in range(250)]
+    assert server.requests == 3
+
+
+def test_fetch_market_loads_every_category(records):
+    with FakeDiceServer(records) as server, HttpJobSearchClient(server.url) as client:
+        store = fetch_market(client, ["Data Analyst", "Data Engineer"], page_size=64)
+    assert len(store) == 290
+    assert store.total_results.tolist() == [250, 40]
+
+
+def test_transient_failures_are_retried(records):
+    with FakeDiceServer(records, fail_every=2) as server, \
+            HttpJobSearchClient(server.url, backoff=0.001) as client:
+        total, fetched = client.search_all("Data Analyst", page_size=50)
+    assert len(fetched) == total == 250
+    assert server.requests >= 9  # 5 pages, every other request answered with 503
+
+
+def test_http_date_retry_after_is_honoured(records):
+    past = email.utils.formatdate(time.time() - 30, usegmt=True)
+    with FakeDiceServer(records, fail_every=2, retry_after=past) as server, \
+            HttpJobSearchClient(server.url, backoff=0.001) as client:
+        assert client.total_jobs() == 290
+
+
+def test_gives_up_after_max_retries(records):
+    with FakeDiceServer(records, fail_every=1) as server, \
+            HttpJobSearchClient(server.url, max_retries=2, backoff=0.001) as client:
+        with pytest.raises(IngestionError, match="3 attempts"):
+            client.total_jobs()
+    assert server.requests == 3
+
+
+def test_retry_delay_forms():
+    assert retry_delay("2", 0.5) == 2.0
+    assert retry_delay(None, 0.5) == 0.5
+    assert retry_delay("soon", 0.5) == 0.5
+    future = email.utils.formatdate(time.time() + 10, usegmt=True)
+    assert 8 <= retry_delay(future, 0.5) <= 10
+    assert retry_delay(email.utils.formatdate(time.time() - 10, usegmt=True), 0.5) == 0.0
+    assert retry_delay("86400", 0.5) == MAX_RETRY_DELAY
+
+
+def test_cached_responses_skip_the_network(records, tmp_path):
+    with FakeDiceServer(records) as server:
+        with HttpJobSearchClient(server.url, cache_dir=str(tmp_path)) as client:
+            first = client.search_all("Data Analyst", page_size=100)
+        sent = server.requests
+        with HttpJobSearchClient(server.url, cache_dir=str(tmp_path)) as client:
+            assert client.search_all("Data Analyst", page_size=100) == first
+            assert client.requests_sent == 0
+        assert server.requests == sent
+
+
+def test_expired_cache_entries_are_refetched(records, tmp_path):
+    with FakeDiceServer(records) as server:
+        with HttpJobSearchClient(server.url, cache_dir=str(tmp_path)) as client:
+            client.total_jobs()
+        with HttpJobSearchClient(server.url, cache_dir=str(tmp_path), cache_ttl=-1) as client:
+            client.total_jobs()
+            assert client.requests_sent == 1
+
+
+def test_response_cache_expires_by_default(tmp_path):
+    assert ResponseCache(str(tmp_path)).ttl == DEFAULT_CACHE_TTL is not None
+
+
+def test_job_search_source_is_abstract():
+    with pytest.raises(TypeError):
+        JobSearchSource()
@@ -0,0 +1,49 @@
+import pytest
+
+from label_parser import LabelParser, ParsedLabel, parse_labels
+
+
+@pytest.mark.parametrize("label,expected", [
+    ("Senior Data Analyst – UnitedHealth (Remote)",
+     ParsedLabel("Senior Data Analyst", "UnitedHealth", "Remote", "", "")),
+    ("Data Analyst - Senior - Acme (Remote)",
+     ParsedLabel("Data Analyst - Senior", "Acme", "Remote", "", "")),
+    ("Analyst – Coca-Cola (Contract)", ParsedLabel("Analyst", "Coca-Cola", "", "Contract", "")),
+    ("Data Engineer — Stefanini", ParsedLabel("Data Engineer", "Stefanini", "", "", "")),
+    ("Python DB Developer – Citi (NYC)", ParsedLabel("Python DB Developer", "Citi", "", "", "NYC")),
+    ("BI Solutions Architect (On-Site CA)",
+     ParsedLabel("BI Solutions Architect", "", "On-Site", "", "CA")),
+    ("Lead ML Engineer (Python)", ParsedLabel("Lead ML Engineer (Python)", "", "", "", "")),
+    ("Lead ML Engineer (Python) – Target (Full-time)",
+     ParsedLabel("Lead ML Engineer (Python)", "Target", "", "Full-time", "")),
+    ("100% Remote Data Engineer – Whiz (C2H)",
+     ParsedLabel("100% Remote Data Engineer", "Whiz", "", "Contract-to-Hire", "")),
+])
+def test_fields(label, expected):
+    assert LabelParser().parse(label) == expected
+
+
+@pytest.mark.parametrize("label,title", [
+    ("Data Analyst – SQL/Python (Remote)", "Data Analyst – SQL/Python"),
+    ("Senior Software Engineer – JS/React/Node.js (Remote)",
+     "Senior Software Engineer – JS/React/Node.js"),
+    ("Data Analyst 5 – Healthcare (Remote)", "Data Analyst 5 – Healthcare"),
+    ("SAP Data Analyst – Governance (Remote)", "SAP Data Analyst – Governance"),
+])
+def test_specialization_stays_in_title(label, title):
+    parsed = LabelParser().parse(label)
+    assert (parsed.title, parsed.company, parsed.workplace) == (title, "", "Remote")
+
+
+def test_company_named_like_a_domain():
+    assert LabelParser().parse("Data Analyst – Vaco Healthcare (Contract)").company == "Vaco Healthcare"
+
+
+def test_batches_are_memoized():
+    parser = LabelParser()
+    labels = ["Data Analyst – Centene (Full-time)", "Data Scientist (Contract)"] * 3
+    columns = parser.parse_many(labels)
+    assert len(parser) == 2
+    assert columns["company"] == ["Centene", ""] * 3
+    assert columns["type"] == ["Full-time", "Contract"] * 3
+    assert parse_labels([]) == {"title": [], "company": [], "workplace": [], "type": [], "location": []}
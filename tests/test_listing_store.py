@@ -0,0 +1,51 @@
+import numpy as np
+
+from listing_store import ListingStoreBuilder, build_listing_store
+from market_data import market_searches
+from nashville_market_analysis import compute_nashville_salary_stats, compute_salary_stats
+
+LOCAL_FIELDS = ("title", "company", "location", "type", "workplace",
+                "salary_annual_low", "salary_annual_high")
+
+
+def test_round_trip_from_market_searches():
+    store = build_listing_store(market_searches)
+    assert list(store.categories.values) == list(market_searches)
+    assert store.total_results.tolist() == [d["total_results"] for d in market_searches.values()]
+    rows = list(store.rows())
+    local = [{k: r[k] for k in LOCAL_FIELDS} for r in rows if r["nashville_local"]]
+    assert local == [{k: job[k] for k in LOCAL_FIELDS}
+                     for data in market_searches.values() for job in data["nashville_local"]]
+    national = [(r["category"], r["salary_annual_low"], r["salary_annual_high"])
+                for r in rows if not r["nashville_local"]]
+    assert national == [(name, lo, hi) for name, data in market_searches.items()
+                        for _, lo, hi in data["national_salary_samples_annual"]]
+
+
+def test_missing_salaries_are_nan_and_dropped():
+    builder = ListingStoreBuilder()
+    cat = builder.add_category("Data Analyst", 3)
+    builder.add(cat, "Analyst", salary_low=50_000, salary_high=70_000)
+    builder.add(cat, "Analyst", company="Acme", workplace="Remote")  # DOE
+    store = builder.build()
+    assert np.isnan(store.salary_low[1]) and np.isnan(store.salary_high[1])
+    assert [a.tolist() for a in store.salaries()] == [[50_000.0], [70_000.0]]
+    assert store.title[0] == store.title[1]  # interned once
+    row = list(store.rows([1]))[0]
+    assert row["salary_annual_low"] is None and row["company"] == "Acme"
+    assert row["workplace"] == "Remote"
+
+
+def test_select_keeps_tables_and_hash_tracks_content():
+    store = build_listing_store(market_searches)
+    local = store.local()
+    assert local.strings is store.strings and local.is_local.all()
+    assert len(local) == sum(len(d["nashville_local"]) for d in market_searches.values())
+    assert build_listing_store(market_searches).content_hash() == store.content_hash()
+    assert local.content_hash() != store.content_hash()
+
+
+def test_stats_accept_dict_or_store():
+    store = build_listing_store(market_searches)
+    assert compute_salary_stats(store) == compute_salary_stats(market_searches)
+    assert compute_nashville_salary_stats(store) == compute_nashville_salary_stats(market_searches)
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from market_query import ALL, MarketQuery, category, company, local, workplace
+from synthetic_market import SyntheticMarket
+
+
+@pytest.fixture(scope="module")
+def store():
+    return SyntheticMarket(11).store(5_000)
+
+
+def test_slices_match_brute_force(store):
+    query = MarketQuery(store)
+    remote = store.workplace == store.workplaces.code("Remote")
+    expected = store.is_local | remote
+    assert np.array_equal(query.mask(local() | workplace("Remote")), expected)
+    assert np.array_equal(query.rows(~local() & workplace("Remote")), np.flatnonzero(~store.is_local & remote))
+    assert query.count(ALL) == len(store)
+
+
+def test_single_value_bitmap_is_read_only(store):
+    query = MarketQuery(store)
+    name = store.strings[int(store.company[0])]
+    bits = query.bitmap(company(name))
+    with pytest.raises(ValueError):
+        bits[:] = 0
+    before = query.count(company(name))
+    query.mask(company(name))[:] = False  # a fresh array each call
+    assert query.count(company(name)) == before > 0
+
+
+def test_cache_bounded_by_bytes(store):
+    budget = 4 * ((len(store) + 7) // 8)
+    query = MarketQuery(store, cache_bytes=budget)
+    for name in store.categories.decode(range(len(store.categories))):
+        query.bitmap(category(name) & local())
+        assert query.cached_bytes <= budget
+    assert query.cached_bytes == sum(size for _, size in query._cache.values())
+
+
+def test_cached_aggregates_are_not_shared(store):
+    query = MarketQuery(store)
+    q = category("Data Analyst") | local()
+    query.summary(q)["sample_count"] = -1
+    next(iter(query.stats(q).values()))["sample_count"] = -1
+    query.top(q, 3)[0]["score"] = -1.0
+    query.top(q, 3).clear()
+    curve = query.curve(q)
+    curve.segments.clear()
+    assert query.summary(q)["sample_count"] > 0
+    assert all(s["sample_count"] >= 0 for s in query.stats(q).values())
+    assert len(query.top(q, 3)) == 3 and query.top(q, 3)[0]["score"] > 0
+    assert query.curve(q).segments
+    with pytest.raises(ValueError):
+        query.curve(q).segments["overall"]["mid"][0] = 0
+    assert query.hits > query.misses
+
+
+def test_popcount_without_bitwise_count(store, monkeypatch):
+    query = MarketQuery(store)
+    expected = query.count(workplace("Remote") | local())
+    monkeypatch.delattr(np, "bitwise_count", raising=False)
+    query.clear_cache()
+    assert query.count(workplace("Remote") | local()) == expected == int(query.mask(
+        workplace("Remote") | local()).sum())
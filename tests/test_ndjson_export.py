@@ -0,0 +1,58 @@
+import gzip
+import json
+
+import pytest
+
+from ndjson_export import NDJSON_VERSION, open_output, write_ndjson
+from nashville_market_analysis import AnalysisContext
+
+
+@pytest.fixture(scope="module")
+def ctx():
+    return AnalysisContext()
+
+
+def _records(raw: bytes) -> list[dict]:
+    return [json.loads(line) for line in raw.decode().splitlines()]
+
+
+def _check(ctx, records: list[dict], counts: dict):
+    kinds = [r["record"] for r in records]
+    assert kinds[0] == "header" and records[0]["version"] == NDJSON_VERSION
+    assert {k: kinds.count(k) for k in counts} == counts
+    postings = [r for r in records if r["record"] == "posting"]
+    assert [p["row"] for p in postings] == list(range(len(ctx.store)))
+    for posting, row in zip(postings, ctx.store.rows()):
+        assert {k: posting[k] for k in row} == row
+    cluster = ctx.duplicates.cluster.tolist()
+    assert [p["duplicate_of"] for p in postings] == [None if c == i else c for i, c in enumerate(cluster)]
+    categories = {r["category"]: r for r in records if r["record"] == "category"}
+    assert categories.keys() == ctx.category_stats.keys()
+
+
+def test_plain_output_in_small_chunks(tmp_path, ctx):
+    path = tmp_path / "export.ndjson"
+    counts = write_ndjson(ctx, str(path), chunk_rows=7)
+    assert counts["posting"] == len(ctx.store) and counts["candidate"] == 1
+    _check(ctx, _records(path.read_bytes()), counts)
+
+
+def test_gzip_output(tmp_path, ctx):
+    path = tmp_path / "export.ndjson.gz"
+    counts = write_ndjson(ctx, str(path), candidates=iter([{"name": "a"}, {"name": "b"}]))
+    records = _records(gzip.decompress(path.read_bytes()))
+    _check(ctx, records, counts)
+    assert [r["name"] for r in records if r["record"] == "candidate"] == ["a", "b"]
+
+
+def test_zstd_output(tmp_path, ctx):
+    zstandard = pytest.importorskip("zstandard")
+    path = tmp_path / "export.ndjson.zst"
+    counts = write_ndjson(ctx, str(path))
+    with zstandard.ZstdDecompressor().stream_reader(open(path, "rb")) as f:
+        _check(ctx, _records(f.read()), counts)
+
+
+def test_unknown_compression(tmp_path):
+    with pytest.raises(ValueError):
+        open_output(str(tmp_path / "export.ndjson"), "lz4")
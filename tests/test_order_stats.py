@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from order_stats import (REPORT_PERCENTILES, median, order_statistics, rank_indices,
+                         salary_percentiles)
+
+
+@pytest.mark.parametrize("n", [1, 2, 7, 100, 1001])
+def test_matches_sorted_index(n):
+    values = np.random.default_rng(n).integers(30_000, 200_000, n).astype(np.float64)
+    qs = [p / 100 for p in REPORT_PERCENTILES] + [0.0, 1.0]
+    expected = np.sort(values)[np.minimum(np.floor(np.array(qs) * n).astype(int), n - 1)]
+    assert order_statistics(values, qs).tolist() == expected.tolist()
+
+
+def test_median_is_upper_middle_and_input_untouched():
+    values = np.array([4.0, 1.0, 3.0, 2.0])
+    assert median(values) == 3.0
+    assert values.tolist() == [4.0, 1.0, 3.0, 2.0]
+
+
+def test_empty_and_clipped_ranks():
+    assert np.isnan(order_statistics([], [0.5])).all()
+    assert rank_indices(0, [0.5]).tolist() == [0]
+    assert rank_indices(10, [0.0, 0.999, 1.0]).tolist() == [0, 9, 9]
+
+
+def test_salary_percentile_fields():
+    fields = salary_percentiles(np.arange(1, 101) * 1000.0, "low")
+    assert fields == {"median_low": 51_000, "p10_low": 11_000, "p25_low": 26_000,
+                      "p75_low": 76_000, "p90_low": 91_000, "iqr_low": 50_000}
+    assert salary_percentiles([], "high")["median_high"] == 0
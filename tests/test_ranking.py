@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from listing_store import ListingStoreBuilder
+from ranking import OpeningRanker, top_k
+
+NAN = np.nan
+SCORES = np.array([5.0, NAN, 9.0, 5.0, 7.0, 9.0, NAN, 1.0])
+
+
+@pytest.mark.parametrize("k", [-3, 0])
+def test_top_k_nonpositive(k):
+    assert top_k(SCORES, k).tolist() == []
+    assert top_k(SCORES, k, rows=[0, 2]).tolist() == []
+
+
+def test_top_k_ties_in_row_order():
+    assert top_k(SCORES, 1).tolist() == [2]
+    assert top_k(SCORES, 3).tolist() == [2, 5, 4]
+    assert top_k(SCORES, 4).tolist() == [2, 5, 4, 0]
+    assert top_k(SCORES, 5).tolist() == [2, 5, 4, 0, 3]
+
+
+def test_top_k_skips_nan_and_caps_at_n():
+    expected = [2, 5, 4, 0, 3, 7]
+    assert top_k(SCORES, 6).tolist() == expected
+    assert top_k(SCORES, 100).tolist() == expected
+    assert top_k(np.full(3, NAN), 2).tolist() == []
+
+
+def test_top_k_rows_subset():
+    assert top_k(SCORES, 2, rows=np.array([0, 1, 3, 7])).tolist() == [0, 3]
+    assert top_k(SCORES, 10, rows=[6, 1]).tolist() == []
+
+
+@pytest.fixture
+def ranker():
+    builder = ListingStoreBuilder()
+    local = builder.add_category("nashville_local")
+    for i, (low, high, workplace) in enumerate([(80, 100, "Remote"), (None, None, "Hybrid"),
+                                                (90, 110, "Hybrid"), (60, 140, "Remote"),
+                                                (50, 70, "On-Site")]):
+        builder.add(local, f"Data Analyst {i}", workplace=workplace,
+                    salary_low=None if low is None else low * 1000,
+                    salary_high=None if high is None else high * 1000, is_local=True)
+    return OpeningRanker(builder.build())
+
+
+@pytest.mark.parametrize("k", [None, -1, 0, 1, 2, 10])
+def test_index_and_partition_agree(ranker, k):
+    for by in ("midpoint", "floor"):
+        for filters in ({}, {"workplace": "Remote"}, {"workplace": ("Hybrid", "On-Site")}):
+            indexed = ranker.top(k, by, **filters)
+            if k is not None:
+                assert indexed.tolist() == ranker.top(k, by, use_index=False, **filters).tolist()
+            assert len(indexed) <= (4 if k is None else max(k, 0))
+
+
+def test_ranker_order_and_records(ranker):
+    assert ranker.top(by="midpoint").tolist() == [2, 3, 0, 4]  # tie 100K: row 2 before 3
+    assert ranker.top(2, "floor", workplace="Remote").tolist() == [0, 3]
+    records = ranker.records(ranker.top(1))
+    assert records[0]["title"] == "Data Analyst 2" and records[0]["score"] == 100_000
@@ -0,0 +1,39 @@
+import re
+
+import pytest
+
+from nashville_market_analysis import AnalysisContext, _report_openings
+from synthetic_market import SyntheticMarket
+
+PAGE = re.compile(r"── Page (\d+) of (\d+) ──")
+ROW = re.compile(r"\$\d+K–\$\d+K$|DOE$")
+
+
+def _pages(lines) -> list[int]:
+    """Number of table rows under each page header."""
+    counts = []
+    for line in lines:
+        if PAGE.search(line):
+            counts.append(0)
+        elif counts and ROW.search(line):
+            counts[-1] += 1
+    return counts
+
+
+@pytest.fixture(scope="module")
+def ctx():
+    return AnalysisContext(SyntheticMarket(7).store(40_000))
+
+
+@pytest.mark.parametrize("page_size,chunk_size", [(5000, 4096), (1000, 4096), (3000, 1024)])
+def test_pages_split_regardless_of_chunk_size(ctx, page_size, chunk_size):
+    lines = list(_report_openings(ctx, page_size=page_size, chunk_size=chunk_size))
+    n = int(re.search(r"(\d+) live positions", "\n".join(lines)).group(1))
+    counts = _pages(lines)
+    assert len(counts) == -(-n // page_size)
+    assert counts[:-1] == [page_size] * (len(counts) - 1)
+    assert sum(counts) == n
+
+
+def test_unpaged_table_has_no_headers(ctx):
+    assert not any(PAGE.search(line) for line in _report_openings(ctx, chunk_size=512))
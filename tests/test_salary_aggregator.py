@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from market_data import market_searches
+from nashville_market_analysis import compute_salary_stats
+from order_stats import REPORT_PERCENTILES, salary_percentiles
+from salary_aggregator import DEFAULT_ERROR, SalaryAggregator, aggregate_postings, iter_postings
+from synthetic_market import SyntheticMarket
+
+
+def _rank_error(exact_sorted: np.ndarray, value: float, q: float) -> float:
+    """Distance between ``q`` and the nearest normalized rank ``value`` holds (ties span a range)."""
+    n = exact_sorted.size
+    lo = np.searchsorted(exact_sorted, value, side="left") / n
+    hi = np.searchsorted(exact_sorted, value, side="right") / n
+    return 0.0 if lo <= q <= hi else min(abs(q - lo), abs(q - hi))
+
+
+@pytest.mark.parametrize("seed", [1, 2])
+def test_kll_percentiles_within_error(seed):
+    store = SyntheticMarket(seed).store(60_000)
+    lows, highs = store.salaries()
+    agg = SalaryAggregator(seed=seed)
+    for start in range(0, len(lows), 7_000):  # streamed in chunks
+        agg.add_many(lows[start:start + 7_000], highs[start:start + 7_000])
+    summary = agg.summary()
+    for side, values in (("low", lows), ("high", highs)):
+        exact = salary_percentiles(values, side)
+        ordered = np.sort(values)
+        for p in REPORT_PERCENTILES:
+            key = f"median_{side}" if p == 50 else f"p{p}_{side}"
+            assert _rank_error(ordered, summary[key], p / 100) <= DEFAULT_ERROR, key
+            # and the value itself is close to the exact one
+            assert abs(summary[key] - exact[key]) <= 0.05 * exact[key]
+
+
+def test_small_input_is_exact():
+    summary = aggregate_postings(iter_postings(market_searches)).summary()["market_stats"]
+    exact = compute_salary_stats(market_searches)
+    for key in ("median_low", "median_high", "p10_low", "p90_high", "sample_count", "min_low"):
+        assert summary[key] == exact[key], key
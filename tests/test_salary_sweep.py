@@ -0,0 +1,38 @@
+import json
+import math
+
+import pytest
+
+from listing_store import ListingStoreBuilder
+from salary_sweep import NASHVILLE, OVERALL, SalaryCurve
+
+
+def _store(local_salary: bool):
+    builder = ListingStoreBuilder()
+    national = builder.add_category("national_salary_samples_annual")
+    local = builder.add_category("nashville_local")
+    builder.add(national, "Data Analyst", salary_low=80_000, salary_high=100_000)
+    builder.add(national, "Data Engineer", salary_low=120_000, salary_high=160_000)
+    if local_salary:
+        builder.add(local, "BI Analyst", salary_low=70_000, salary_high=90_000, is_local=True)
+    else:
+        builder.add(local, "BI Analyst", is_local=True)  # DOE
+    return builder.build()
+
+
+def test_lookup():
+    curve = SalaryCurve.build(_store(local_salary=True))
+    out = curve.lookup(90_000)
+    assert out["percentile"] == pytest.approx(100 * 2 / 3)
+    assert out["share_above"] == pytest.approx(100 * 2 / 3)
+    assert curve.reference_mid[NASHVILLE] == 80_000
+
+
+def test_empty_segment_left_out_of_sweep():
+    curve = SalaryCurve.build(_store(local_salary=False))
+    assert curve.openings(NASHVILLE) == 0
+    assert math.isnan(curve.lookup(60_000, NASHVILLE)["discount_pct"])
+    sweep = curve.sweep([60_000, 100_000])
+    assert NASHVILLE not in sweep["segments"] and "nashville_local" not in sweep["segments"]
+    assert sweep["segments"][OVERALL]["openings"] == 2
+    json.loads(json.dumps(sweep, allow_nan=False))
@@ -0,0 +1,44 @@
+import pytest
+
+from nashville_market_analysis import SKILL_CATEGORIES, AnalysisContext
+
+
+@pytest.fixture(scope="module")
+def ctx():
+    return AnalysisContext()
+
+
+def test_ranking_is_pinned(ctx):
+    ranked = [(s["label"], s["rarity_score"], s["listings"]) for s in ctx.skill_rarity]
+    assert ranked == [
+        ("CompTIA Quad-Stack", 10, 0),
+        ("Revenue Forecasting", 10, 0),
+        ("API Integration", 10, 0),
+        ("JavaScript / Node.js", 6, 105),
+        ("Python (Data/Analytics)", 6, 107),
+        ("Model Context Protocol", 6, 158),
+        ("Power BI / Visualization", 6, 201),
+        ("AI/ML + Data Analytics", 4, 1445),
+    ]
+
+
+def test_every_skill_is_measured(ctx):
+    for s in ctx.skill_rarity:
+        assert s["measured"] == (s["sampled_postings"] > 0)
+        assert s["dice_mentions"].startswith("~") == s["measured"]
+        assert s["salary_ceiling"] == 0 or s["measured"]
+
+
+def test_mcp_counts_its_category(ctx):
+    assert SKILL_CATEGORIES["MCP"] == "MCP / AI Automation"
+    mcp = next(s for s in ctx.skill_rarity if s["requires"] == ["MCP"])
+    assert mcp["sampled_postings"] == ctx.store.category_mask("MCP / AI Automation").sum()
+
+
+def test_combination_counts_union_and_cooccurrence(ctx):
+    matrix = ctx.skill_matrix
+    combo = next(s for s in ctx.skill_rarity if len(s["requires"]) > 1)
+    parts = combo["requires"]
+    assert combo["sampled_postings"] == len(set(matrix.rows(parts[0])) | set(matrix.rows(parts[1])))
+    assert combo["sampled_together"] == matrix.pair(*parts) == len(matrix.rows(*parts))
+    assert combo["listings"] >= max(matrix.estimated_listings(p) for p in parts)
@@ -0,0 +1,63 @@
+import json
+
+import numpy as np
+import pytest
+
+from listing_store import ListingStore, build_listing_store
+from market_data import market_searches
+from nashville_market_analysis import AnalysisContext
+from snapshot import MANIFEST_NAME, Snapshot, SnapshotError, load_snapshot, write_snapshot
+from synthetic_market import SyntheticMarket
+
+
+@pytest.fixture(scope="module")
+def store():
+    return build_listing_store(market_searches)
+
+
+def test_round_trip(tmp_path, store):
+    path = str(tmp_path / "market.snapshot")
+    manifest = write_snapshot(path, store, {"total_dice_tech_jobs": 1234})
+    loaded = load_snapshot(path)
+    assert manifest["rows"] == len(loaded) == len(store)
+    for name in ListingStore.COLUMNS:
+        assert isinstance(getattr(loaded, name), np.memmap)
+        np.testing.assert_array_equal(getattr(loaded, name), getattr(store, name))
+    assert list(loaded.rows()) == list(store.rows())
+    assert loaded.total_results.tolist() == store.total_results.tolist()
+    assert loaded.notes == store.notes
+    assert loaded.content_hash() == store.content_hash()
+    assert Snapshot(path).aggregates() == {"total_dice_tech_jobs": 1234}
+
+
+def test_string_tables_decode_lazily(tmp_path):
+    store = SyntheticMarket(1).store(2_000)
+    path = str(tmp_path / "synthetic.snapshot")
+    write_snapshot(path, store)
+    strings = Snapshot(path).table("strings")
+    code = int(store.title[17])
+    assert strings[code] == store.strings[code]
+    assert "values" not in vars(strings)  # one lookup does not decode the table
+    assert strings.values == store.strings.values
+    assert strings.code(store.strings[code]) == code
+
+
+def test_analysis_matches_in_memory(tmp_path, store):
+    path = str(tmp_path / "market.snapshot")
+    write_snapshot(path, store)
+    assert (AnalysisContext(load_snapshot(path)).market_stats
+            == AnalysisContext(store).market_stats)
+
+
+def test_rewrite_replaces_and_version_is_checked(tmp_path, store):
+    path = tmp_path / "market.snapshot"
+    write_snapshot(str(path), store)
+    write_snapshot(str(path), store.local())
+    assert len(load_snapshot(str(path))) == len(store.local())
+    assert not (tmp_path / "market.snapshot.tmp").exists()
+    manifest = json.loads((path / MANIFEST_NAME).read_text())
+    (path / MANIFEST_NAME).write_text(json.dumps({**manifest, "version": 99}))
+    with pytest.raises(SnapshotError):
+        Snapshot(str(path))
+    with pytest.raises(SnapshotError):
+        Snapshot(str(tmp_path))
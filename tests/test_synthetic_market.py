@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from ingestion import load_files
+from synthetic_market import BLOCK_ROWS, MarketProfile, SyntheticMarket
+
+
+def test_same_seed_same_rows():
+    assert list(SyntheticMarket(7).records(500)) == list(SyntheticMarket(7).records(500))
+    assert list(SyntheticMarket(7).records(500)) != list(SyntheticMarket(8).records(500))
+
+
+def test_rows_do_not_depend_on_total_size():
+    market = SyntheticMarket(7)
+    large = list(market.records(BLOCK_ROWS + 20))
+    assert large[:300] == list(market.records(300))
+    # The second block regenerates on its own.
+    tail = market.block(1)
+    assert [r["salary_unit"] == "hour" for r in large[BLOCK_ROWS:]] == tail["hourly"][:20].tolist()
+
+
+@pytest.mark.parametrize("name", ["postings.jsonl", "postings.csv.gz"])
+def test_written_files_load_like_the_store(tmp_path, name):
+    market = SyntheticMarket(3)
+    path = str(tmp_path / name)
+    market.write(path, 3_000)
+    loaded, direct = load_files([path]), market.store(3_000)
+    # Category codes follow first appearance in the file, so compare names.
+    assert loaded.categories.decode(loaded.category) == direct.categories.decode(direct.category)
+    for column in ("is_local", "workplace", "job_type"):
+        np.testing.assert_array_equal(getattr(loaded, column), getattr(direct, column))
+    np.testing.assert_allclose(loaded.salary_low, direct.salary_low, equal_nan=True)
+    assert loaded.strings.decode(loaded.title) == direct.strings.decode(direct.title)
+
+
+def test_profile_shares():
+    store = SyntheticMarket(11, MarketProfile(missing_salary_share=0.5, nashville_share=0.1)).store(20_000)
+    assert np.isnan(store.salary_low).mean() == pytest.approx(0.5, abs=0.03)
+    assert store.is_local.mean() == pytest.approx(0.1, abs=0.02)
+    assert store.total_results.sum() == len(store)
@@ -0,0 +1,27 @@
+from listing_store import ListingStoreBuilder
+from term_index import TermIndex
+
+
+def _store():
+    builder = ListingStoreBuilder()
+    local = builder.add_category("nashville_local")
+    national = builder.add_category("national_salary_samples_annual")
+    builder.add(local, "Data Analyst", "Jobot (AI Startup)", is_local=True)
+    builder.add(local, "Power Platform Developer", "BI Partners", is_local=True)
+    builder.add(national, "Data Analyst – SQL/Python")  # specialization kept in the title
+    builder.add(national, "Reporting Analyst", "Power BI Consulting")
+    return builder.build()
+
+
+def test_companies_not_indexed():
+    index = TermIndex.build(_store())
+    assert index.phrase_rows("jobot").tolist() == []
+    assert index.phrase_rows("ai").tolist() == []
+    assert index.phrase_rows("power bi").tolist() == []
+    assert index.phrase_rows("consulting").tolist() == []
+
+
+def test_title_specialization_indexed():
+    index = TermIndex.build(_store())
+    assert index.phrase_rows("sql").tolist() == [2]
+    assert index.phrase_rows("analyst").tolist() == [0, 2, 3]